@@ -16,16 +16,235 @@ Environment Variables:
 import argparse
 import json
 import os
+import re
 import sys
-from typing import Dict, List, Any
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from itertools import chain
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
 import requests
 from anthropic import Anthropic
+from requests.adapters import HTTPAdapter
+
+# Reuse the API's atomic file writer for the diff cache
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "api"))
+from cache import atomic_write  # noqa: E402
+
+try:
+    import orjson
+
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+FILES_PER_PAGE = 100
+MAX_PAGE_WORKERS = 8
+
+# Matches a JSON object inside a ``` or ```json markdown fence
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+
+_SYSTEM_PROMPT = """You are an expert code reviewer for the Graph-Native Documentation Platform (GNDP).
+
+GNDP is a FastAPI-based system with:
+- Neo4j graph database for storing documentation atoms and relationships
+- Chroma vector database for semantic search
+- Claude API for natural language query answering
+- React frontend for visualization
+
+Focus on:
+- Data integrity and graph consistency
+- API correctness and error handling
+- Security best practices
+- Performance implications for graph queries
+- Breaking changes to APIs or schemas
+
+Be concise, specific, and actionable in your analysis."""
+
+_REPORT_INSTRUCTIONS = """Please provide:
+
+1. Summary: Brief overview of what this PR does (2-3 sentences)
+
+2. Risk Assessment: Rate the risk level (LOW/MEDIUM/HIGH) and explain why
+   - Consider: scope of changes, critical systems affected, test coverage
+
+3. Key Changes: List the 3-5 most important changes
+   - Focus on what changed and why it matters
+
+4. Potential Impacts: What systems/features might be affected
+   - Consider: dependencies, downstream services, data models
+
+5. Testing Recommendations: What should be tested thoroughly
+   - Specific test scenarios based on the changes
+
+6. Review Focus Areas: What reviewers should pay special attention to
+   - Security concerns, edge cases, performance implications
+
+Format your response as valid JSON with these exact keys:
+{
+  "summary": "...",
+  "risk_level": "LOW|MEDIUM|HIGH",
+  "risk_explanation": "...",
+  "key_changes": ["...", "..."],
+  "potential_impacts": ["...", "..."],
+  "testing_recommendations": ["...", "..."],
+  "review_focus_areas": ["...", "..."]
+}"""
+
+# Static prompt blocks are marked cacheable so only the PR-specific
+# user message is processed from scratch on each run
+_SYSTEM_BLOCKS = [
+    {"type": "text", "text": _SYSTEM_PROMPT},
+    {"type": "text", "text": _REPORT_INSTRUCTIONS, "cache_control": {"type": "ephemeral"}},
+]
+
+_RISK_BADGES = MappingProxyType({
+    "LOW": "🟢 LOW RISK",
+    "MEDIUM": "🟡 MEDIUM RISK",
+    "HIGH": "🔴 HIGH RISK"
+})
+
+# Diff budget sent to Claude, filled with the most relevant files first
+MAX_DIFF_CHARS = 10000
+# Download cap for the raw diff; generous headroom over MAX_DIFF_CHARS for prioritization
+MAX_DIFF_BYTES = 256 * 1024
+_DIFF_FILE_SPLIT_RE = re.compile(r"(?m)^(?=diff --git )")
+_LOCKFILE_NAMES = frozenset({"package-lock.json", "yarn.lock", "pnpm-lock.yaml", "poetry.lock", "Pipfile.lock"})
+
+# Diffs are content-addressed by head commit SHA, so cached files never go stale
+DIFF_CACHE_DIR = Path(os.environ.get("PR_DIFF_CACHE_DIR", Path.home() / ".cache" / "gndp-pr-diffs"))
+
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+
+# Selects only the fields used by analyze_with_claude and format_report
+PR_INFO_QUERY = """
+query($owner: String!, $name: String!, $number: Int!) {
+  repository(owner: $owner, name: $name) {
+    pullRequest(number: $number) {
+      title
+      body
+      headRefOid
+      additions
+      deletions
+      files(first: 100) {
+        pageInfo { hasNextPage }
+        nodes { path additions deletions }
+      }
+    }
+  }
+}
+"""
+
+# File category lookup tables, checked in order: top-level directory,
+# Markdown suffix, then exact configuration filenames
+_CATEGORY_NAMES = ("API", "Tests", "Documentation", "Configuration", "Other")
+_CATEGORY_BY_DIR = {"api": "API", "tests": "Tests", "docs": "Documentation"}
+_CONFIGURATION_FILES = frozenset({".github/workflows", "docker-compose.yml", "Dockerfile", "requirements.txt"})
+
+
+def _classify_file(filename: str) -> str:
+    """Return the report category for a changed file path."""
+    top_dir, sep, _ = filename.partition("/")
+    if sep and top_dir in _CATEGORY_BY_DIR:
+        return _CATEGORY_BY_DIR[top_dir]
+    if filename.endswith(".md"):
+        return "Documentation"
+    if filename in _CONFIGURATION_FILES:
+        return "Configuration"
+    return "Other"
+
+
+def _diff_chunk_priority(chunk: str) -> int:
+    """Score a single-file diff chunk; higher scores are sent to Claude first."""
+    header = chunk.partition("\n")[0]
+    path = header.rpartition(" b/")[2]
+    name = path.rpartition("/")[2]
+    if name in _LOCKFILE_NAMES or name.endswith((".lock", ".min.js", ".map")):
+        return -10
+    top_dir = path.partition("/")[0]
+    if top_dir in ("api", "schemas"):
+        return 10
+    if top_dir == "docs" or name.endswith(".md"):
+        return 1
+    return 5
+
+
+def _prioritize_diff(diff: str, max_chars: int = MAX_DIFF_CHARS) -> str:
+    """Select up to ``max_chars`` of the diff, preferring source over docs and lockfiles.
+
+    Splits the diff into per-file chunks, orders them by priority (stable, so
+    equal-priority files keep diff order) and concatenates until the budget
+    is used; the last chunk that does not fit is truncated.
+    """
+    if len(diff) <= max_chars:
+        return diff
+
+    chunks = [chunk for chunk in _DIFF_FILE_SPLIT_RE.split(diff) if chunk]
+    selected = []
+    remaining = max_chars
+    for chunk in sorted(chunks, key=_diff_chunk_priority, reverse=True):
+        if len(chunk) > remaining:
+            selected.append(chunk[:remaining])
+            break
+        selected.append(chunk)
+        remaining -= len(chunk)
+    return "".join(selected)
+
+
+# (total additions, total deletions, changed filenames by category)
+FileStats = Tuple[int, int, Dict[str, List[str]]]
+
+
+def summarize_files(files: List[Dict[str, Any]]) -> FileStats:
+    """Total additions/deletions and bucket filenames by category in one pass."""
+    total_additions = total_deletions = 0
+    categories: Dict[str, List[str]] = {name: [] for name in _CATEGORY_NAMES}
+    for file in files:
+        total_additions += file['additions']
+        total_deletions += file['deletions']
+        categories[_classify_file(file['filename'])].append(file['filename'])
+    return total_additions, total_deletions, categories
+
+
+def create_github_session(github_token: str) -> requests.Session:
+    """Create a GitHub API session with a connection pool sized for concurrent requests."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+    session.mount("https://", adapter)
+    session.headers.update({
+        "Authorization": f"token {github_token}",
+        "Accept": "application/vnd.github.v3+json"
+    })
+    return session
 
 
 class PRAnalyzer:
     """Analyzes pull requests using Claude API and GitHub API."""
 
-    def __init__(self, repo: str, pr_number: int, github_token: str, anthropic_api_key: str):
+    def __init__(
+        self,
+        repo: str,
+        pr_number: int,
+        github_token: str,
+        anthropic_api_key: str,
+        session: Optional[requests.Session] = None,
+        executor: Optional[ThreadPoolExecutor] = None,
+        head_sha: Optional[str] = None,
+    ):
+        """Initialize analyzer for a single PR.
+
+        Args:
+            session: Optional GitHub session to share pooled connections across analyzers
+            executor: Optional executor; when given, run() submits the comment post
+                to it and returns without waiting (see ``comment_future``)
+            head_sha: Optional PR head commit SHA, known up front in CI; lets the
+                diff cache be checked without waiting for the PR details
+        """
         self.repo = repo
         self.pr_number = pr_number
         self.github_token = github_token
@@ -34,6 +253,11 @@ class PRAnalyzer:
             "Authorization": f"token {github_token}",
             "Accept": "application/vnd.github.v3+json"
         }
+        # Shared session so GitHub requests reuse pooled TCP/TLS connections
+        self.session = session or create_github_session(github_token)
+        self.executor = executor
+        self.head_sha = head_sha
+        self.comment_future: Optional[Future] = None
 
         self.anthropic_client = Anthropic(api_key=anthropic_api_key)
         self.model = "claude-sonnet-4-20250514"
@@ -41,27 +265,124 @@ class PRAnalyzer:
     def get_pr_details(self) -> Dict[str, Any]:
         """Fetch PR details from GitHub API."""
         url = f"{self.github_api_base}/pulls/{self.pr_number}"
-        response = requests.get(url, headers=self.headers)
+        response = self.session.get(url)
         response.raise_for_status()
         return response.json()
 
     def get_pr_files(self) -> List[Dict[str, Any]]:
-        """Fetch list of changed files in the PR."""
+        """Fetch list of changed files in the PR.
+
+        Fetches the first page, reads the last page number from the Link
+        header, then fetches the remaining pages in parallel.
+        """
         url = f"{self.github_api_base}/pulls/{self.pr_number}/files"
-        response = requests.get(url, headers=self.headers)
+        response = self.session.get(url, params={"per_page": FILES_PER_PAGE, "page": 1})
         response.raise_for_status()
-        return response.json()
+        first_page = response.json()
+
+        last_url = response.links.get("last", {}).get("url")
+        if not last_url:
+            return first_page
+        last_page = int(parse_qs(urlparse(last_url).query)["page"][0])
+
+        def fetch_page(page: int) -> List[Dict[str, Any]]:
+            page_response = self.session.get(url, params={"per_page": FILES_PER_PAGE, "page": page})
+            page_response.raise_for_status()
+            return page_response.json()
+
+        # Cap workers to stay inside GitHub's secondary rate limits
+        with ThreadPoolExecutor(max_workers=MAX_PAGE_WORKERS) as executor:
+            remaining_pages = executor.map(fetch_page, range(2, last_page + 1))
+            return list(chain(first_page, *remaining_pages))
+
+    def _graphql(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a GitHub GraphQL query and return its data payload."""
+        response = self.session.post(GITHUB_GRAPHQL_URL, json={"query": query, "variables": variables})
+        response.raise_for_status()
+        payload = response.json()
+        if payload.get("errors"):
+            raise RuntimeError(f"GitHub GraphQL error: {payload['errors']}")
+        return payload["data"]
+
+    def get_pr_info(self) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """Fetch PR details and changed files with a single GraphQL query.
+
+        Files are returned in the same shape as the REST API. PRs with more
+        than 100 files fall back to the paginated REST file listing.
+        """
+        owner, name = self.repo.split("/", 1)
+        data = self._graphql(PR_INFO_QUERY, {"owner": owner, "name": name, "number": self.pr_number})
+        pr = data["repository"]["pullRequest"]
+
+        pr_details = {
+            "title": pr["title"],
+            "body": pr["body"] or None,
+            "head": {"sha": pr["headRefOid"]},
+            "additions": pr["additions"],
+            "deletions": pr["deletions"],
+        }
+
+        if pr["files"]["pageInfo"]["hasNextPage"]:
+            return pr_details, self.get_pr_files()
+
+        files = [
+            {"filename": node["path"], "additions": node["additions"], "deletions": node["deletions"]}
+            for node in pr["files"]["nodes"]
+        ]
+        return pr_details, files
 
     def get_pr_diff(self) -> str:
-        """Fetch the full diff for the PR."""
+        """Fetch the PR diff, streamed and capped at MAX_DIFF_BYTES.
+
+        Only a small slice is sent to Claude, so huge diffs are not loaded
+        into memory in full.
+        """
         url = f"{self.github_api_base}/pulls/{self.pr_number}"
-        headers = {**self.headers, "Accept": "application/vnd.github.v3.diff"}
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        return response.text
+        chunks = []
+        size = 0
+        with self.session.get(url, headers={"Accept": "application/vnd.github.v3.diff"}, stream=True) as response:
+            response.raise_for_status()
+            for chunk in response.iter_content(chunk_size=65536):
+                chunks.append(chunk)
+                size += len(chunk)
+                if size >= MAX_DIFF_BYTES:
+                    break
+        # The cap may split a multi-byte character; replace rather than fail
+        return b"".join(chunks)[:MAX_DIFF_BYTES].decode("utf-8", errors="replace")
+
+    def get_cached_pr_diff(self, head_sha: str) -> Optional[str]:
+        """Return the diff cached for a head commit SHA, if any."""
+        cache_file = DIFF_CACHE_DIR / f"{head_sha}.diff"
+        try:
+            return cache_file.read_text(encoding="utf-8")
+        except OSError:
+            return None
 
-    def analyze_with_claude(self, pr_details: Dict, files: List[Dict], diff: str) -> Dict[str, Any]:
-        """Use Claude to analyze the PR changes."""
+    def cache_pr_diff(self, head_sha: str, diff: str) -> None:
+        """Store a diff keyed by head commit SHA (best effort)."""
+        try:
+            atomic_write(str(DIFF_CACHE_DIR / f"{head_sha}.diff"), diff)
+        except OSError as e:
+            print(f"Warning: could not cache diff: {e}")
+
+    def get_pr_diff_for_sha(self, head_sha: str) -> str:
+        """Fetch the diff for a known head SHA, using the on-disk cache."""
+        diff = self.get_cached_pr_diff(head_sha)
+        if diff is None:
+            diff = self.get_pr_diff()
+            self.cache_pr_diff(head_sha, diff)
+        else:
+            print(f"Using cached diff for {head_sha[:12]}")
+        return diff
+
+    def analyze_with_claude(
+        self, pr_details: Dict, files: List[Dict], diff: str, file_stats: Optional[FileStats] = None
+    ) -> Dict[str, Any]:
+        """Use Claude to analyze the PR changes.
+
+        ``file_stats`` may be passed in from summarize_files(); it is only
+        needed to build the fallback analysis.
+        """
 
         # Build analysis prompt
         file_summary = "\n".join([
@@ -77,84 +398,38 @@ PR Description: {pr_details.get('body', 'No description provided')}
 Changed Files ({len(files)} total):
 {file_summary}
 
-Diff Preview (first 10000 chars):
-{diff[:10000]}
-
-Please provide:
-
-1. Summary: Brief overview of what this PR does (2-3 sentences)
-
-2. Risk Assessment: Rate the risk level (LOW/MEDIUM/HIGH) and explain why
-   - Consider: scope of changes, critical systems affected, test coverage
-
-3. Key Changes: List the 3-5 most important changes
-   - Focus on what changed and why it matters
-
-4. Potential Impacts: What systems/features might be affected
-   - Consider: dependencies, downstream services, data models
-
-5. Testing Recommendations: What should be tested thoroughly
-   - Specific test scenarios based on the changes
-
-6. Review Focus Areas: What reviewers should pay special attention to
-   - Security concerns, edge cases, performance implications
-
-Format your response as valid JSON with these exact keys:
-{{
-  "summary": "...",
-  "risk_level": "LOW|MEDIUM|HIGH",
-  "risk_explanation": "...",
-  "key_changes": ["...", "..."],
-  "potential_impacts": ["...", "..."],
-  "testing_recommendations": ["...", "..."],
-  "review_focus_areas": ["...", "..."]
-}}
+Diff Preview (up to {MAX_DIFF_CHARS} chars, most relevant files first):
+{_prioritize_diff(diff)}
 """
 
-        system_prompt = """You are an expert code reviewer for the Graph-Native Documentation Platform (GNDP).
-
-GNDP is a FastAPI-based system with:
-- Neo4j graph database for storing documentation atoms and relationships
-- Chroma vector database for semantic search
-- Claude API for natural language query answering
-- React frontend for visualization
-
-Focus on:
-- Data integrity and graph consistency
-- API correctness and error handling
-- Security best practices
-- Performance implications for graph queries
-- Breaking changes to APIs or schemas
-
-Be concise, specific, and actionable in your analysis."""
-
         try:
-            message = self.anthropic_client.messages.create(
+            # Stream the response so CI logs show progress while Claude generates
+            chunks = []
+            with self.anthropic_client.messages.stream(
                 model=self.model,
                 max_tokens=2048,
-                system=system_prompt,
+                system=_SYSTEM_BLOCKS,
                 messages=[{"role": "user", "content": prompt}]
-            )
+            ) as stream:
+                for text in stream.text_stream:
+                    chunks.append(text)
+                    print(text, end="", flush=True)
+                message = stream.get_final_message()
+            print()
 
-            response_text = message.content[0].text
+            response_text = "".join(chunks)
 
             # Extract JSON from response (handle markdown code blocks)
-            if "```json" in response_text:
-                json_start = response_text.find("```json") + 7
-                json_end = response_text.find("```", json_start)
-                response_text = response_text[json_start:json_end].strip()
-            elif "```" in response_text:
-                json_start = response_text.find("```") + 3
-                json_end = response_text.find("```", json_start)
-                response_text = response_text[json_start:json_end].strip()
-
-            analysis = json.loads(response_text)
+            match = _JSON_FENCE_RE.search(response_text)
+            analysis = json_loads(match.group(1) if match else response_text)
 
             # Add token usage
             analysis["tokens_used"] = {
                 "input": message.usage.input_tokens,
                 "output": message.usage.output_tokens,
-                "total": message.usage.input_tokens + message.usage.output_tokens
+                "total": message.usage.input_tokens + message.usage.output_tokens,
+                "cache_creation_input": getattr(message.usage, "cache_creation_input_tokens", None) or 0,
+                "cache_read_input": getattr(message.usage, "cache_read_input_tokens", None) or 0
             }
 
             return analysis
@@ -162,8 +437,9 @@ Be concise, specific, and actionable in your analysis."""
         except Exception as e:
             print(f"Error during Claude analysis: {e}")
             # Fallback to basic analysis
+            total_additions, total_deletions, _ = file_stats or summarize_files(files)
             return {
-                "summary": f"PR updates {len(files)} files with {sum(f['additions'] for f in files)} additions and {sum(f['deletions'] for f in files)} deletions.",
+                "summary": f"PR updates {len(files)} files with {total_additions} additions and {total_deletions} deletions.",
                 "risk_level": "MEDIUM",
                 "risk_explanation": "Automated analysis unavailable. Manual review recommended.",
                 "key_changes": [f['filename'] for f in files[:5]],
@@ -173,111 +449,76 @@ Be concise, specific, and actionable in your analysis."""
                 "error": str(e)
             }
 
-    def format_report(self, pr_details: Dict, files: List[Dict], analysis: Dict) -> str:
-        """Format the analysis into a GitHub comment."""
+    def format_report(
+        self, pr_details: Dict, files: List[Dict], analysis: Dict, file_stats: Optional[FileStats] = None
+    ) -> str:
+        """Format the analysis into a GitHub comment.
 
-        # Risk badge
-        risk_badges = {
-            "LOW": "🟢 LOW RISK",
-            "MEDIUM": "🟡 MEDIUM RISK",
-            "HIGH": "🔴 HIGH RISK"
-        }
-        risk_badge = risk_badges.get(analysis['risk_level'], "⚪ UNKNOWN RISK")
-
-        # File categories
-        file_categories = {
-            "API": [],
-            "Tests": [],
-            "Documentation": [],
-            "Configuration": [],
-            "Other": []
-        }
-
-        for file in files:
-            filename = file['filename']
-            if filename.startswith('api/'):
-                file_categories["API"].append(filename)
-            elif filename.startswith('tests/'):
-                file_categories["Tests"].append(filename)
-            elif filename.endswith('.md') or filename.startswith('docs/'):
-                file_categories["Documentation"].append(filename)
-            elif filename in ['.github/workflows', 'docker-compose.yml', 'Dockerfile', 'requirements.txt']:
-                file_categories["Configuration"].append(filename)
-            else:
-                file_categories["Other"].append(filename)
-
-        # Build report
-        report = f"""## Pull Request Analysis Report
-
-### Summary
-{analysis['summary']}
-
-### Risk Assessment
-**Risk Level:** {risk_badge}
-
-{analysis['risk_explanation']}
-
-### Key Changes
-"""
-        for i, change in enumerate(analysis['key_changes'], 1):
-            report += f"{i}. {change}\n"
-
-        report += f"""
-### Potential Impacts
-"""
-        for impact in analysis['potential_impacts']:
-            report += f"- {impact}\n"
-
-        report += f"""
-### Testing Recommendations
-"""
-        for rec in analysis['testing_recommendations']:
-            report += f"- {rec}\n"
+        ``file_stats`` may be passed in from summarize_files() to avoid
+        another pass over ``files``.
+        """
 
-        report += f"""
-### Review Focus Areas
-"""
-        for area in analysis['review_focus_areas']:
-            report += f"- {area}\n"
-
-        report += f"""
----
-
-### Files Changed ({len(files)} total)
-"""
+        # Risk badge
+        risk_badge = _RISK_BADGES.get(analysis['risk_level'], "⚪ UNKNOWN RISK")
+
+        # File categories and stats
+        total_additions, total_deletions, file_categories = file_stats or summarize_files(files)
+
+        # Build report as a list of lines, joined once at the end
+        lines = [
+            "## Pull Request Analysis Report",
+            "",
+            "### Summary",
+            analysis['summary'],
+            "",
+            "### Risk Assessment",
+            f"**Risk Level:** {risk_badge}",
+            "",
+            analysis['risk_explanation'],
+            "",
+            "### Key Changes",
+        ]
+        lines.extend(f"{i}. {change}" for i, change in enumerate(analysis['key_changes'], 1))
+
+        lines.extend(["", "### Potential Impacts"])
+        lines.extend(f"- {impact}" for impact in analysis['potential_impacts'])
+
+        lines.extend(["", "### Testing Recommendations"])
+        lines.extend(f"- {rec}" for rec in analysis['testing_recommendations'])
+
+        lines.extend(["", "### Review Focus Areas"])
+        lines.extend(f"- {area}" for area in analysis['review_focus_areas'])
+
+        lines.extend(["", "---", "", f"### Files Changed ({len(files)} total)"])
 
         for category, category_files in file_categories.items():
             if category_files:
-                report += f"\n**{category}** ({len(category_files)} files)\n"
-                for file in category_files[:10]:  # Limit to 10 per category
-                    report += f"- `{file}`\n"
+                lines.extend(["", f"**{category}** ({len(category_files)} files)"])
+                lines.extend(f"- `{file}`" for file in category_files[:10])  # Limit to 10 per category
                 if len(category_files) > 10:
-                    report += f"- ... and {len(category_files) - 10} more\n"
-
-        # Stats
-        total_additions = sum(f['additions'] for f in files)
-        total_deletions = sum(f['deletions'] for f in files)
-
-        report += f"""
----
-
-### Statistics
-- **Files changed:** {len(files)}
-- **Lines added:** +{total_additions}
-- **Lines deleted:** -{total_deletions}
-- **Net change:** {total_additions - total_deletions:+d}
-"""
+                    lines.append(f"- ... and {len(category_files) - 10} more")
+
+        lines.extend([
+            "",
+            "---",
+            "",
+            "### Statistics",
+            f"- **Files changed:** {len(files)}",
+            f"- **Lines added:** +{total_additions}",
+            f"- **Lines deleted:** -{total_deletions}",
+            f"- **Net change:** {total_additions - total_deletions:+d}",
+        ])
 
         if "tokens_used" in analysis:
-            report += f"\n*Analysis powered by Claude Sonnet 4.5 ({analysis['tokens_used']['total']} tokens)*\n"
+            lines.extend(["", f"*Analysis powered by Claude Sonnet 4.5 ({analysis['tokens_used']['total']} tokens)*"])
 
-        return report
+        return "\n".join(lines) + "\n"
 
     def post_comment(self, comment: str):
         """Post the analysis report as a PR comment."""
         url = f"{self.github_api_base}/issues/{self.pr_number}/comments"
-        data = {"body": comment}
-        response = requests.post(url, headers=self.headers, json=data)
+        data = json_dumps({"body": comment})
+        response = self.session.post(url, data=data, headers={"Content-Type": "application/json"})
         response.raise_for_status()
         return response.json()
 
@@ -285,24 +526,40 @@ Be concise, specific, and actionable in your analysis."""
         """Run the full analysis and post report."""
         print(f"Analyzing PR #{self.pr_number} in {self.repo}...")
 
-        # Fetch PR data
-        pr_details = self.get_pr_details()
-        print(f"PR Title: {pr_details['title']}")
+        # Fetch PR data concurrently. GraphQL returns details and files in
+        # one round-trip; the raw diff is only available over REST.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            info_future = executor.submit(self.get_pr_info)
+            if self.head_sha:
+                diff_future = executor.submit(self.get_pr_diff_for_sha, self.head_sha)
+            else:
+                diff_future = executor.submit(self.get_pr_diff)
 
-        files = self.get_pr_files()
-        print(f"Files changed: {len(files)}")
+            pr_details, files = info_future.result()
+            diff = diff_future.result()
 
-        diff = self.get_pr_diff()
+        if not self.head_sha:
+            # Cache for reruns that know the SHA up front
+            self.cache_pr_diff(pr_details["head"]["sha"], diff)
+
+        print(f"PR Title: {pr_details['title']}")
+        print(f"Files changed: {len(files)}")
         print(f"Diff size: {len(diff)} characters")
 
         # Analyze with Claude
         print("Running Claude analysis...")
-        analysis = self.analyze_with_claude(pr_details, files, diff)
+        file_stats = summarize_files(files)
+        analysis = self.analyze_with_claude(pr_details, files, diff, file_stats)
 
         # Format report
-        report = self.format_report(pr_details, files, analysis)
+        report = self.format_report(pr_details, files, analysis, file_stats)
+
+        # Post comment (in the background when an executor was provided)
+        if self.executor is not None:
+            print("Queueing report post...")
+            self.comment_future = self.executor.submit(self.post_comment, report)
+            return analysis
 
-        # Post comment
         print("Posting report to PR...")
         comment = self.post_comment(report)
         print(f"Comment posted: {comment['html_url']}")
@@ -311,11 +568,12 @@ Be concise, specific, and actionable in your analysis."""
 
 
 def main():
-    parser = argparse.ArgumentParser(description="Analyze and report on a GitHub pull request")
-    parser.add_argument("--pr-number", type=int, required=True, help="Pull request number")
+    parser = argparse.ArgumentParser(description="Analyze and report on GitHub pull requests")
+    parser.add_argument("--pr-number", type=int, nargs="+", required=True, help="Pull request number(s)")
     parser.add_argument("--repo", type=str, required=True, help="Repository in format 'owner/repo'")
     parser.add_argument("--github-token", type=str, help="GitHub API token (or set GITHUB_TOKEN env var)")
     parser.add_argument("--anthropic-api-key", type=str, help="Anthropic API key (or set ANTHROPIC_API_KEY env var)")
+    parser.add_argument("--head-sha", type=str, help="PR head commit SHA for diff caching (single PR only)")
 
     args = parser.parse_args()
 
@@ -331,24 +589,44 @@ def main():
         print("Error: Anthropic API key required (--anthropic-api-key or ANTHROPIC_API_KEY env var)")
         sys.exit(1)
 
-    # Run analysis
-    analyzer = PRAnalyzer(
-        repo=args.repo,
-        pr_number=args.pr_number,
-        github_token=github_token,
-        anthropic_api_key=anthropic_api_key
-    )
-
-    try:
-        analysis = analyzer.run()
-        print("\nAnalysis complete!")
-        print(f"Risk Level: {analysis['risk_level']}")
-        sys.exit(0)
-    except Exception as e:
-        print(f"Error: {e}")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
+    # Run analysis. With several PRs, comment posts run in the background so
+    # the next PR's fetches start immediately; all posts are awaited at the end.
+    session = create_github_session(github_token)
+    failed = False
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        pending: Dict[Future, int] = {}
+        for pr_number in args.pr_number:
+            analyzer = PRAnalyzer(
+                repo=args.repo,
+                pr_number=pr_number,
+                github_token=github_token,
+                anthropic_api_key=anthropic_api_key,
+                session=session,
+                executor=executor if len(args.pr_number) > 1 else None,
+                head_sha=args.head_sha if len(args.pr_number) == 1 else None,
+            )
+
+            try:
+                analysis = analyzer.run()
+                print("\nAnalysis complete!")
+                print(f"Risk Level: {analysis['risk_level']}")
+                if analyzer.comment_future is not None:
+                    pending[analyzer.comment_future] = pr_number
+            except Exception as e:
+                failed = True
+                print(f"Error: {e}")
+                import traceback
+                traceback.print_exc()
+
+        for future in as_completed(pending):
+            try:
+                print(f"Comment posted for PR #{pending[future]}: {future.result()['html_url']}")
+            except Exception as e:
+                failed = True
+                print(f"Error posting comment for PR #{pending[future]}: {e}")
+
+    sys.exit(1 if failed else 0)
 
 
 if __name__ == "__main__":
@@ -6,9 +6,45 @@ Provides caching for expensive file loading operations with automatic expiration
 
 import hashlib
 import json
+import os
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from functools import wraps
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+def _dumps_sorted(value: Any) -> bytes:
+    """Serialize to JSON bytes with sorted keys, using orjson when available."""
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_SORT_KEYS, default=str)
+        except TypeError:
+            # e.g. dicts with non-string keys; fall back to the stdlib encoder
+            pass
+    return json.dumps(value, sort_keys=True, default=str).encode()
+
+
+def _key_name(key: Hashable) -> str:
+    """Return the string part of a cache key that prefixes are matched against."""
+    if isinstance(key, tuple):
+        key = key[0] if key else ""
+    return key if isinstance(key, str) else ""
 
 
 class Cache:
@@ -24,34 +60,56 @@ class Cache:
             return result
     """
 
-    def __init__(self, ttl_seconds: int = 3600):
+    def __init__(self, ttl_seconds: int = 3600, max_entries: int = 10_000, sweep_interval: int = 100):
         """
         Initialize cache with TTL.
 
         Args:
             ttl_seconds: Time-to-live in seconds (default: 3600 = 1 hour)
+            max_entries: Maximum entries kept before least-recently-used eviction
+            sweep_interval: Number of set() calls between expired-entry sweeps
         """
-        self._cache: Dict[str, Dict[str, Any]] = {}
+        self._cache: "OrderedDict[Hashable, Dict[str, Any]]" = OrderedDict()
         self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._sweep_interval = sweep_interval
+        self._sets_since_sweep = 0
+        self._lock = threading.RLock()
 
-    def _generate_key(self, func_name: str, args: tuple, kwargs: dict) -> str:
+    def _generate_key(self, func_name: str, args: tuple, kwargs: dict) -> tuple:
         """
         Generate cache key from function name and arguments.
 
+        Hashable arguments are keyed by the ``(func_name, args, kwargs)`` tuple
+        itself, so lookups compare arguments for equality and colliding hashes
+        cannot return another call's result. Unhashable arguments fall back to
+        a BLAKE2b digest of their JSON representation (encoded with orjson
+        when installed).
+
         Args:
             func_name: Name of the cached function
             args: Positional arguments
             kwargs: Keyword arguments
 
         Returns:
-            Hash-based cache key
+            Cache key tuple whose first element is ``func_name``
         """
-        # Create deterministic representation of arguments
-        key_data = {"func": func_name, "args": args, "kwargs": sorted(kwargs.items())}
-        key_str = json.dumps(key_data, sort_keys=True, default=str)
-        return hashlib.sha256(key_str.encode()).hexdigest()
+        sorted_kwargs = tuple(sorted(kwargs.items()))
+        key = (func_name, args, sorted_kwargs)
+        try:
+            hash(key)
+            return key
+        except TypeError:
+            pass
+
+        # Create deterministic representation of unhashable arguments
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(func_name.encode())
+        hasher.update(_dumps_sorted(args))
+        hasher.update(_dumps_sorted(sorted_kwargs))
+        return (func_name, hasher.hexdigest())
 
-    def get(self, key: str) -> Optional[Any]:
+    def get(self, key: Hashable) -> Optional[Any]:
         """
         Get value from cache if not expired.
 
@@ -61,43 +119,83 @@ class Cache:
         Returns:
             Cached value if found and not expired, None otherwise
         """
-        if key not in self._cache:
-            return None
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
 
-        entry = self._cache[key]
-        expires_at = entry["expires_at"]
-
-        # Check if expired
-        if datetime.now() > expires_at:
-            del self._cache[key]
-            return None
+            # Check if expired
+            if time.monotonic() > entry["expires_at"]:
+                del self._cache[key]
+                return None
 
-        return entry["value"]
+            self._cache.move_to_end(key)
+            return entry["value"]
 
-    def set(self, key: str, value: Any) -> None:
+    def set(self, key: Hashable, value: Any) -> None:
         """
         Store value in cache with TTL.
 
+        Evicts least-recently-used entries beyond ``max_entries`` and
+        periodically sweeps expired entries so they do not accumulate.
+
         Args:
             key: Cache key
             value: Value to cache
         """
-        expires_at = datetime.now() + timedelta(seconds=self._ttl_seconds)
-        self._cache[key] = {"value": value, "expires_at": expires_at, "created_at": datetime.now()}
+        expires_at = time.monotonic() + self._ttl_seconds
+        with self._lock:
+            self._cache[key] = {"value": value, "expires_at": expires_at, "created_at": datetime.now()}
+            self._cache.move_to_end(key)
+
+            while len(self._cache) > self._max_entries:
+                self._cache.popitem(last=False)
+
+            self._sets_since_sweep += 1
+            if self._sets_since_sweep >= self._sweep_interval:
+                self._sweep_expired()
+
+    def _sweep_expired(self) -> None:
+        """Remove all expired entries. Caller must hold the lock."""
+        now = time.monotonic()
+        expired = [key for key, entry in self._cache.items() if entry["expires_at"] < now]
+        for key in expired:
+            del self._cache[key]
+        self._sets_since_sweep = 0
 
-    def invalidate(self, key: str) -> None:
+    def invalidate(self, key: Hashable) -> None:
         """
         Remove specific key from cache.
 
         Args:
             key: Cache key to invalidate
         """
-        if key in self._cache:
-            del self._cache[key]
+        with self._lock:
+            self._cache.pop(key, None)
+
+    def invalidate_prefix(self, prefix: str) -> int:
+        """
+        Remove every key starting with ``prefix``.
+
+        Tuple keys (such as memoize keys) match on their first element.
+
+        Args:
+            prefix: Key prefix to invalidate
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            keys = [key for key in self._cache if _key_name(key).startswith(prefix)]
+            for key in keys:
+                del self._cache[key]
+        return len(keys)
 
     def clear(self) -> None:
         """Clear all cache entries."""
-        self._cache.clear()
+        with self._lock:
+            self._cache.clear()
+            self._sets_since_sweep = 0
 
     def stats(self) -> Dict[str, Any]:
         """
@@ -106,23 +204,34 @@ class Cache:
         Returns:
             Dictionary with cache size and entry count
         """
+        ttl = timedelta(seconds=self._ttl_seconds)
+        with self._lock:
+            entries = list(self._cache.items())
+
         return {
-            "entry_count": len(self._cache),
+            "entry_count": len(entries),
             "ttl_seconds": self._ttl_seconds,
+            "max_entries": self._max_entries,
             "entries": [
                 {
-                    "key": key[:16] + "...",  # Truncate for readability
+                    "key": str(key)[:16] + "...",  # Truncate for readability
                     "created_at": entry["created_at"].isoformat(),
-                    "expires_at": entry["expires_at"].isoformat(),
+                    "expires_at": (entry["created_at"] + ttl).isoformat(),
                 }
-                for key, entry in self._cache.items()
+                for key, entry in entries
             ],
         }
 
-    def memoize(self):
+    def memoize(self, key_fn: Optional[Callable[..., Hashable]] = None):
         """
         Decorator to cache function results.
 
+        Args:
+            key_fn: Optional function receiving the call's arguments and
+                returning a small hashable key. Use it when arguments are
+                large (e.g. RAG context lists) so the cache key is not derived
+                from the full payload.
+
         Example:
             cache = Cache(ttl_seconds=3600)
 
@@ -130,13 +239,20 @@ class Cache:
             def load_atoms():
                 # Expensive operation
                 return atoms
+
+            @cache.memoize(key_fn=lambda query, atoms, mode="entity", **_: (query, mode, tuple(a["id"] for a in atoms)))
+            def answer(query, atoms, mode="entity"):
+                ...
         """
 
         def decorator(func: Callable) -> Callable:
             @wraps(func)
             def wrapper(*args, **kwargs):
                 # Generate cache key
-                cache_key = self._generate_key(func.__name__, args, kwargs)
+                if key_fn is None:
+                    cache_key = self._generate_key(func.__name__, args, kwargs)
+                else:
+                    cache_key = (func.__name__, key_fn(*args, **kwargs))
 
                 # Check cache
                 cached_value = self.get(cache_key)
@@ -157,9 +273,162 @@ class Cache:
         return decorator
 
 
+class SemanticCache:
+    """
+    Embedding-similarity cache layered on top of the exact-match Cache.
+
+    Lookups first try an exact match on the query text, then compare the
+    query embedding against stored embeddings and return the value of the
+    most similar query when cosine similarity exceeds the threshold. Entries
+    are partitioned by namespace so e.g. different RAG modes never share
+    answers.
+
+    Example:
+        model = SentenceTransformer("all-MiniLM-L6-v2")
+        cache = SemanticCache(embed_fn=model.encode, threshold=0.85)
+
+        answer, embedding = cache.lookup("what is X", namespace="entity")
+        if answer is None:
+            answer = generate_answer("what is X")
+            cache.set("what is X", answer, namespace="entity", embedding=embedding)
+    """
+
+    def __init__(
+        self,
+        embed_fn: Callable[[str], Sequence[float]],
+        threshold: float = 0.85,
+        ttl_seconds: int = 3600,
+        max_entries: int = 1000,
+    ):
+        """
+        Initialize semantic cache.
+
+        Args:
+            embed_fn: Function mapping query text to an embedding vector
+            threshold: Minimum cosine similarity for a semantic hit
+            ttl_seconds: Time-to-live in seconds for cached values
+            max_entries: Maximum embeddings kept per namespace (oldest dropped first)
+        """
+        if not HAS_NUMPY:
+            raise ImportError("numpy not installed. Run: pip install numpy")
+
+        self._embed_fn = embed_fn
+        self._threshold = threshold
+        self._max_entries = max_entries
+        self._values = Cache(ttl_seconds=ttl_seconds, max_entries=max_entries * 4)
+        # namespace -> (normalized float32 embedding matrix, query per row)
+        self._index: Dict[str, tuple] = {}
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _value_key(query: str, namespace: str) -> str:
+        return f"{namespace}:{query}"
+
+    def _embed(self, query: str) -> "np.ndarray":
+        vector = np.asarray(self._embed_fn(query), dtype=np.float32).ravel()
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def get(self, query: str, namespace: str = "default") -> Optional[Any]:
+        """
+        Get value for the query or the most similar cached query.
+
+        Args:
+            query: Query text
+            namespace: Partition to search
+
+        Returns:
+            Cached value if an exact or semantic match is found, None otherwise
+        """
+        return self.lookup(query, namespace)[0]
+
+    def lookup(self, query: str, namespace: str = "default") -> Tuple[Optional[Any], Optional["np.ndarray"]]:
+        """
+        Get value for the query along with the query embedding.
+
+        On a miss the embedding is always computed, so passing it to set()
+        stores the answer without embedding the query a second time.
+
+        Args:
+            query: Query text
+            namespace: Partition to search
+
+        Returns:
+            (cached value or None, query embedding or None on an exact hit)
+        """
+        exact = self._values.get(self._value_key(query, namespace))
+        if exact is not None:
+            return exact, None
+
+        vector = self._embed(query)
+        with self._lock:
+            embeddings, queries = self._index.get(namespace, (None, []))
+        if not queries:
+            return None, vector
+
+        similarities = np.einsum("ij,j->i", embeddings, vector)
+        best = int(np.argmax(similarities))
+        if similarities[best] < self._threshold:
+            return None, vector
+
+        # Value may have expired or been evicted from the exact tier
+        return self._values.get(self._value_key(queries[best], namespace)), vector
+
+    def set(self, query: str, value: Any, namespace: str = "default", embedding: Optional["np.ndarray"] = None) -> None:
+        """
+        Store value and index the query embedding.
+
+        Args:
+            query: Query text
+            value: Value to cache
+            namespace: Partition to store under
+            embedding: Embedding returned by lookup(); computed if omitted
+        """
+        key = self._value_key(query, namespace)
+        already_indexed = self._values.get(key) is not None
+        self._values.set(key, value)
+        if already_indexed:
+            return
+
+        vector = embedding if embedding is not None else self._embed(query)
+        with self._lock:
+            embeddings, queries = self._index.get(namespace, (None, []))
+            if embeddings is None:
+                embeddings, queries = vector[np.newaxis, :], [query]
+            else:
+                embeddings, queries = np.vstack([embeddings, vector]), queries + [query]
+
+            if len(queries) > self._max_entries:
+                embeddings, queries = embeddings[-self._max_entries :], queries[-self._max_entries :]
+
+            self._index[namespace] = (embeddings, queries)
+
+    def clear(self) -> None:
+        """Clear all cache entries."""
+        with self._lock:
+            self._index.clear()
+            self._values.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with indexed query counts per namespace
+        """
+        with self._lock:
+            namespaces = {name: len(queries) for name, (_, queries) in self._index.items()}
+        return {
+            "threshold": self._threshold,
+            "namespaces": namespaces,
+            "value_count": self._values.stats()["entry_count"],
+        }
+
+
 # Global cache instances
 atom_cache = Cache(ttl_seconds=3600)  # 1 hour TTL for atoms
 module_cache = Cache(ttl_seconds=3600)  # 1 hour TTL for modules
+_semantic_cache: Optional[SemanticCache] = None
 
 
 def get_atom_cache() -> Cache:
@@ -172,6 +441,32 @@ def get_module_cache() -> Cache:
     return module_cache
 
 
+def get_semantic_cache() -> Optional[SemanticCache]:
+    """
+    Get or create the global semantic cache for RAG answers.
+
+    Disabled unless RAG_SEMANTIC_CACHE is set to a truthy value, since
+    near-duplicate queries then share answers. Requires sentence-transformers.
+    """
+    global _semantic_cache
+
+    if os.environ.get("RAG_SEMANTIC_CACHE", "").lower() not in ("1", "true", "yes"):
+        return None
+
+    if _semantic_cache is None:
+        try:
+            from sentence_transformers import SentenceTransformer
+
+            model = SentenceTransformer("all-MiniLM-L6-v2")
+            threshold = float(os.environ.get("RAG_SEMANTIC_CACHE_THRESHOLD", "0.85"))
+            _semantic_cache = SemanticCache(embed_fn=model.encode, threshold=threshold)
+        except Exception as e:
+            print(f"Failed to initialize semantic cache: {e}")
+            return None
+
+    return _semantic_cache
+
+
 def atomic_write(file_path: str, content: str, encoding: str = "utf-8") -> None:
     """
     Atomically write content to file using temp + rename pattern.
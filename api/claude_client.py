@@ -4,7 +4,8 @@ Integrates with the RAG system to provide context-grounded responses.
 """
 
 import os
-from typing import Any, Dict, List, Optional
+from itertools import islice
+from typing import Any, Callable, Dict, List, Optional
 
 from dotenv import load_dotenv
 
@@ -18,6 +19,58 @@ try:
 except ImportError:
     HAS_ANTHROPIC = False
 
+_BASE_SYSTEM_PROMPT = """You are a knowledgeable assistant for the Graph-Native Documentation Platform (GNDP).
+Your role is to provide accurate, helpful answers based on the provided documentation atoms.
+
+CRITICAL RULES:
+1. ONLY use information from the provided context atoms
+2. If the context doesn't contain the answer, say so clearly
+3. Always cite sources using [atom_id] notation
+4. Be concise but comprehensive
+5. Maintain technical accuracy"""
+
+_MODE_SYSTEM_PROMPTS = {
+    "entity": """
+
+ENTITY RAG MODE:
+- You have semantically similar atoms based on vector search
+- Focus on direct relevance to the query
+- Synthesize information from multiple related atoms""",
+    "path": """
+
+PATH RAG MODE:
+- You have atoms connected through relationships in the knowledge graph
+- Pay attention to relationship paths (e.g., "implements", "requires", "validates")
+- Explain how atoms are connected and why that matters
+- Provide context about the broader system structure""",
+    "impact": """
+
+IMPACT RAG MODE:
+- You have atoms showing downstream dependencies and impacts
+- Focus on what would be affected by changes
+- Explain the impact chain and risk levels
+- Highlight critical dependencies""",
+}
+
+# Full system prompt per RAG mode, built once at import
+_SYSTEM_PROMPTS = {mode: _BASE_SYSTEM_PROMPT + suffix for mode, suffix in _MODE_SYSTEM_PROMPTS.items()}
+
+_CONTEXT_ENTRY_FMT = "[{}] {} {}: {}{}\n{}\n"
+
+
+def _is_atom(atom: Any) -> bool:
+    """Return True for non-empty atom dicts."""
+    return bool(atom) and isinstance(atom, dict)
+
+
+def _relationship_suffix(atom: Dict[str, Any], rag_mode: str) -> str:
+    """For path/impact RAG, describe how the atom was reached."""
+    if rag_mode == "path" and "relationship" in atom:
+        return f" (via {atom['relationship']})"
+    if rag_mode == "impact" and "relationship_path" in atom:
+        return f" (impact path: {' → '.join(atom['relationship_path'])})"
+    return ""
+
 
 class ClaudeClient:
     """Claude API client for RAG answer generation."""
@@ -35,7 +88,12 @@ class ClaudeClient:
         self.model = "claude-sonnet-4-20250514"  # Latest Claude Sonnet
 
     def generate_rag_answer(
-        self, query: str, context_atoms: List[Dict[str, Any]], rag_mode: str = "entity", max_tokens: int = 1024
+        self,
+        query: str,
+        context_atoms: List[Dict[str, Any]],
+        rag_mode: str = "entity",
+        max_tokens: int = 1024,
+        on_text: Optional[Callable[[str], None]] = None,
     ) -> Dict[str, Any]:
         """Generate natural language answer from RAG context.
 
@@ -44,6 +102,7 @@ class ClaudeClient:
             context_atoms: Retrieved atoms with content and metadata
             rag_mode: RAG mode used (entity, path, impact)
             max_tokens: Maximum tokens in response
+            on_text: Optional callback invoked with each text delta as it streams
 
         Returns:
             Dict with answer, sources, and metadata
@@ -52,19 +111,25 @@ class ClaudeClient:
         context_text = self._build_context(context_atoms, rag_mode)
 
         # Build prompt based on RAG mode
-        system_prompt = self._get_system_prompt(rag_mode)
+        system_blocks = self._get_system_blocks(rag_mode)
         user_prompt = self._build_user_prompt(query, context_text, rag_mode)
 
-        # Call Claude API
+        # Call Claude API, streaming deltas so output is available as soon as it is generated
         try:
-            message = self.client.messages.create(
+            chunks: List[str] = []
+            with self.client.messages.stream(
                 model=self.model,
                 max_tokens=max_tokens,
-                system=system_prompt,
+                system=system_blocks,
                 messages=[{"role": "user", "content": user_prompt}],
-            )
+            ) as stream:
+                for text in stream.text_stream:
+                    chunks.append(text)
+                    if on_text is not None:
+                        on_text(text)
+                message = stream.get_final_message()
 
-            answer = message.content[0].text
+            answer = "".join(chunks)
 
             return {
                 "answer": answer,
@@ -73,6 +138,8 @@ class ClaudeClient:
                     "input": message.usage.input_tokens,
                     "output": message.usage.output_tokens,
                     "total": message.usage.input_tokens + message.usage.output_tokens,
+                    "cache_creation_input": getattr(message.usage, "cache_creation_input_tokens", None) or 0,
+                    "cache_read_input": getattr(message.usage, "cache_read_input_tokens", None) or 0,
                 },
                 "sources": [
                     {
@@ -93,66 +160,38 @@ class ClaudeClient:
         if not atoms:
             return "No relevant information found."
 
-        context_parts = []
-
-        for i, atom in enumerate(atoms[:10], 1):  # Limit to top 10
-            # Skip None or invalid atoms
-            if not atom or not isinstance(atom, dict):
-                continue
-
-            atom_id = atom.get("id", "unknown")
-            atom_type = atom.get("type", "unknown")
-            title = atom.get("title", "")
-            content = atom.get("content", atom.get("summary", ""))
-
-            # For path/impact RAG, include relationship info
-            relationship = ""
-            if rag_mode == "path" and "relationship" in atom:
-                relationship = f" (via {atom['relationship']})"
-            elif rag_mode == "impact" and "relationship_path" in atom:
-                path = " → ".join(atom["relationship_path"])
-                relationship = f" (impact path: {path})"
-
-            context_parts.append(f"[{i}] {atom_type.upper()} {atom_id}: {title}{relationship}\n{content}\n")
+        # Skip None or invalid atoms, limit to top 10
+        context_parts = [
+            _CONTEXT_ENTRY_FMT.format(
+                i,
+                (atom.get("type") or "unknown").upper(),
+                atom.get("id", "unknown"),
+                atom.get("title", ""),
+                _relationship_suffix(atom, rag_mode),
+                atom.get("content", atom.get("summary", "")),
+            )
+            for i, atom in enumerate(islice(filter(_is_atom, atoms), 10), 1)
+        ]
 
         return "\n---\n".join(context_parts)
 
     def _get_system_prompt(self, rag_mode: str) -> str:
         """Get system prompt based on RAG mode."""
-        base_prompt = """You are a knowledgeable assistant for the Graph-Native Documentation Platform (GNDP).
-Your role is to provide accurate, helpful answers based on the provided documentation atoms.
+        return _SYSTEM_PROMPTS.get(rag_mode, _BASE_SYSTEM_PROMPT)
 
-CRITICAL RULES:
-1. ONLY use information from the provided context atoms
-2. If the context doesn't contain the answer, say so clearly
-3. Always cite sources using [atom_id] notation
-4. Be concise but comprehensive
-5. Maintain technical accuracy"""
+    def _get_system_blocks(self, rag_mode: str) -> List[Dict[str, Any]]:
+        """Get system prompt as content blocks marked for Anthropic prompt caching.
 
-        mode_specific = {
-            "entity": """
-
-ENTITY RAG MODE:
-- You have semantically similar atoms based on vector search
-- Focus on direct relevance to the query
-- Synthesize information from multiple related atoms""",
-            "path": """
-
-PATH RAG MODE:
-- You have atoms connected through relationships in the knowledge graph
-- Pay attention to relationship paths (e.g., "implements", "requires", "validates")
-- Explain how atoms are connected and why that matters
-- Provide context about the broader system structure""",
-            "impact": """
-
-IMPACT RAG MODE:
-- You have atoms showing downstream dependencies and impacts
-- Focus on what would be affected by changes
-- Explain the impact chain and risk levels
-- Highlight critical dependencies""",
-        }
-
-        return base_prompt + mode_specific.get(rag_mode, "")
+        The system prompt is fully static per RAG mode, so caching it lets repeat
+        calls skip re-processing those tokens.
+        """
+        return [
+            {
+                "type": "text",
+                "text": self._get_system_prompt(rag_mode),
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
 
     def _build_user_prompt(self, query: str, context: str, rag_mode: str) -> str:
         """Build user prompt with query and context."""
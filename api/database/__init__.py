@@ -9,5 +9,12 @@ from .postgres_client import (
     close_postgres_client,
     get_postgres_client,
 )
+from .redis_client import close_redis_client, get_redis_client
 
-__all__ = ["PostgreSQLClient", "get_postgres_client", "close_postgres_client"]
+__all__ = [
+    "PostgreSQLClient",
+    "get_postgres_client",
+    "close_postgres_client",
+    "get_redis_client",
+    "close_redis_client",
+]
@@ -6,12 +6,79 @@ Mimics the behavior of the SQL database for development and testing.
 """
 
 import logging
+import re
 import uuid
+from collections import defaultdict
+from contextlib import nullcontext
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Union
+from enum import Enum, auto
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
+_ONE_DAY = timedelta(days=1)
+_TWO_DAYS = timedelta(days=2)
+
+_FILTER_COLUMN_RE = re.compile(r"\b(\w+)\s*=\s*%s", re.IGNORECASE)
+
+
+class _QueryKind(Enum):
+    """Query shapes the mock engine knows how to answer"""
+
+    PROCESS_COUNT = auto()
+    PROCESS_LIST = auto()
+    PROCESS_GET = auto()
+    PROCESS_STATS = auto()
+    TASK_WORKLOAD = auto()
+    TASK_COUNT = auto()
+    TASK_LIST = auto()
+    TASK_GET = auto()
+    MY_TASKS = auto()
+    UNKNOWN = auto()
+
+
+@lru_cache(maxsize=256)
+def _classify_query(query: str) -> _QueryKind:
+    """Route a SQL string to a query kind (cached; callers reuse the same SQL)"""
+    query = query.strip().upper()
+
+    # Basic parsing to route to correct handler
+    if "FROM PROCESS_INSTANCES" in query:
+        if "COUNT(*)" in query:
+            return _QueryKind.PROCESS_COUNT
+        if "SELECT *" in query and "LIMIT" in query:
+            return _QueryKind.PROCESS_LIST
+        if "WHERE ID =" in query:
+            return _QueryKind.PROCESS_GET
+        if "AVG(" in query:  # Stats
+            return _QueryKind.PROCESS_STATS
+
+    if "FROM TASKS" in query:
+        if "COUNT(*)" in query and "GROUP BY" in query:  # Workload
+            return _QueryKind.TASK_WORKLOAD
+        if "COUNT(*)" in query:
+            return _QueryKind.TASK_COUNT
+        if "SELECT *" in query and "LIMIT" in query:
+            return _QueryKind.TASK_LIST
+        if "WHERE ID =" in query:
+            return _QueryKind.TASK_GET
+
+    if "FROM V_MY_TASKS" in query:
+        return _QueryKind.MY_TASKS
+
+    return _QueryKind.UNKNOWN
+
+
+@lru_cache(maxsize=256)
+def _filter_columns(query: str) -> Tuple[str, ...]:
+    """Columns compared against parameters in the WHERE clause, in parameter order"""
+    match = re.search(r"\bWHERE\b(.*)", query, re.IGNORECASE | re.DOTALL)
+    if not match:
+        return ()
+    return tuple(column.lower() for column in _FILTER_COLUMN_RE.findall(match.group(1)))
+
 
 class MockDatabaseEngine:
     """In-memory mock database"""
@@ -20,34 +87,65 @@ class MockDatabaseEngine:
         self.processes = {}
         self.tasks = {}
         self.events = []
+        # Secondary indexes, maintained by _add_process/_add_task
+        self._processes_by_status: Dict[str, Set[str]] = {}
+        self._process_progress_total = 0.0
+        self._tasks_by_status: Dict[str, Set[str]] = {}
+        self._tasks_by_assignee: Dict[str, Set[str]] = {}
+        # Per-assignee [active, in_progress] counters for workload stats
+        self._workload: Dict[str, List[int]] = defaultdict(lambda: [0, 0])
+        # Column name -> index, used to answer WHERE filters without scanning
+        self._process_indexes = {"status": self._processes_by_status}
+        self._task_indexes = {"status": self._tasks_by_status, "assigned_to": self._tasks_by_assignee}
+        self._dispatch: Dict[_QueryKind, Callable[[str, Optional[tuple]], Any]] = {
+            _QueryKind.PROCESS_COUNT: lambda q, p: self._handle_count(self.processes, self._process_indexes, q, p),
+            _QueryKind.PROCESS_LIST: lambda q, p: self._handle_select_list(
+                self._filter_rows(self.processes, self._process_indexes, q, p), q, p
+            ),
+            _QueryKind.PROCESS_GET: lambda q, p: self._handle_select_one(self.processes, p),
+            _QueryKind.PROCESS_STATS: lambda q, p: self._handle_process_stats(),
+            _QueryKind.TASK_WORKLOAD: lambda q, p: self._handle_workload_stats(),
+            _QueryKind.TASK_COUNT: lambda q, p: self._handle_count(self.tasks, self._task_indexes, q, p),
+            _QueryKind.TASK_LIST: lambda q, p: self._handle_select_list(
+                self._filter_rows(self.tasks, self._task_indexes, q, p), q, p
+            ),
+            _QueryKind.TASK_GET: lambda q, p: self._handle_select_one(self.tasks, p),
+            _QueryKind.MY_TASKS: lambda q, p: self._handle_select_list(
+                self._filter_rows(self.tasks, self._task_indexes, q, p), q, p
+            ),
+        }
         self._initialize_sample_data()
 
     def _initialize_sample_data(self):
         """Load initial sample data"""
+        now = datetime.now()
+
         # Create some sample processes
         self._create_sample_process(
-            "proc-1", "Onboarding", "HR", "running", "John Doe", 50.0
+            "proc-1", "Onboarding", "HR", "running", "John Doe", 50.0, now
         )
         self._create_sample_process(
-            "proc-2", "Loan Application", "Finance", "completed", "Jane Smith", 100.0
+            "proc-2", "Loan Application", "Finance", "completed", "Jane Smith", 100.0, now
         )
         self._create_sample_process(
-            "proc-3", "Security Audit", "IT", "running", "Admin", 25.0
+            "proc-3", "Security Audit", "IT", "running", "Admin", 25.0, now
         )
         
         # Create some sample tasks
         self._create_sample_task(
-            "task-1", "proc-1", "Verify Documents", "assigned", "user1"
+            "task-1", "proc-1", "Verify Documents", "assigned", "user1", now
         )
         self._create_sample_task(
-            "task-2", "proc-1", "Setup Account", "pending", None
+            "task-2", "proc-1", "Setup Account", "pending", None, now
         )
         self._create_sample_task(
-            "task-3", "proc-2", "Approve Loan", "completed", "manager1"
+            "task-3", "proc-2", "Approve Loan", "completed", "manager1", now
         )
 
-    def _create_sample_process(self, pid, name, ptype, status, initiator, progress):
-        now = datetime.now()
+    def _create_sample_process(self, pid, name, ptype, status, initiator, progress, now=None):
+        if now is None:
+            now = datetime.now()
+        yesterday = now - _ONE_DAY
         process = {
             "id": pid,
             "process_definition_id": f"def-{pid}",
@@ -59,16 +157,17 @@ class MockDatabaseEngine:
             "assigned_to": "system",
             "priority": "medium",
             "sla_status": "on_track",
-            "created_at": now - timedelta(days=1),
-            "started_at": now - timedelta(days=1),
+            "created_at": yesterday,
+            "started_at": yesterday,
             "completed_at": now if status == "completed" else None,
-            "due_date": now + timedelta(days=2),
+            "due_date": now + _TWO_DAYS,
             "business_context": {},
         }
-        self.processes[pid] = process
+        self._add_process(process)
 
-    def _create_sample_task(self, tid, pid, name, status, assignee):
-        now = datetime.now()
+    def _create_sample_task(self, tid, pid, name, status, assignee, now=None):
+        if now is None:
+            now = datetime.now()
         task = {
             "id": tid,
             "process_instance_id": pid,
@@ -78,62 +177,115 @@ class MockDatabaseEngine:
             "status": status,
             "assigned_to": assignee,
             "created_at": now,
-            "due_date": now + timedelta(days=1),
+            "due_date": now + _ONE_DAY,
             "priority": "high",
             "sla_status": "on_track",
             "input_data": {},
             "output_data": {},
         }
+        self._add_task(task)
+
+    def _add_process(self, process):
+        """Insert or replace a process, keeping the secondary indexes in sync"""
+        pid = process["id"]
+        previous = self.processes.get(pid)
+        if previous is not None:
+            self._processes_by_status[previous["status"]].discard(pid)
+            self._process_progress_total -= previous["progress_percentage"]
+
+        self.processes[pid] = process
+        self._processes_by_status.setdefault(process["status"], set()).add(pid)
+        self._process_progress_total += process["progress_percentage"]
+
+    def _add_task(self, task):
+        """Insert or replace a task, keeping the secondary indexes in sync"""
+        tid = task["id"]
+        previous = self.tasks.get(tid)
+        if previous is not None:
+            self._tasks_by_status[previous["status"]].discard(tid)
+            if previous["assigned_to"]:
+                self._tasks_by_assignee[previous["assigned_to"]].discard(tid)
+                bucket = self._workload[previous["assigned_to"]]
+                bucket[0] -= 1
+                if previous["status"] == "in_progress":
+                    bucket[1] -= 1
+
         self.tasks[tid] = task
+        self._tasks_by_status.setdefault(task["status"], set()).add(tid)
+        if task["assigned_to"]:
+            self._tasks_by_assignee.setdefault(task["assigned_to"], set()).add(tid)
+            bucket = self._workload[task["assigned_to"]]
+            bucket[0] += 1
+            if task["status"] == "in_progress":
+                bucket[1] += 1
 
     def execute_query(
-        self, query: str, params: Optional[tuple] = None, fetch: str = "all"
+        self, query: str, params: Optional[tuple] = None, fetch: str = "all", cache_read: bool = False
     ) -> Optional[Union[List[Dict[str, Any]], Dict[str, Any]]]:
         """Mock SQL query execution"""
-        query = query.strip().upper()
-        
-        # Basic parsing to route to correct handler
-        if "FROM PROCESS_INSTANCES" in query:
-            if "COUNT(*)" in query:
-                return self._handle_count(self.processes, query, params)
-            if "SELECT *" in query and "LIMIT" in query:
-                return self._handle_select_list(list(self.processes.values()), query, params)
-            if "WHERE ID =" in query:
-                return self._handle_select_one(self.processes, params)
-            if "AVG(" in query: # Stats
-                return self._handle_process_stats()
-
-        if "FROM TASKS" in query:
-            if "COUNT(*)" in query and "GROUP BY" in query: # Workload
-                 return self._handle_workload_stats()
-            if "COUNT(*)" in query:
-                return self._handle_count(self.tasks, query, params)
-            if "SELECT *" in query and "LIMIT" in query:
-                return self._handle_select_list(list(self.tasks.values()), query, params)
-            if "WHERE ID =" in query:
-                return self._handle_select_one(self.tasks, params)
-        
-        if "FROM V_MY_TASKS" in query:
-             return self._handle_select_list(list(self.tasks.values()), query, params)
+        handler = self._dispatch.get(_classify_query(query))
+        if handler is not None:
+            return handler(query, params)
 
         # Default empty return
         if fetch == "one":
             return {}
         return []
 
-    def _handle_count(self, data_source, query, params):
-        # Very basic mock filtering
-        count = len(data_source)
-        return {"count": count}
+    def execute_prepared(
+        self, name: str, query: str, params: Optional[tuple] = None, fetch: str = "all", conn=None
+    ) -> Optional[Union[List[Dict[str, Any]], Dict[str, Any]]]:
+        """Mock prepared statement execution"""
+        return self.execute_query(query, params, fetch)
+
+    def get_connection(self):
+        """Mock connection context (no transaction)"""
+        return nullcontext()
+
+    def _match(
+        self, indexes: Dict[str, Dict[str, Set[str]]], query, params
+    ) -> Tuple[Optional[Set[str]], List[Tuple[str, Any]]]:
+        """
+        Resolve WHERE filters against the secondary indexes
+
+        Returns the ids matching every indexed filter (None when no filter
+        is indexed) and the (column, value) filters left to check per row.
+        """
+        ids: Optional[Set[str]] = None
+        residual = []
+        for column, value in zip(_filter_columns(query), params or ()):
+            index = indexes.get(column)
+            if index is None:
+                residual.append((column, value))
+                continue
+            matched = index.get(value, set())
+            ids = matched if ids is None else ids & matched
+        return ids, residual
 
-    def _handle_select_list(self, data_list, query, params):
+    def _filter_rows(self, rows, indexes, query, params) -> Iterable[Dict[str, Any]]:
+        # Lazy, so pagination only walks as far as offset + limit
+        ids, residual = self._match(indexes, query, params)
+        candidates: Iterable[Dict[str, Any]] = rows.values()
+        if ids is not None:
+            candidates = (row for row in candidates if row["id"] in ids)
+        if residual:
+            candidates = (row for row in candidates if all(row.get(c) == v for c, v in residual))
+        return candidates
+
+    def _handle_count(self, rows, indexes, query, params):
+        ids, residual = self._match(indexes, query, params)
+        if residual:
+            return {"count": sum(1 for _ in self._filter_rows(rows, indexes, query, params))}
+        return {"count": len(rows) if ids is None else len(ids)}
+
+    def _handle_select_list(self, data_rows, query, params):
         # Mock pagination (last two params are usually limit, offset)
         if params and len(params) >= 2:
             limit = params[-2]
             offset = params[-1]
             if isinstance(limit, int) and isinstance(offset, int):
-                return data_list[offset : offset + limit]
-        return data_list
+                return list(islice(data_rows, offset, offset + limit))
+        return list(data_rows)
 
     def _handle_select_one(self, data_dict, params):
         if params and len(params) > 0:
@@ -141,44 +293,33 @@ class MockDatabaseEngine:
         return None
 
     def _handle_process_stats(self):
-        # Mock stats
+        # Answered from the status index and running progress total
+        total = len(self.processes)
+        by_status = self._processes_by_status
         return {
-            "total_processes": len(self.processes),
-            "running": len([p for p in self.processes.values() if p["status"] == "running"]),
-            "completed": len([p for p in self.processes.values() if p["status"] == "completed"]),
-            "failed": 0,
-            "suspended": 0,
+            "total_processes": total,
+            "running": len(by_status.get("running", ())),
+            "completed": len(by_status.get("completed", ())),
+            "failed": len(by_status.get("failed", ())),
+            "suspended": len(by_status.get("suspended", ())),
             "sla_breached": 0,
-            "avg_progress": 45.0,
+            "avg_progress": self._process_progress_total / total if total else 0.0,
             "avg_duration_mins": 120.0,
         }
 
     def _handle_workload_stats(self):
-        # Mock workload
-        workload = []
-        user_tasks = {}
-        for task in self.tasks.values():
-            user = task.get("assigned_to")
-            if user:
-                if user not in user_tasks:
-                    user_tasks[user] = {"active": 0, "in_progress": 0}
-                user_tasks[user]["active"] += 1
-                if task["status"] == "in_progress":
-                    user_tasks[user]["in_progress"] += 1
-        
-        for user, stats in user_tasks.items():
-            workload.append({
-                "assigned_to": user,
-                "active_tasks": stats["active"],
-                "in_progress": stats["in_progress"],
-                "at_risk": 0,
-                "breached": 0
-            })
-            
-        return workload
+        # Mock workload, projected from the per-assignee counters
+        return [
+            {"assigned_to": user, "active_tasks": bucket[0], "in_progress": bucket[1], "at_risk": 0, "breached": 0}
+            for user, bucket in self._workload.items()
+            if bucket[0]
+        ]
 
     def execute_command(self, command, params, returning=False):
         return {}
 
     def execute_batch(self, command, params_list):
         return len(params_list)
+
+    def execute_values(self, command, values_list, template=None, page_size=1000, returning=False):
+        return [] if returning else len(values_list)
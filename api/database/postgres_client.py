@@ -6,25 +6,74 @@ Manages PostgreSQL connections for process state, tasks, and execution history.
 
 import logging
 import os
-from contextlib import contextmanager
-from typing import Any, Dict, List, Optional
+import re
+import uuid
+from contextlib import contextmanager, nullcontext
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Set, Union
+from weakref import WeakKeyDictionary
 
-import psycopg2
-from psycopg2 import pool
-from psycopg2.extras import RealDictCursor
+if TYPE_CHECKING:
+    from psycopg2 import pool
+
+try:
+    import pyarrow as pa
+
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+try:
+    from ..cache import Cache
+except ImportError:
+    from cache import Cache
 
 logger = logging.getLogger(__name__)
 
+_STATEMENT_NAME_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+_PLACEHOLDER_RE = re.compile(r"%%|%s")
+
+
+def _fetch_rows(cursor, fetch: str, raw: bool = False) -> Any:
+    """
+    Fetch results from a plain tuple cursor
+
+    Rows come back as tuples and are zipped into dicts with one shared
+    columns tuple, which is cheaper than a dict cursor building every row.
+    With raw=True the (columns, rows) pair is returned untouched.
+    """
+    if fetch not in ("all", "one"):
+        return None
+
+    columns = tuple(column[0] for column in cursor.description)
+    if fetch == "all":
+        rows = cursor.fetchall()
+        return (columns, rows) if raw else [dict(zip(columns, row)) for row in rows]
+
+    row = cursor.fetchone()
+    if raw:
+        return columns, row
+    return dict(zip(columns, row)) if row is not None else None
+
+
+def _to_positional(sql: str) -> str:
+    """Rewrite psycopg2 %s placeholders as PREPARE-style $1, $2, ..."""
+    counter = iter(range(1, sql.count("%s") + 1))
+    return _PLACEHOLDER_RE.sub(lambda m: "%" if m.group() == "%%" else f"${next(counter)}", sql)
+
 
 class PostgreSQLClient:
     """PostgreSQL database client with connection pooling"""
 
     _instance: Optional["PostgreSQLClient"] = None
-    _pool: Optional[pool.ThreadedConnectionPool] = None
+    _pool: Optional["pool.ThreadedConnectionPool"] = None
 
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(PostgreSQLClient, cls).__new__(cls)
+            # Prepared statement names per pooled connection; entries vanish with the connection
+            cls._instance._prepared = WeakKeyDictionary()
+            # Short-lived results for hot idempotent SELECTs; cleared on every write
+            cls._instance._read_cache = Cache(ttl_seconds=5, max_entries=1024)
         return cls._instance
 
     def __init__(self):
@@ -34,6 +83,10 @@ class PostgreSQLClient:
 
     def _initialize_pool(self):
         """Create connection pool"""
+        # Imported here so deployments running on the mock engine never load psycopg2
+        import psycopg2
+        from psycopg2 import pool
+
         try:
             # Get connection details from environment
             db_config = {
@@ -44,8 +97,14 @@ class PostgreSQLClient:
                 "password": os.getenv("POSTGRES_PASSWORD", "postgres"),
             }
 
+            # Size the pool per API worker; maxconn bounds concurrent requests using the database
+            pool_size = {
+                "minconn": int(os.getenv("POSTGRES_POOL_MIN_CONN", "2")),
+                "maxconn": int(os.getenv("POSTGRES_POOL_MAX_CONN", "20")),
+            }
+
             # Create connection pool
-            self._pool = pool.ThreadedConnectionPool(minconn=2, maxconn=20, **db_config)
+            self._pool = pool.ThreadedConnectionPool(**pool_size, **db_config)
 
             logger.info(
                 f"PostgreSQL connection pool created: {db_config['host']}:{db_config['port']}/{db_config['database']}"
@@ -75,7 +134,7 @@ class PostgreSQLClient:
                     admin_conn.close()
 
                     # Retry creating the pool
-                    self._pool = pool.ThreadedConnectionPool(minconn=2, maxconn=20, **db_config)
+                    self._pool = pool.ThreadedConnectionPool(**pool_size, **db_config)
 
                     logger.info(
                         f"PostgreSQL database '{db_config['database']}' created and connection pool established"
@@ -121,12 +180,12 @@ class PostgreSQLClient:
                 self._pool.putconn(conn)
 
     @contextmanager
-    def get_cursor(self, cursor_factory=RealDictCursor):
+    def get_cursor(self, cursor_factory=None):
         """
         Get a cursor (context manager)
 
         Args:
-            cursor_factory: Cursor type (RealDictCursor returns dicts)
+            cursor_factory: Cursor type (default returns tuples; RealDictCursor returns dicts)
 
         Usage:
             with client.get_cursor() as cursor:
@@ -141,8 +200,13 @@ class PostgreSQLClient:
                 cursor.close()
 
     def execute_query(
-        self, query: str, params: Optional[tuple] = None, fetch: str = "all"
-    ) -> Optional[List[Dict[str, Any]]]:
+        self,
+        query: str,
+        params: Optional[tuple] = None,
+        fetch: str = "all",
+        cache_read: bool = False,
+        raw: bool = False,
+    ) -> Any:
         """
         Execute a SELECT query and return results
 
@@ -150,19 +214,134 @@ class PostgreSQLClient:
             query: SQL query
             params: Query parameters (tuple)
             fetch: 'all', 'one', or 'none'
+            cache_read: Serve repeats of this (query, params) from a 5 second
+                read cache. Only for idempotent SELECTs that tolerate slightly
+                stale data (stats, counts). params must be hashable and cached
+                results are shared, so do not mutate them.
+            raw: Return (columns, rows) with rows as tuples instead of dicts,
+                for bulk fetches that do not need per-row dicts
 
         Returns:
-            List of dicts for 'all', single dict for 'one', None for 'none'
+            List of dicts for 'all', single dict for 'one', None for 'none';
+            (columns, rows) or (columns, row) when raw=True
         """
+        cache_key = (query, params, fetch, raw) if cache_read and fetch != "none" else None
+        if cache_key is not None:
+            cached = self._read_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         with self.get_cursor() as cursor:
             cursor.execute(query, params or ())
+            result = _fetch_rows(cursor, fetch, raw)
+
+        if cache_key is not None:
+            self._read_cache.set(cache_key, result)
+        return result
+
+    def iter_query(
+        self, query: str, params: Optional[tuple] = None, batch_size: int = 1000
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Stream a SELECT query in batches through a server-side cursor
+
+        Only ``batch_size`` rows are held in memory at a time, so large
+        result sets do not have to be materialized up front. The pooled
+        connection is held until the generator is exhausted or closed.
+
+        Usage:
+            for batch in client.iter_query("SELECT * FROM task_assignments"):
+                process(batch)
+
+        Args:
+            query: SQL query
+            params: Query parameters (tuple)
+            batch_size: Rows fetched per round-trip and yielded per batch
+
+        Yields:
+            Lists of up to batch_size dicts
+        """
+        with self.get_connection() as conn:
+            with conn.cursor(name=f"iter_{uuid.uuid4().hex}") as cursor:
+                cursor.itersize = batch_size
+                cursor.execute(query, params or ())
+
+                columns = None
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    # Named cursors only populate description after the first fetch
+                    if columns is None:
+                        columns = tuple(column[0] for column in cursor.description)
+                    yield [dict(zip(columns, row)) for row in rows]
+
+    def execute_arrow(self, query: str, params: Optional[tuple] = None) -> "pa.Table":
+        """
+        Execute a SELECT query and return the result as an Arrow table
+
+        Rows are fetched as tuples and transposed straight into Arrow
+        columns, skipping per-row dicts. Useful for analytics-shaped reads
+        that are aggregated or handed to pandas/polars afterwards.
+
+        Args:
+            query: SQL query
+            params: Query parameters (tuple)
+
+        Returns:
+            pyarrow.Table with one column per result column
+        """
+        if not HAS_PYARROW:
+            raise ImportError("pyarrow not installed. Run: pip install pyarrow")
+
+        columns, rows = self.execute_query(query, params, raw=True)
+        column_values = zip(*rows) if rows else ([] for _ in columns)
+        return pa.Table.from_arrays([pa.array(list(values)) for values in column_values], names=list(columns))
+
+    def execute_prepared(
+        self, name: str, query: str, params: Optional[tuple] = None, fetch: str = "all", conn=None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Execute a recurring query as a server-side prepared statement
+
+        The statement is PREPAREd once per pooled connection and then run
+        with EXECUTE, so PostgreSQL skips parsing and planning on reuse.
 
-            if fetch == "all":
-                return cursor.fetchall()
-            elif fetch == "one":
-                return cursor.fetchone()
-            else:
-                return None
+        Args:
+            name: Statement name (SQL identifier, unique per query text)
+            query: SQL query using %s placeholders
+            params: Query parameters (tuple)
+            fetch: 'all', 'one', or 'none'
+            conn: Connection from get_connection() to run on, so several
+                statements share one transaction (committed by its owner)
+
+        Returns:
+            List of dicts for 'all', single dict for 'one', None for 'none'
+        """
+        if not _STATEMENT_NAME_RE.match(name):
+            raise ValueError(f"Invalid prepared statement name: {name!r}")
+
+        # Anything but a plain SELECT may write, so drop cached reads as execute_command does
+        if query.lstrip()[:6].upper() != "SELECT":
+            self._read_cache.clear()
+
+        params = params or ()
+        with nullcontext(conn) if conn is not None else self.get_connection() as conn:
+            prepared: Set[str] = self._prepared.setdefault(conn, set())
+            cursor = conn.cursor()
+            try:
+                if name not in prepared:
+                    cursor.execute(f"PREPARE {name} AS {_to_positional(query)}")
+                    prepared.add(name)
+
+                if params:
+                    cursor.execute(f"EXECUTE {name} ({', '.join(['%s'] * len(params))})", params)
+                else:
+                    cursor.execute(f"EXECUTE {name}")
+
+                return _fetch_rows(cursor, fetch)
+            finally:
+                cursor.close()
 
     def execute_command(
         self, command: str, params: Optional[tuple] = None, returning: bool = False
@@ -178,11 +357,12 @@ class PostgreSQLClient:
         Returns:
             Dict if returning=True, None otherwise
         """
+        self._read_cache.clear()
         with self.get_cursor() as cursor:
             cursor.execute(command, params or ())
 
             if returning:
-                return cursor.fetchone()
+                return _fetch_rows(cursor, "one")
 
             return None
 
@@ -199,10 +379,50 @@ class PostgreSQLClient:
         """
         from psycopg2.extras import execute_batch
 
+        self._read_cache.clear()
         with self.get_cursor() as cursor:
             execute_batch(cursor, command, params_list)
             return cursor.rowcount
 
+    def execute_values(
+        self,
+        command: str,
+        values_list: List[tuple],
+        template: Optional[str] = None,
+        page_size: int = 1000,
+        returning: bool = False,
+    ) -> Union[int, List[Dict[str, Any]]]:
+        """
+        Execute a bulk INSERT as multi-row VALUES statements
+
+        Sends one statement per ``page_size`` rows instead of one per row,
+        which is much faster than execute_batch for inserts. Use
+        execute_batch for UPDATE/DELETE.
+
+        Args:
+            command: SQL command with a single %s placeholder for the VALUES list,
+                e.g. "INSERT INTO tasks (id, name) VALUES %s"
+            values_list: List of row tuples
+            template: Optional per-row template, e.g. "(%s, %s, now())"
+            page_size: Maximum rows per statement
+            returning: If True, return the RETURNING clause rows
+
+        Returns:
+            List of dicts if returning=True, otherwise number of rows affected
+        """
+        from psycopg2.extras import execute_values
+
+        self._read_cache.clear()
+        with self.get_cursor() as cursor:
+            rows = execute_values(cursor, command, values_list, template=template, page_size=page_size, fetch=returning)
+            if returning:
+                columns = tuple(column[0] for column in cursor.description)
+                return [dict(zip(columns, row)) for row in rows]
+            # rowcount only covers the last page once the insert is split
+            if len(values_list) > page_size or cursor.rowcount < 0:
+                return len(values_list)
+            return cursor.rowcount
+
     def call_function(self, function_name: str, params: Optional[tuple] = None) -> Any:
         """
         Call a PostgreSQL function
@@ -217,10 +437,11 @@ class PostgreSQLClient:
         placeholders = ",".join(["%s"] * len(params or ()))
         query = f"SELECT {function_name}({placeholders})"
 
+        self._read_cache.clear()
         with self.get_cursor() as cursor:
             cursor.execute(query, params or ())
             result = cursor.fetchone()
-            return result[function_name] if result else None
+            return result[0] if result else None
 
     def initialize_schema(self, schema_file: str = "api/database/schema.sql"):
         """
@@ -252,6 +473,7 @@ class PostgreSQLClient:
         if self._pool:
             self._pool.closeall()
             self._pool = None
+            self._prepared.clear()
             logger.info("PostgreSQL connection pool closed")
 
 
@@ -0,0 +1,70 @@
+"""
+Redis Client for Workflow Execution Engine
+
+Optional shared state for task routing (per-user workload counters and the
+like) that must be consistent across API worker processes. Redis is only
+used when REDIS_URL is set and the redis package is installed; callers get
+None otherwise and fall back to PostgreSQL.
+"""
+
+import logging
+import os
+import threading
+from typing import TYPE_CHECKING, Optional
+
+try:
+    import redis
+
+    HAS_REDIS = True
+except ImportError:
+    HAS_REDIS = False
+
+if TYPE_CHECKING:
+    from redis import Redis
+
+logger = logging.getLogger(__name__)
+
+
+# Singleton instance
+_redis_client: Optional["Redis"] = None
+_redis_lock = threading.Lock()
+
+
+def get_redis_client() -> Optional["Redis"]:
+    """
+    Get singleton Redis client instance
+
+    Returns:
+        Redis client, or None when REDIS_URL is unset or redis is not installed
+    """
+    global _redis_client
+
+    url = os.getenv("REDIS_URL")
+    if not url:
+        return None
+
+    if not HAS_REDIS:
+        logger.warning("REDIS_URL is set but redis is not installed. Run: pip install redis")
+        return None
+
+    if _redis_client is None:
+        with _redis_lock:
+            if _redis_client is None:
+                _redis_client = redis.Redis.from_url(
+                    url,
+                    decode_responses=True,
+                    socket_timeout=float(os.getenv("REDIS_SOCKET_TIMEOUT", "0.5")),
+                )
+                logger.info("Redis client created")
+
+    return _redis_client
+
+
+def close_redis_client():
+    """Close Redis client"""
+    global _redis_client
+
+    with _redis_lock:
+        if _redis_client is not None:
+            _redis_client.close()
+            _redis_client = None
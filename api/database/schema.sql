@@ -346,6 +346,8 @@ CREATE INDEX IF NOT EXISTS idx_tasks_assigned ON tasks(assigned_to);
 CREATE INDEX IF NOT EXISTS idx_tasks_claimed ON tasks(claimed_by);
 CREATE INDEX IF NOT EXISTS idx_tasks_due ON tasks(due_date) WHERE status IN ('pending', 'assigned', 'in_progress');
 CREATE INDEX IF NOT EXISTS idx_tasks_sla ON tasks(sla_status) WHERE status IN ('assigned', 'in_progress');
+-- Open work per assignee (TaskRouter workloads); partial so it only holds active tasks
+CREATE INDEX IF NOT EXISTS idx_tasks_active_assignee ON tasks(assigned_to) WHERE status IN ('assigned', 'in_progress');
 CREATE INDEX IF NOT EXISTS idx_tasks_created ON tasks(created_at DESC);
 
 -- Process events indexes
@@ -365,6 +367,8 @@ CREATE INDEX IF NOT EXISTS idx_sla_breach ON sla_metrics(status, breach_amount_m
 CREATE INDEX IF NOT EXISTS idx_assignments_task ON task_assignments(task_id);
 CREATE INDEX IF NOT EXISTS idx_assignments_user ON task_assignments(assigned_to, status);
 CREATE INDEX IF NOT EXISTS idx_assignments_date ON task_assignments(assigned_at DESC);
+-- Recent active assignments (assignment stats windows); partial so it only holds open assignments
+CREATE INDEX IF NOT EXISTS idx_assignments_active_recent ON task_assignments(assigned_at) WHERE status = 'active';
 
 -- Workflow rules indexes
 CREATE INDEX IF NOT EXISTS idx_rules_enabled ON workflow_rules(enabled, priority);
@@ -494,6 +498,41 @@ FROM tasks t
 WHERE t.sla_status = 'breached' AND t.status IN ('assigned', 'in_progress')
 ORDER BY minutes_overdue DESC;
 
+-- Assignment stats over the last 7 days (single row, refreshed every few minutes by the API)
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_assignment_stats_7d AS
+WITH recent AS (
+    SELECT assignment_method, status
+    FROM task_assignments
+    WHERE assigned_at > NOW() - INTERVAL '7 days'
+),
+methods AS (
+    SELECT assignment_method, COUNT(*) as count
+    FROM recent
+    GROUP BY assignment_method
+),
+workloads AS (
+    -- Task age comes from its active assignment row; tasks has no assigned_at
+    SELECT
+        t.assigned_to,
+        COUNT(DISTINCT t.id) as active_tasks,
+        AVG(EXTRACT(EPOCH FROM (NOW() - ta.assigned_at))/60) as avg_age_mins
+    FROM tasks t
+    LEFT JOIN task_assignments ta ON ta.task_id = t.id AND ta.status = 'active'
+    WHERE t.status IN ('assigned', 'in_progress')
+    GROUP BY t.assigned_to
+)
+SELECT
+    1 as id,
+    (SELECT COALESCE(json_object_agg(assignment_method, count), '{}'::json) FROM methods) as assignment_methods,
+    (SELECT COALESCE(json_agg(workloads ORDER BY active_tasks DESC), '[]'::json) FROM workloads) as user_workloads,
+    COUNT(*) FILTER (WHERE status = 'reassigned') as reassigned,
+    COUNT(*) as total,
+    NOW() as refreshed_at
+FROM recent;
+
+-- Unique index required by REFRESH MATERIALIZED VIEW CONCURRENTLY
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_assignment_stats_7d_id ON mv_assignment_stats_7d(id);
+
 -- ============================================================================
 -- COMMENTS
 -- ============================================================================
@@ -509,6 +548,7 @@ COMMENT ON TABLE performance_metrics IS 'Aggregated performance data for analyti
 COMMENT ON VIEW v_active_processes IS 'Summary of all active processes with task counts';
 COMMENT ON VIEW v_my_tasks IS 'Tasks assigned to users that need attention';
 COMMENT ON VIEW v_sla_breaches IS 'All SLA breaches across processes and tasks';
+COMMENT ON MATERIALIZED VIEW mv_assignment_stats_7d IS 'Assignment method, workload and reassignment stats for the last 7 days';
 
 -- ============================================================================
 -- INITIAL DATA
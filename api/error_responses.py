@@ -4,12 +4,56 @@ Standardized error response models for GNDP API.
 Provides consistent error formatting across all API endpoints.
 """
 
-from datetime import datetime
+import time
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+# (epoch second, formatted timestamp) - swapped as one tuple so concurrent
+# readers never see a mismatched pair
+_cached_timestamp = (0, "")
+
+
+def _utc_timestamp() -> str:
+    """
+    Current UTC time as an ISO 8601 string at second precision.
+
+    The formatted string is reused for every response within the same second.
+    """
+    global _cached_timestamp
+
+    now = int(time.time())
+    cached_second, cached_value = _cached_timestamp
+    if now != cached_second:
+        cached_value = datetime.fromtimestamp(now, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        _cached_timestamp = (now, cached_value)
+    return cached_value
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson when it is installed.
+
+    orjson encodes straight to bytes in C, skipping the stdlib encoder.
+    Falls back to the standard JSONResponse rendering otherwise.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if not HAS_ORJSON:
+            return super().render(content)
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY)
+
 
 class ErrorCode(str, Enum):
     """Standard error codes for API responses."""
@@ -52,7 +96,7 @@ class ErrorResponse(BaseModel):
     error: str = Field(..., description="Error code (machine-readable)")
     message: str = Field(..., description="Human-readable error message")
     details: Optional[List[ErrorDetail]] = Field(None, description="Additional error details")
-    timestamp: str = Field(default_factory=lambda: datetime.utcnow().isoformat(), description="ISO 8601 timestamp")
+    timestamp: str = Field(default_factory=_utc_timestamp, description="ISO 8601 timestamp")
     path: Optional[str] = Field(None, description="API endpoint path where error occurred")
     request_id: Optional[str] = Field(None, description="Request tracking ID")
 
@@ -76,7 +120,7 @@ class SuccessResponse(BaseModel):
     success: bool = Field(True, description="Always true for successful responses")
     data: Any = Field(..., description="Response data")
     message: Optional[str] = Field(None, description="Optional success message")
-    timestamp: str = Field(default_factory=lambda: datetime.utcnow().isoformat(), description="ISO 8601 timestamp")
+    timestamp: str = Field(default_factory=_utc_timestamp, description="ISO 8601 timestamp")
 
     class Config:
         json_schema_extra = {
@@ -107,7 +151,8 @@ def create_error_response(
         request_id: Request tracking ID
 
     Returns:
-        Dictionary formatted as ErrorResponse
+        Dictionary formatted as ErrorResponse (built directly; the model is
+        only used for the OpenAPI schema)
 
     Example:
         >>> error = create_error_response(
@@ -116,8 +161,15 @@ def create_error_response(
         ...     path="/api/atoms/ATOM-123"
         ... )
     """
-    response = ErrorResponse(error=error_code.value, message=message, details=details, path=path, request_id=request_id)
-    return response.model_dump()
+    return {
+        "success": False,
+        "error": error_code.value,
+        "message": message,
+        "details": [ErrorDetail.model_validate(detail).model_dump() for detail in details] if details else None,
+        "timestamp": _utc_timestamp(),
+        "path": path,
+        "request_id": request_id,
+    }
 
 
 def create_success_response(data: Any, message: Optional[str] = None) -> Dict[str, Any]:
@@ -129,7 +181,8 @@ def create_success_response(data: Any, message: Optional[str] = None) -> Dict[st
         message: Optional success message
 
     Returns:
-        Dictionary formatted as SuccessResponse
+        Dictionary formatted as SuccessResponse (built directly; the model is
+        only used for the OpenAPI schema)
 
     Example:
         >>> response = create_success_response(
@@ -137,5 +190,4 @@ def create_success_response(data: Any, message: Optional[str] = None) -> Dict[st
         ...     message="Retrieved 10 atoms"
         ... )
     """
-    response = SuccessResponse(data=data, message=message)
-    return response.model_dump()
+    return {"success": True, "data": data, "message": message, "timestamp": _utc_timestamp()}
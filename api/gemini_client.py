@@ -1,11 +1,30 @@
+import asyncio
+import hashlib
 import os
 import logging
-from typing import Optional
-from google import genai
-from google.genai import types
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from google.genai import types
+
+try:
+    from .cache import Cache
+except ImportError:
+    from cache import Cache
 
 logger = logging.getLogger(__name__)
 
+
+def _response_cache_key(
+    prompt: str, model: str, config: Optional["types.GenerateContentConfig"]
+) -> Optional[Tuple[str, str, bytes]]:
+    """Cache key for a request, or None when sampling makes the output non-deterministic."""
+    if config is not None and (config.temperature or 0) > 0:
+        return None
+    fingerprint = hashlib.blake2b(repr(config).encode(), digest_size=16).digest()
+    return (model, prompt, fingerprint)
+
+
 class GeminiClient:
     """
     Client for interacting with Google's Gemini models via the new google-genai SDK.
@@ -25,17 +44,24 @@ class GeminiClient:
                 logger.warning("GEMINI_API_KEY/GOOGLE_API_KEY not found in environment")
                 self.client = None
             else:
+                # Imported only when a key is configured; the SDK is slow to import
+                from google import genai
+
                 self.client = genai.Client(api_key=api_key)
                 logger.info("GeminiClient initialized successfully")
+            # Identical prompts (tooltips, examples) skip the network round-trip
+            self._response_cache = Cache(ttl_seconds=3600, max_entries=2048)
 
     def generate_content(
         self, 
         prompt: str, 
         model: str = "gemini-1.5-flash-001", 
-        config: Optional[types.GenerateContentConfig] = None
+        config: Optional["types.GenerateContentConfig"] = None
     ) -> str:
         """
         Generate content using the Gemini model.
+
+        Responses are cached for an hour unless config sets temperature > 0.
         
         Args:
             prompt: The text prompt.
@@ -48,16 +74,94 @@ class GeminiClient:
         if not self.client:
             raise ValueError("GeminiClient not initialized with API key")
 
+        cache_key = _response_cache_key(prompt, model, config)
+        if cache_key is not None:
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         try:
             response = self.client.models.generate_content(
                 model=model,
                 contents=prompt,
                 config=config
             )
+            if cache_key is not None and response.text is not None:
+                self._response_cache.set(cache_key, response.text)
+            return response.text
+        except Exception as e:
+            logger.error(f"Error generating content with Gemini: {e}")
+            raise
+
+    async def agenerate_content(
+        self,
+        prompt: str,
+        model: str = "gemini-1.5-flash-001",
+        config: Optional["types.GenerateContentConfig"] = None
+    ) -> str:
+        """
+        Async version of generate_content for use from async handlers.
+
+        Awaits the SDK's aio client, so the event loop is not blocked
+        for the duration of the network call.
+
+        Args:
+            prompt: The text prompt.
+            model: Model name.
+            config: Optional generation config.
+
+        Returns:
+            The generated text response.
+        """
+        if not self.client:
+            raise ValueError("GeminiClient not initialized with API key")
+
+        cache_key = _response_cache_key(prompt, model, config)
+        if cache_key is not None:
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        try:
+            response = await self.client.aio.models.generate_content(
+                model=model,
+                contents=prompt,
+                config=config
+            )
+            if cache_key is not None and response.text is not None:
+                self._response_cache.set(cache_key, response.text)
             return response.text
         except Exception as e:
             logger.error(f"Error generating content with Gemini: {e}")
             raise
 
+    async def agenerate_many(
+        self,
+        prompts: List[str],
+        model: str = "gemini-1.5-flash-001",
+        config: Optional["types.GenerateContentConfig"] = None,
+        *,
+        concurrency: int = 20
+    ) -> List[str]:
+        """
+        Generate content for several prompts concurrently.
+
+        Args:
+            prompts: The text prompts.
+            model: Model name.
+            config: Optional generation config shared by all prompts.
+            concurrency: Maximum number of requests in flight at once.
+
+        Returns:
+            Generated text responses, in the same order as prompts.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def generate(prompt: str) -> str:
+            async with semaphore:
+                return await self.agenerate_content(prompt, model=model, config=config)
+
+        return await asyncio.gather(*(generate(prompt) for prompt in prompts))
+
 def get_gemini_client() -> GeminiClient:
     return GeminiClient()
@@ -1,26 +1,45 @@
 """
 Logging configuration for GNDP API.
 
-Provides structured logging with sensitive field masking.
+Provides structured logging with sensitive field masking. Records are handed
+to a background QueueListener, so masking and I/O happen off the request thread.
 """
 
+import atexit
 import logging
+import queue
 import re
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any
 
-# Configure logging format
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Patterns to mask in log messages (api key / token / password / secret
+# assignments, and Bearer credentials), unioned so each string is scanned once
+_SENSITIVE_RE = re.compile(
+    r'(?P<prefix>(?:api[_-]?key|token|password|secret)["\']?\s*[:=]\s*["\']?)[^"\'}\s]+'
+    r"|(?P<bearer>Bearer\s+[A-Za-z0-9\-._~+/]+=*)",
+    re.IGNORECASE,
 )
+# Dict keys whose values are always redacted by mask_sensitive_data
+_SENSITIVE_KEYS = frozenset({"api_key", "apikey", "token", "password", "secret", "auth", "authorization"})
+
+
+def _redact(match: "re.Match[str]") -> str:
+    prefix = match.group("prefix")
+    if prefix is not None:
+        return prefix + "***REDACTED***"
+    return "Bearer ***REDACTED***"
+
 
-# Patterns to mask in log messages
-SENSITIVE_PATTERNS = [
-    (re.compile(r'(api[_-]?key["\']?\s*[:=]\s*["\']?)([^"\'}\s]+)', re.IGNORECASE), r"\1***REDACTED***"),
-    (re.compile(r'(token["\']?\s*[:=]\s*["\']?)([^"\'}\s]+)', re.IGNORECASE), r"\1***REDACTED***"),
-    (re.compile(r'(password["\']?\s*[:=]\s*["\']?)([^"\'}\s]+)', re.IGNORECASE), r"\1***REDACTED***"),
-    (re.compile(r'(secret["\']?\s*[:=]\s*["\']?)([^"\'}\s]+)', re.IGNORECASE), r"\1***REDACTED***"),
-    (re.compile(r"Bearer\s+[A-Za-z0-9\-._~+/]+=*", re.IGNORECASE), "Bearer ***REDACTED***"),
-]
+def _mask_string(text: str) -> str:
+    """Mask sensitive patterns in a single string."""
+    # Every sensitive pattern needs ':' / '=' or the word "bearer"; plain substring
+    # checks let the common benign string skip the regex entirely
+    if ":" not in text and "=" not in text and "bearer" not in text.lower():
+        return text
+    return _SENSITIVE_RE.sub(_redact, text)
 
 
 class SensitiveDataFilter(logging.Filter):
@@ -29,27 +48,42 @@ class SensitiveDataFilter(logging.Filter):
     def filter(self, record: logging.LogRecord) -> bool:
         """Mask sensitive patterns in log message."""
         if record.msg:
-            message = str(record.msg)
-            for pattern, replacement in SENSITIVE_PATTERNS:
-                message = pattern.sub(replacement, message)
-            record.msg = message
+            record.msg = _mask_string(str(record.msg))
 
         if record.args:
             # Mask args if they're strings
-            masked_args = []
-            for arg in record.args:
-                if isinstance(arg, str):
-                    for pattern, replacement in SENSITIVE_PATTERNS:
-                        arg = pattern.sub(replacement, arg)
-                masked_args.append(arg)
-            record.args = tuple(masked_args)
+            record.args = tuple(_mask_string(arg) if isinstance(arg, str) else arg for arg in record.args)
 
         return True
 
 
+def _configure_root_logger() -> None:
+    """Route root logging through a queue to a masking stream handler on a background thread."""
+    root = logging.getLogger()
+    if any(isinstance(handler, QueueHandler) for handler in root.handlers):
+        return  # Already configured (module imported under another name)
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT))
+    stream_handler.addFilter(SensitiveDataFilter())
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+
+    root.setLevel(logging.INFO)
+    root.addHandler(QueueHandler(log_queue))
+    listener.start()
+    atexit.register(listener.stop)
+
+
+_configure_root_logger()
+
+
 def get_logger(name: str) -> logging.Logger:
     """
-    Get a logger instance with sensitive data filtering.
+    Get a logger instance.
+
+    Sensitive data is masked by the root queue listener's handler.
 
     Args:
         name: Logger name (typically __name__ of calling module)
@@ -57,9 +91,7 @@ def get_logger(name: str) -> logging.Logger:
     Returns:
         Configured logger instance
     """
-    logger = logging.getLogger(name)
-    logger.addFilter(SensitiveDataFilter())
-    return logger
+    return logging.getLogger(name)
 
 
 def mask_sensitive_data(data: Any) -> Any:
@@ -74,22 +106,17 @@ def mask_sensitive_data(data: Any) -> Any:
     """
     if isinstance(data, dict):
         masked = {}
-        sensitive_keys = {"api_key", "apikey", "token", "password", "secret", "auth", "authorization"}
         for key, value in data.items():
-            if key.lower() in sensitive_keys:
+            if key.lower() in _SENSITIVE_KEYS:
                 masked[key] = "***REDACTED***"
             elif isinstance(value, dict):
                 masked[key] = mask_sensitive_data(value)
             elif isinstance(value, str):
-                for pattern, replacement in SENSITIVE_PATTERNS:
-                    value = pattern.sub(replacement, value)
-                masked[key] = value
+                masked[key] = _mask_string(value)
             else:
                 masked[key] = value
         return masked
     elif isinstance(data, str):
-        for pattern, replacement in SENSITIVE_PATTERNS:
-            data = pattern.sub(replacement, data)
-        return data
+        return _mask_string(data)
     else:
         return data
@@ -5,7 +5,12 @@ This module provides a client for querying and traversing the Neo4j graph databa
 implementing traversal patterns defined in the ontology.yaml file.
 """
 
-from neo4j import GraphDatabase
+import logging
+import threading
+
+from neo4j import READ_ACCESS, GraphDatabase, Record
+from neo4j.exceptions import Neo4jError
+from neo4j.graph import Node, Relationship
 
 try:
     # Older driver versions exposed ConnectionError/DatabaseError names
@@ -17,7 +22,227 @@ except Exception:
     ConnectionError = ServiceUnavailable
     DatabaseError = Neo4jError
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+try:
+    from .cache import Cache
+except ImportError:
+    from cache import Cache
+
+logger = logging.getLogger(__name__)
+
+# Repeat traversals of the same atom within this window are served from memory
+TRAVERSAL_CACHE_TTL_SECONDS = 60
+TRAVERSAL_CACHE_MAX_ENTRIES = 4096
+# Records pulled per Bolt round-trip on read sessions; bounds client-side buffering
+DEFAULT_FETCH_SIZE = 500
+
+
+def _driver_options() -> Dict[str, Any]:
+    """Connection pool and retry settings for the Neo4j driver."""
+    return {
+        "encrypted": False,
+        "max_connection_pool_size": int(os.environ.get("NEO4J_POOL_SIZE", "50")),
+        "connection_acquisition_timeout": float(os.environ.get("NEO4J_CONNECTION_ACQUISITION_TIMEOUT", "60")),
+        "connection_timeout": float(os.environ.get("NEO4J_CONNECTION_TIMEOUT", "30")),
+        "max_transaction_retry_time": float(os.environ.get("NEO4J_MAX_TRANSACTION_RETRY_TIME", "30")),
+    }
+
+
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _serialize_value(value: Any) -> Any:
+    """Convert one record value: nodes/relationships become dicts, lists are converted element-wise."""
+    value_type = type(value)
+    if value_type in _SCALAR_TYPES:
+        return value
+    if value_type is Node or value_type is Relationship:
+        return dict(value)
+    if value_type is list or value_type is tuple:
+        return [_serialize_value(item) for item in value]
+    if hasattr(value, "items"):
+        # Plain mappings (e.g. map projections)
+        return dict(value)
+    return value
+
+
+# Schema needed by the finders: lookups by id start every traversal and
+# find_by_type filters on type. Each entry is (statement, fallback); the
+# fallback covers databases where an existing plain index on Atom.id (as
+# created by scripts/sync_graph_to_neo4j.py) or duplicate ids block the constraint.
+_SCHEMA_STATEMENTS = (
+    (
+        "CREATE CONSTRAINT atom_id_unique IF NOT EXISTS FOR (a:Atom) REQUIRE a.id IS UNIQUE",
+        "CREATE INDEX atom_id_index IF NOT EXISTS FOR (a:Atom) ON (a.id)",
+    ),
+    ("CREATE INDEX atom_type_index IF NOT EXISTS FOR (a:Atom) ON (a.type)", None),
+)
+
+
+def _ensure_indexes_enabled() -> bool:
+    """Whether clients should create the Atom schema on connect (NEO4J_ENSURE_INDEXES=1)."""
+    return os.environ.get("NEO4J_ENSURE_INDEXES", "").lower() in ("1", "true", "yes")
+
+
+def _validate_max_depth(max_depth: int) -> None:
+    """Reject traversal depths outside 1..5."""
+    # SECURITY: Validate max_depth to prevent DoS via unbounded traversal
+    if not isinstance(max_depth, int) or not (1 <= max_depth <= 5):
+        raise ValueError("max_depth must be an integer between 1 and 5")
+
+
+# Properties returned for atoms reached by a traversal. Projecting them (and
+# relationship types instead of whole relationships) keeps long text fields
+# such as summary/description off the wire for every traversed row.
+DEFAULT_ATOM_PROJECTION = ".id, .type, .name, .title"
+# Atom properties copied into neighbours' cached traversal rows; a write to one
+# of these makes every cached traversal potentially stale
+PROJECTED_ATOM_FIELDS = frozenset(field.strip().lstrip(".") for field in DEFAULT_ATOM_PROJECTION.split(","))
+
+# Traversals use APOC path expansion so max_depth is a query parameter: one cached
+# plan per query instead of one per depth. NODE_GLOBAL visits each node once.
+_UPSTREAM_QUERY = f"""
+        MATCH (a:Atom {{id: $atom_id}})
+        CALL apoc.path.expandConfig(a, {{
+            relationshipFilter: 'requires>|depends_on>',
+            minLevel: 1,
+            maxLevel: $max_depth,
+            uniqueness: 'NODE_GLOBAL'
+        }}) YIELD path
+        RETURN last(nodes(path)) {{{DEFAULT_ATOM_PROJECTION}}} as upstream,
+               [rel IN relationships(path) | type(rel)] as rel_path,
+               length(path) as depth
+        ORDER BY depth ASC
+        """
+
+_DOWNSTREAM_QUERY = f"""
+        MATCH (a:Atom {{id: $atom_id}})
+        CALL apoc.path.expandConfig(a, {{
+            relationshipFilter: '<requires|<depends_on|<affects',
+            minLevel: 1,
+            maxLevel: $max_depth,
+            uniqueness: 'NODE_GLOBAL'
+        }}) YIELD path
+        RETURN last(nodes(path)) {{{DEFAULT_ATOM_PROJECTION}}} as downstream,
+               [rel IN relationships(path) | type(rel)] as rel_path,
+               length(path) as depth
+        ORDER BY depth ASC
+        """
+
+_UPSTREAM_BATCH_QUERY = f"""
+        UNWIND $atom_ids AS atom_id
+        MATCH (a:Atom {{id: atom_id}})
+        CALL apoc.path.expandConfig(a, {{
+            relationshipFilter: 'requires>|depends_on>',
+            minLevel: 1,
+            maxLevel: $max_depth,
+            uniqueness: 'NODE_GLOBAL'
+        }}) YIELD path
+        RETURN atom_id,
+               last(nodes(path)) {{{DEFAULT_ATOM_PROJECTION}}} as upstream,
+               [rel IN relationships(path) | type(rel)] as rel_path,
+               length(path) as depth
+        ORDER BY atom_id, depth ASC
+        """
+
+_DOWNSTREAM_BATCH_QUERY = f"""
+        UNWIND $atom_ids AS atom_id
+        MATCH (a:Atom {{id: atom_id}})
+        CALL apoc.path.expandConfig(a, {{
+            relationshipFilter: '<requires|<depends_on|<affects',
+            minLevel: 1,
+            maxLevel: $max_depth,
+            uniqueness: 'NODE_GLOBAL'
+        }}) YIELD path
+        RETURN atom_id,
+               last(nodes(path)) {{{DEFAULT_ATOM_PROJECTION}}} as downstream,
+               [rel IN relationships(path) | type(rel)] as rel_path,
+               length(path) as depth
+        ORDER BY atom_id, depth ASC
+        """
+
+
+def _group_by_atom(records: List[Dict[str, Any]], atom_ids: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+    """Split batched traversal rows back out per requested atom id."""
+    grouped: Dict[str, List[Dict[str, Any]]] = {atom_id: [] for atom_id in atom_ids}
+    for record in records:
+        grouped.setdefault(record.pop("atom_id"), []).append(record)
+    return grouped
+
+
+# RELATIONSHIP_PATH enumerates every path like a variable-length match, so
+# connection_count still counts the paths reaching each related atom
+_FULL_CONTEXT_QUERY = f"""
+        MATCH (a:Atom {{id: $atom_id}})
+        CALL apoc.path.expandConfig(a, {{
+            minLevel: 0,
+            maxLevel: $max_depth,
+            uniqueness: 'RELATIONSHIP_PATH'
+        }}) YIELD path
+        WITH last(nodes(path)) as related, count(*) as connection_count
+        ORDER BY connection_count DESC
+        SKIP $skip
+        LIMIT $limit
+        RETURN related {{{DEFAULT_ATOM_PROJECTION}}} as related, connection_count
+        """
+
+
+_CENTER_ATOM_QUERY = "MATCH (a:Atom {id: $atom_id}) RETURN a"
+# Walks requirement <- design <- procedure <- validation once, in one round-trip
+_IMPLEMENTATION_CHAIN_QUERY = """
+        MATCH (r:Atom {id: $id})
+        OPTIONAL MATCH (d:Atom)-[:implements]->(r)
+        OPTIONAL MATCH (p:Atom)-[:implements]->(d)
+        OPTIONAL MATCH (v:Atom)-[:validates]->(p)
+        RETURN r,
+               collect(DISTINCT d) AS designs,
+               collect(DISTINCT p) AS procedures,
+               collect(DISTINCT v) AS validations
+        """
+# Ordered so SKIP/LIMIT pages are stable
+_FIND_BY_TYPE_QUERY = """
+                MATCH (a:Atom)
+                WHERE a.type = $atom_type
+                RETURN a
+                ORDER BY a.id
+                SKIP $skip
+                LIMIT $limit
+                """
+# One grouped scan; the total is the sum of the per-type counts
+_ATOMS_BY_TYPE_QUERY = "MATCH (a:Atom) RETURN a.type as type, count(a) as count ORDER BY count DESC"
+# Server info and graph counts in one round-trip; the ungrouped counts in the
+# subqueries are answered from the store's count statistics, not a scan
+_HEALTH_STATS_QUERY = """
+        CALL dbms.components() YIELD name, versions, edition
+        CALL { MATCH (a:Atom) RETURN count(a) AS atom_count }
+        CALL { MATCH ()-[r]->() RETURN count(r) AS relationship_count }
+        RETURN {name: name, versions: versions, edition: edition} AS database, atom_count, relationship_count
+        LIMIT 1
+        """
+
+
+def _health_status(stats: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Build the connected health_check payload from a _HEALTH_STATS_QUERY row."""
+    return {
+        "status": "connected",
+        "connected": True,
+        "database": stats["database"] if stats else None,
+        "graph_stats": {
+            "atom_count": stats["atom_count"] if stats else 0,
+            "relationship_count": stats["relationship_count"] if stats else 0,
+        },
+    }
+
+
+def _implementation_chain(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape the single implementation chain row like one record per atom."""
+    return {
+        "requirement": {"r": dict(row["r"])},
+        "designs": [{"d": dict(node)} for node in row["designs"]],
+        "procedures": [{"p": dict(node)} for node in row["procedures"]],
+        "validations": [{"v": dict(node)} for node in row["validations"]],
+    }
 
 
 class Neo4jClient:
@@ -33,11 +258,15 @@ class Neo4jClient:
     - Health checks and connection management
     """
 
+    database: Optional[str] = None
+    fetch_size: int = DEFAULT_FETCH_SIZE
+
     def __init__(
         self,
         uri: Optional[str] = None,
         user: Optional[str] = None,
         password: Optional[str] = None,
+        database: Optional[str] = None,
     ):
         """
         Initialize Neo4j client with connection parameters.
@@ -46,10 +275,14 @@ class Neo4jClient:
             uri: Neo4j connection URI (default: env var NEO4J_URI or "neo4j://localhost:7687")
             user: Neo4j username (default: env var NEO4J_USER or "neo4j")
             password: Neo4j password (default: env var NEO4J_PASSWORD)
+            database: Target database (default: env var NEO4J_DATABASE or "neo4j").
+                Naming it saves the driver a home-database lookup per session.
         """
         self.uri = uri or os.environ.get("NEO4J_URI", "neo4j://localhost:7687")
         self.user = user or os.environ.get("NEO4J_USER", "neo4j")
         self.password = password or os.environ.get("NEO4J_PASSWORD")
+        self.database = database or os.environ.get("NEO4J_DATABASE", "neo4j")
+        self.fetch_size = int(os.environ.get("NEO4J_FETCH_SIZE", DEFAULT_FETCH_SIZE))
 
         if not self.password:
             raise ValueError(
@@ -58,6 +291,7 @@ class Neo4jClient:
             )
 
         self.driver = None
+        self._traversal_cache = Cache(ttl_seconds=TRAVERSAL_CACHE_TTL_SECONDS, max_entries=TRAVERSAL_CACHE_MAX_ENTRIES)
         self._connect()
 
     def _connect(self) -> None:
@@ -71,30 +305,98 @@ class Neo4jClient:
             self.driver = GraphDatabase.driver(
                 self.uri,
                 auth=(self.user, self.password),
-                encrypted=False,
+                **_driver_options(),
             )
             # Test the connection
-            with self.driver.session() as session:
+            with self.driver.session(database=self.database) as session:
                 session.run("RETURN 1")
         except Exception as e:
             raise ConnectionError(f"Failed to connect to Neo4j at {self.uri}: {e}")
 
+        if _ensure_indexes_enabled():
+            self._ensure_indexes()
+
+    def _ensure_indexes(self) -> None:
+        """Create the Atom id constraint and type index if missing; failures are logged, not raised."""
+        with self.driver.session(database=self.database) as session:
+            for statement, fallback in _SCHEMA_STATEMENTS:
+                try:
+                    session.run(statement).consume()
+                except Neo4jError as e:
+                    if fallback is None:
+                        logger.warning(f"Could not apply Neo4j schema statement {statement!r}: {e}")
+                        continue
+                    logger.warning(f"Could not create Atom id constraint, falling back to an index: {e}")
+                    try:
+                        session.run(fallback).consume()
+                    except Neo4jError as e:
+                        logger.warning(f"Could not apply Neo4j schema statement {fallback!r}: {e}")
+
     def is_connected(self) -> bool:
         """
         Check if client is connected to Neo4j database.
 
+        Pings through the driver's connectivity check rather than opening a
+        session, so frequent liveness probes do not hold pool slots.
+
         Returns:
             True if connected, False otherwise
         """
         if self.driver is None:
             return False
         try:
-            with self.driver.session() as session:
-                session.run("RETURN 1")
+            self.driver.verify_connectivity()
             return True
         except Exception:
             return False
 
+    def _read_session(self):
+        """Open a read-mode session so cluster routing can send it to a follower."""
+        return self.driver.session(database=self.database, default_access_mode=READ_ACCESS, fetch_size=self.fetch_size)
+
+    def _cached(self, atom_id: str, key: str, load: Callable[[], Any]) -> Any:
+        """
+        Return a cached traversal result for ``atom_id``, loading it on a miss.
+
+        Results reporting an ``error`` (e.g. atom not found) are not cached so
+        a newly created atom shows up immediately.
+        """
+        cache_key = f"{atom_id}|{key}"
+        result = self._traversal_cache.get(cache_key)
+        if result is None:
+            result = load()
+            if not (isinstance(result, dict) and "error" in result):
+                self._traversal_cache.set(cache_key, result)
+        return result
+
+    def invalidate(self, atom_id: Optional[str] = None) -> None:
+        """
+        Evict cached traversal results after a graph write.
+
+        Args:
+            atom_id: Atom whose traversals are stale, or None to drop every
+                cached traversal (e.g. after adding a relationship, which can
+                change the neighbourhood of many atoms)
+        """
+        if atom_id is None:
+            self._traversal_cache.clear()
+        else:
+            self._traversal_cache.invalidate_prefix(f"{atom_id}|")
+
+    def _read(self, query: str, **params: Any) -> List[Dict[str, Any]]:
+        """
+        Run a read query in a managed read transaction.
+
+        Records are serialized inside the transaction, which the driver
+        retries on transient errors.
+        """
+
+        def work(tx):
+            return [self._serialize_record(record) for record in tx.run(query, **params)]
+
+        with self._read_session() as session:
+            return session.execute_read(work)
+
     def find_upstream_dependencies(
         self,
         atom_id: str,
@@ -115,23 +417,14 @@ class Neo4jClient:
         if not self.driver:
             raise ConnectionError("Not connected to Neo4j")
 
-        # SECURITY: Validate max_depth to prevent DoS via unbounded traversal
-        if not isinstance(max_depth, int) or not (1 <= max_depth <= 5):
-            raise ValueError("max_depth must be an integer between 1 and 5")
-
-        query = f"""
-        MATCH (a:Atom {{id: $atom_id}})
-        -[r:requires|depends_on*1..{max_depth}]->(upstream)
-        RETURN DISTINCT upstream,
-               relationships(r) as rel_path,
-               length(r) as depth
-        ORDER BY depth ASC
-        """
+        _validate_max_depth(max_depth)
 
         try:
-            with self.driver.session() as session:
-                result = session.run(query, atom_id=atom_id)
-                return [self._serialize_record(record) for record in result]
+            return self._cached(
+                atom_id,
+                f"upstream:{max_depth}",
+                lambda: self._read(_UPSTREAM_QUERY, atom_id=atom_id, max_depth=max_depth),
+            )
         except DatabaseError as e:
             raise DatabaseError(f"Error finding upstream dependencies for {atom_id}: {e}")
 
@@ -156,31 +449,107 @@ class Neo4jClient:
         if not self.driver:
             raise ConnectionError("Not connected to Neo4j")
 
-        # SECURITY: Validate max_depth to prevent DoS via unbounded traversal
-        if not isinstance(max_depth, int) or not (1 <= max_depth <= 5):
-            raise ValueError("max_depth must be an integer between 1 and 5")
+        _validate_max_depth(max_depth)
 
-        query = f"""
-        MATCH (a:Atom {{id: $atom_id}})
-        <-[r:requires|depends_on|affects*1..{max_depth}]-(downstream)
-        RETURN DISTINCT downstream,
-               relationships(r) as rel_path,
-               length(r) as depth
-        ORDER BY depth ASC
+        try:
+            return self._cached(
+                atom_id,
+                f"downstream:{max_depth}",
+                lambda: self._read(_DOWNSTREAM_QUERY, atom_id=atom_id, max_depth=max_depth),
+            )
+        except DatabaseError as e:
+            raise DatabaseError(f"Error finding downstream impacts for {atom_id}: {e}")
+
+    def find_downstream_impacts_iter(
+        self,
+        atom_id: str,
+        max_depth: int = 3,
+    ) -> Iterator[Dict[str, Any]]:
         """
+        Stream downstream impacts for an atom one record at a time.
+
+        Records are pulled from the server fetch_size at a time, so a hub atom
+        with thousands of dependents is never buffered in full, and a caller
+        that stops early leaves the rest of the result unfetched. Results are
+        not cached; use find_downstream_impacts for a cached list.
+
+        Args:
+            atom_id: ID of the atom to search from
+            max_depth: Maximum relationship depth to traverse (default: 3)
+
+        Yields:
+            Downstream atoms with relationship information, nearest first
+        """
+        if not self.driver:
+            raise ConnectionError("Not connected to Neo4j")
+
+        _validate_max_depth(max_depth)
 
         try:
-            with self.driver.session() as session:
-                result = session.run(query, atom_id=atom_id)
-                return [self._serialize_record(record) for record in result]
+            with self._read_session() as session:
+                for record in session.run(_DOWNSTREAM_QUERY, atom_id=atom_id, max_depth=max_depth):
+                    yield self._serialize_record(record)
         except DatabaseError as e:
             raise DatabaseError(f"Error finding downstream impacts for {atom_id}: {e}")
 
+    def find_upstream_dependencies_batch(
+        self,
+        atom_ids: List[str],
+        max_depth: int = 3,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Find upstream dependencies for several atoms in one round-trip.
+
+        Args:
+            atom_ids: IDs of the atoms to search from
+            max_depth: Maximum relationship depth to traverse (default: 3)
+
+        Returns:
+            Mapping of atom ID to its upstream atoms (same rows as
+            find_upstream_dependencies); every requested ID is present
+        """
+        if not self.driver:
+            raise ConnectionError("Not connected to Neo4j")
+        _validate_max_depth(max_depth)
+
+        try:
+            records = self._read(_UPSTREAM_BATCH_QUERY, atom_ids=list(atom_ids), max_depth=max_depth)
+            return _group_by_atom(records, atom_ids)
+        except DatabaseError as e:
+            raise DatabaseError(f"Error finding upstream dependencies for {len(atom_ids)} atoms: {e}")
+
+    def find_downstream_impacts_batch(
+        self,
+        atom_ids: List[str],
+        max_depth: int = 3,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Find downstream impacts for several atoms in one round-trip.
+
+        Args:
+            atom_ids: IDs of the atoms to search from
+            max_depth: Maximum relationship depth to traverse (default: 3)
+
+        Returns:
+            Mapping of atom ID to its downstream atoms (same rows as
+            find_downstream_impacts); every requested ID is present
+        """
+        if not self.driver:
+            raise ConnectionError("Not connected to Neo4j")
+        _validate_max_depth(max_depth)
+
+        try:
+            records = self._read(_DOWNSTREAM_BATCH_QUERY, atom_ids=list(atom_ids), max_depth=max_depth)
+            return _group_by_atom(records, atom_ids)
+        except DatabaseError as e:
+            raise DatabaseError(f"Error finding downstream impacts for {len(atom_ids)} atoms: {e}")
+
     def find_full_context(
         self,
         atom_id: str,
         max_depth: int = 2,
         limit: int = 20,
+        skip: int = 0,
     ) -> Dict[str, Any]:
         """
         Get comprehensive bidirectional context for an atom.
@@ -192,6 +561,7 @@ class Neo4jClient:
             atom_id: ID of the atom to search from
             max_depth: Maximum relationship depth (default: 2)
             limit: Maximum number of related atoms to return (default: 20)
+            skip: Number of related atoms to skip, for paging (default: 0)
 
         Returns:
             Dictionary containing the atom, its upstream deps, and downstream impacts
@@ -199,37 +569,35 @@ class Neo4jClient:
         if not self.driver:
             raise ConnectionError("Not connected to Neo4j")
 
-        # SECURITY: Validate max_depth to prevent DoS via unbounded traversal
-        if not isinstance(max_depth, int) or not (1 <= max_depth <= 5):
-            raise ValueError("max_depth must be an integer between 1 and 5")
+        _validate_max_depth(max_depth)
 
-        query = f"""
-        MATCH (a:Atom {{id: $atom_id}})
-        -[r*0..{max_depth}]-(related)
-        RETURN DISTINCT related, count(*) as connection_count
-        ORDER BY connection_count DESC
-        LIMIT $limit
-        """
+        def work(tx):
+            # Get the center atom
+            center_records = tx.run(_CENTER_ATOM_QUERY, atom_id=atom_id).data()
+            if not center_records:
+                return None, []
+
+            # Get related atoms
+            result = tx.run(_FULL_CONTEXT_QUERY, atom_id=atom_id, max_depth=max_depth, skip=skip, limit=limit)
+            related = [self._serialize_record(record) for record in result]
+            # data() has already turned the node into a plain dict
+            return center_records[0], related
+
+        def load():
+            with self._read_session() as session:
+                center_atom, related_atoms = session.execute_read(work)
+
+            if center_atom is None:
+                return {"error": f"Atom {atom_id} not found", "atom": None}
+
+            return {
+                "center": center_atom,
+                "related": related_atoms,
+                "total_related": len(related_atoms),
+            }
 
         try:
-            with self.driver.session() as session:
-                # Get the center atom
-                center_result = session.run("MATCH (a:Atom {id: $atom_id}) RETURN a", atom_id=atom_id)
-                center_records = center_result.data()
-                if not center_records:
-                    return {"error": f"Atom {atom_id} not found", "atom": None}
-
-                center_atom = self._serialize_record(center_records[0])
-
-                # Get related atoms
-                result = session.run(query, atom_id=atom_id, limit=limit)
-                related_atoms = [self._serialize_record(record) for record in result]
-
-                return {
-                    "center": center_atom,
-                    "related": related_atoms,
-                    "total_related": len(related_atoms),
-                }
+            return self._cached(atom_id, f"full_context:{max_depth}:{limit}:{skip}", load)
         except DatabaseError as e:
             raise DatabaseError(f"Error finding full context for {atom_id}: {e}")
 
@@ -253,44 +621,17 @@ class Neo4jClient:
         if not self.driver:
             raise ConnectionError("Not connected to Neo4j")
 
+        def load():
+            with self._read_session() as session:
+                rows = session.execute_read(lambda tx: tx.run(_IMPLEMENTATION_CHAIN_QUERY, id=requirement_id).data())
+
+            if not rows:
+                return {"error": f"Requirement {requirement_id} not found"}
+
+            return _implementation_chain(rows[0])
+
         try:
-            with self.driver.session() as session:
-                # Find the requirement
-                req_result = session.run("MATCH (r:Atom {id: $id}) RETURN r", id=requirement_id)
-                req_data = req_result.data()
-                if not req_data:
-                    return {"error": f"Requirement {requirement_id} not found"}
-
-                # Find designs that implement this requirement
-                design_result = session.run(
-                    """MATCH (d:Atom)-[impl:implements]->(r:Atom {id: $id})
-                       RETURN DISTINCT d""",
-                    id=requirement_id,
-                )
-
-                # Find procedures that implement the designs
-                proc_result = session.run(
-                    """MATCH (p:Atom)-[impl:implements]->(d:Atom)
-                       -[impl2:implements]->(r:Atom {id: $id})
-                       RETURN DISTINCT p""",
-                    id=requirement_id,
-                )
-
-                # Find validations that validate the procedures
-                val_result = session.run(
-                    """MATCH (v:Atom)-[val:validates]->(p:Atom)
-                       -[impl:implements]->(d:Atom)
-                       -[impl2:implements]->(r:Atom {id: $id})
-                       RETURN DISTINCT v""",
-                    id=requirement_id,
-                )
-
-                return {
-                    "requirement": self._serialize_record(req_data[0]) if req_data else None,
-                    "designs": [self._serialize_record(r) for r in design_result.data()],
-                    "procedures": [self._serialize_record(r) for r in proc_result.data()],
-                    "validations": [self._serialize_record(r) for r in val_result.data()],
-                }
+            return self._cached(requirement_id, "implementation_chain", load)
         except DatabaseError as e:
             raise DatabaseError(f"Error tracing implementation chain for {requirement_id}: {e}")
 
@@ -298,6 +639,7 @@ class Neo4jClient:
         self,
         atom_type: str,
         limit: int = 50,
+        skip: int = 0,
     ) -> List[Dict[str, Any]]:
         """
         Find all atoms of a specific type.
@@ -306,23 +648,48 @@ class Neo4jClient:
             atom_type: Type of atom to search for (e.g., 'requirement', 'design',
                       'procedure', 'validation', 'policy', 'risk')
             limit: Maximum number of atoms to return (default: 50)
+            skip: Number of atoms to skip, for paging (default: 0)
 
         Returns:
-            List of atoms of the specified type
+            List of atoms of the specified type, ordered by ID
         """
         if not self.driver:
             raise ConnectionError("Not connected to Neo4j")
 
         try:
-            with self.driver.session() as session:
-                query = """
-                MATCH (a:Atom)
-                WHERE a.type = $atom_type
-                RETURN a
-                LIMIT $limit
-                """
-                result = session.run(query, atom_type=atom_type.lower(), limit=limit)
-                return [self._serialize_record(record) for record in result]
+            return self._read(_FIND_BY_TYPE_QUERY, atom_type=atom_type.lower(), skip=skip, limit=limit)
+        except DatabaseError as e:
+            raise DatabaseError(f"Error finding atoms of type {atom_type}: {e}")
+
+    def find_by_type_iter(
+        self,
+        atom_type: str,
+        limit: int = 50,
+        skip: int = 0,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream atoms of a specific type one record at a time.
+
+        Unlike find_by_type, records are serialized as they arrive instead of
+        being collected into a list, so large pages are never held in memory at
+        once. The session stays open until the generator is exhausted or closed.
+
+        Args:
+            atom_type: Type of atom to search for
+            limit: Maximum number of atoms to yield (default: 50)
+            skip: Number of atoms to skip, for paging (default: 0)
+
+        Yields:
+            Serialized atom records, ordered by ID
+        """
+        if not self.driver:
+            raise ConnectionError("Not connected to Neo4j")
+
+        try:
+            with self._read_session() as session:
+                result = session.run(_FIND_BY_TYPE_QUERY, atom_type=atom_type.lower(), skip=skip, limit=limit)
+                for record in result:
+                    yield self._serialize_record(record)
         except DatabaseError as e:
             raise DatabaseError(f"Error finding atoms of type {atom_type}: {e}")
 
@@ -337,21 +704,11 @@ class Neo4jClient:
             raise ConnectionError("Not connected to Neo4j")
 
         try:
-            with self.driver.session() as session:
-                # Total count
-                total_result = session.run("MATCH (a:Atom) RETURN count(a) as total")
-                total = total_result.single()["total"] if total_result else 0
-
-                # Count by type
-                by_type_result = session.run(
-                    "MATCH (a:Atom) RETURN a.type as type, count(a) as count " "ORDER BY count DESC"
-                )
-                by_type = {record["type"]: record["count"] for record in by_type_result}
-
-                return {
-                    "total": total,
-                    "by_type": by_type,
-                }
+            by_type = {record["type"]: record["count"] for record in self._read(_ATOMS_BY_TYPE_QUERY)}
+            return {
+                "total": sum(by_type.values()),
+                "by_type": by_type,
+            }
         except DatabaseError as e:
             raise DatabaseError(f"Error counting atoms: {e}")
 
@@ -369,26 +726,8 @@ class Neo4jClient:
             }
 
         try:
-            with self.driver.session() as session:
-                # Check connection
-                session.run("RETURN 1")
-
-                # Get database info
-                db_info = session.run("CALL dbms.components()").data()
-
-                # Get graph stats
-                atom_count = session.run("MATCH (a:Atom) RETURN count(a) as count").single()
-                rel_count = session.run("MATCH ()-[r]->() RETURN count(r) as count").single()
-
-                return {
-                    "status": "connected",
-                    "connected": True,
-                    "database": db_info[0] if db_info else None,
-                    "graph_stats": {
-                        "atom_count": atom_count["count"] if atom_count else 0,
-                        "relationship_count": rel_count["count"] if rel_count else 0,
-                    },
-                }
+            rows = self._read(_HEALTH_STATS_QUERY)
+            return _health_status(rows[0] if rows else None)
         except Exception as e:
             return {
                 "status": "error",
@@ -413,23 +752,16 @@ class Neo4jClient:
         Returns:
             Serializable dictionary representation
         """
-        if hasattr(record, "items"):
-            # It's a dictionary-like record
-            result = {}
-            for key, value in record.items():
-                if hasattr(value, "items"):
-                    # It's a node
-                    result[key] = dict(value)
-                elif isinstance(value, (list, tuple)):
-                    result[key] = [dict(v) if hasattr(v, "items") else v for v in value]
-                else:
-                    result[key] = value
-            return result
-        elif hasattr(record, "_properties"):
-            # It's a Neo4j Node
+        record_type = type(record)
+        if record_type is Record:
+            # Record is a tuple of values; pairing with keys() avoids per-key lookups
+            return {key: _serialize_value(value) for key, value in zip(record.keys(), record)}
+        if record_type is Node:
             return dict(record)
-        else:
-            return {"value": str(record)}
+        if hasattr(record, "items"):
+            # Other dictionary-like records (plain dicts, test doubles)
+            return {key: _serialize_value(value) for key, value in record.items()}
+        return {"value": str(record)}
 
     def __enter__(self):
         """Context manager entry."""
@@ -442,6 +774,8 @@ class Neo4jClient:
 
 # Global singleton instance
 _neo4j_client: Optional[Neo4jClient] = None
+# Guards creation so concurrent first calls do not open two driver pools
+_client_lock = threading.Lock()
 
 
 def get_neo4j_client() -> Neo4jClient:
@@ -466,7 +800,9 @@ def get_neo4j_client() -> Neo4jClient:
     global _neo4j_client
 
     if _neo4j_client is None:
-        _neo4j_client = Neo4jClient()
+        with _client_lock:
+            if _neo4j_client is None:
+                _neo4j_client = Neo4jClient()
 
     return _neo4j_client
 
@@ -479,6 +815,7 @@ def close_neo4j_client() -> None:
     """
     global _neo4j_client
 
-    if _neo4j_client is not None:
-        _neo4j_client.close()
-        _neo4j_client = None
+    with _client_lock:
+        if _neo4j_client is not None:
+            _neo4j_client.close()
+            _neo4j_client = None
@@ -9,13 +9,26 @@ Provides workflow orchestration components:
 
 from .event_bus import Event, EventBus, EventType, get_event_bus, setup_default_handlers
 from .task_router import AssignmentMethod, TaskRouter
-from .workflow_engine import ProcessStatus, SLAStatus, TaskStatus, WorkflowEngine
+from .workflow_engine import (
+    InvalidTransitionError,
+    ProcessStatus,
+    SLAStatus,
+    TaskStatus,
+    WorkflowEngine,
+    WorkflowNotFoundError,
+    close_workflow_engine,
+    get_workflow_engine,
+)
 
 __all__ = [
     "WorkflowEngine",
+    "get_workflow_engine",
+    "close_workflow_engine",
     "ProcessStatus",
     "TaskStatus",
     "SLAStatus",
+    "InvalidTransitionError",
+    "WorkflowNotFoundError",
     "TaskRouter",
     "AssignmentMethod",
     "EventBus",
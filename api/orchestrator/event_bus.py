@@ -5,11 +5,22 @@ Pub/sub system for decoupled communication between workflow components.
 """
 
 import asyncio
+import json
 import logging
-from collections import defaultdict
+import threading
+import time
+from collections import deque
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional
+from itertools import islice
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 logger = logging.getLogger(__name__)
 
@@ -48,7 +59,14 @@ class EventType(str, Enum):
 
 
 class Event:
-    """Event object"""
+    """
+    Event object
+
+    Only the integer creation time is captured on publish; the datetime,
+    event ID and dict form are derived on first access.
+    """
+
+    __slots__ = ("event_type", "data", "source", "correlation_id", "timestamp_ns", "_timestamp", "_event_id", "_dict")
 
     def __init__(
         self, event_type: EventType, data: Dict[str, Any], source: str = "system", correlation_id: Optional[str] = None
@@ -57,19 +75,37 @@ class Event:
         self.data = data
         self.source = source
         self.correlation_id = correlation_id
-        self.timestamp = datetime.now()
-        self.event_id = f"{event_type.value}-{self.timestamp.timestamp()}"
+        self.timestamp_ns = time.time_ns()
+        self._timestamp: Optional[datetime] = None
+        self._event_id: Optional[str] = None
+        self._dict: Optional[Dict[str, Any]] = None
+
+    @property
+    def timestamp(self) -> datetime:
+        """Local creation time"""
+        if self._timestamp is None:
+            self._timestamp = datetime.fromtimestamp(self.timestamp_ns / 1e9)
+        return self._timestamp
+
+    @property
+    def event_id(self) -> str:
+        """Event ID: '<event type>-<epoch seconds>'"""
+        if self._event_id is None:
+            self._event_id = f"{self.event_type.value}-{self.timestamp_ns / 1e9}"
+        return self._event_id
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert event to dictionary"""
-        return {
-            "event_id": self.event_id,
-            "event_type": self.event_type.value,
-            "data": self.data,
-            "source": self.source,
-            "correlation_id": self.correlation_id,
-            "timestamp": self.timestamp.isoformat(),
-        }
+        """Convert event to dictionary (built once; treat the result as read-only)"""
+        if self._dict is None:
+            self._dict = {
+                "event_id": self.event_id,
+                "event_type": self.event_type.value,
+                "data": self.data,
+                "source": self.source,
+                "correlation_id": self.correlation_id,
+                "timestamp": self.timestamp.isoformat(),
+            }
+        return self._dict
 
 
 EventHandler = Callable[[Event], None]
@@ -88,21 +124,39 @@ class EventBus:
     """
 
     _instance: Optional["EventBus"] = None
+    # Guards creation and first initialization so concurrent callers share one bus
+    # (reentrant: get_event_bus holds it while constructing)
+    _lock = threading.RLock()
 
     def __new__(cls):
         if cls._instance is None:
-            cls._instance = super(EventBus, cls).__new__(cls)
-            cls._instance._initialized = False
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super(EventBus, cls).__new__(cls)
+                    instance._initialized = False
+                    cls._instance = instance
         return cls._instance
 
     def __init__(self):
         if self._initialized:
             return
-
-        self._subscribers: Dict[EventType, List[EventHandler]] = defaultdict(list)
-        self._wildcard_subscribers: List[EventHandler] = []
-        self._event_history: List[Event] = []
+        with self._lock:
+            if not self._initialized:
+                self._initialize()
+
+    def _initialize(self):
+        """Set up subscriber tables and history. Caller must hold the lock."""
+        # Copy-on-write: (un)subscribe swaps in new tuples under the lock, so
+        # publishers always iterate an immutable snapshot without locking
+        self._subscribers: Dict[EventType, Tuple[EventHandler, ...]] = {}
+        self._wildcard_subscribers: Tuple[EventHandler, ...] = ()
+        # Typed + wildcard handlers merged per event type; rebuilt lazily after (un)subscribe
+        self._effective: Dict[EventType, Tuple[EventHandler, ...]] = {}
+        # The same handlers split into (coroutine, sync) for publish_async
+        self._partitioned: Dict[EventType, Tuple[Tuple[EventHandler, ...], Tuple[EventHandler, ...]]] = {}
         self._max_history = 1000
+        # Oldest events fall off the left end in O(1) once the cap is reached
+        self._event_history: Deque[Event] = deque(maxlen=self._max_history)
         self._initialized = True
 
         logger.info("EventBus initialized")
@@ -115,7 +169,9 @@ class EventBus:
             event_type: Type of event to listen for
             handler: Callback function to handle event
         """
-        self._subscribers[event_type].append(handler)
+        with self._lock:
+            self._subscribers[event_type] = self._subscribers.get(event_type, ()) + (handler,)
+            self._invalidate_handlers()
         logger.info(f"Subscribed to {event_type.value}: {handler.__name__}")
 
     def subscribe_all(self, handler: EventHandler):
@@ -125,7 +181,9 @@ class EventBus:
         Args:
             handler: Callback function to handle all events
         """
-        self._wildcard_subscribers.append(handler)
+        with self._lock:
+            self._wildcard_subscribers = self._wildcard_subscribers + (handler,)
+            self._invalidate_handlers()
         logger.info(f"Subscribed to all events: {handler.__name__}")
 
     def unsubscribe(self, event_type: EventType, handler: EventHandler):
@@ -136,9 +194,51 @@ class EventBus:
             event_type: Event type to unsubscribe from
             handler: Handler to remove
         """
-        if handler in self._subscribers[event_type]:
-            self._subscribers[event_type].remove(handler)
-            logger.info(f"Unsubscribed from {event_type.value}: {handler.__name__}")
+        with self._lock:
+            handlers = self._subscribers.get(event_type, ())
+            if handler not in handlers:
+                return
+            index = handlers.index(handler)
+            remaining = handlers[:index] + handlers[index + 1 :]
+            if remaining:
+                self._subscribers[event_type] = remaining
+            else:
+                del self._subscribers[event_type]
+            self._invalidate_handlers()
+        logger.info(f"Unsubscribed from {event_type.value}: {handler.__name__}")
+
+    def _invalidate_handlers(self):
+        """
+        Drop merged handler tuples after the subscriber tables change.
+
+        The caches are replaced rather than cleared, so a publisher that
+        merged from the old tables can only write into the discarded dicts.
+        """
+        self._effective = {}
+        self._partitioned = {}
+
+    def _handlers_for(self, event_type: EventType) -> Tuple[EventHandler, ...]:
+        """Handlers for an event type followed by wildcard handlers"""
+        effective = self._effective
+        handlers = effective.get(event_type)
+        if handlers is None:
+            handlers = self._subscribers.get(event_type, ()) + self._wildcard_subscribers
+            effective[event_type] = handlers
+        return handlers
+
+    def _async_handlers_for(self, event_type: EventType) -> Tuple[Tuple[EventHandler, ...], Tuple[EventHandler, ...]]:
+        """Handlers for an event type split into coroutine and sync handlers, classified once"""
+        cache = self._partitioned
+        partitioned = cache.get(event_type)
+        if partitioned is None:
+            handlers = self._handlers_for(event_type)
+            is_async = [asyncio.iscoroutinefunction(h) for h in handlers]
+            partitioned = (
+                tuple(h for h, a in zip(handlers, is_async) if a),
+                tuple(h for h, a in zip(handlers, is_async) if not a),
+            )
+            cache[event_type] = partitioned
+        return partitioned
 
     def publish(
         self, event_type: EventType, data: Dict[str, Any], source: str = "system", correlation_id: Optional[str] = None
@@ -156,26 +256,16 @@ class EventBus:
 
         # Add to history
         self._event_history.append(event)
-        if len(self._event_history) > self._max_history:
-            self._event_history.pop(0)
 
         logger.debug(f"Publishing event: {event_type.value} from {source}")
 
-        # Notify specific subscribers
-        handlers = self._subscribers.get(event_type, [])
-        for handler in handlers:
+        # Notify specific and wildcard subscribers
+        for handler in self._handlers_for(event_type):
             try:
                 handler(event)
             except Exception as e:
                 logger.error(f"Error in event handler {handler.__name__}: {e}", exc_info=True)
 
-        # Notify wildcard subscribers
-        for handler in self._wildcard_subscribers:
-            try:
-                handler(event)
-            except Exception as e:
-                logger.error(f"Error in wildcard handler {handler.__name__}: {e}", exc_info=True)
-
     async def publish_async(
         self, event_type: EventType, data: Dict[str, Any], source: str = "system", correlation_id: Optional[str] = None
     ):
@@ -192,36 +282,14 @@ class EventBus:
 
         # Add to history
         self._event_history.append(event)
-        if len(self._event_history) > self._max_history:
-            self._event_history.pop(0)
 
         logger.debug(f"Publishing async event: {event_type.value} from {source}")
 
-        # Notify specific subscribers
-        handlers = self._subscribers.get(event_type, [])
-        tasks = []
-
-        for handler in handlers:
-            try:
-                if asyncio.iscoroutinefunction(handler):
-                    tasks.append(handler(event))
-                else:
-                    # Run sync handler in executor
-                    loop = asyncio.get_event_loop()
-                    tasks.append(loop.run_in_executor(None, handler, event))
-            except Exception as e:
-                logger.error(f"Error in event handler {handler.__name__}: {e}", exc_info=True)
-
-        # Notify wildcard subscribers
-        for handler in self._wildcard_subscribers:
-            try:
-                if asyncio.iscoroutinefunction(handler):
-                    tasks.append(handler(event))
-                else:
-                    loop = asyncio.get_event_loop()
-                    tasks.append(loop.run_in_executor(None, handler, event))
-            except Exception as e:
-                logger.error(f"Error in wildcard handler {handler.__name__}: {e}", exc_info=True)
+        # Notify specific and wildcard subscribers; sync handlers run in the executor
+        async_handlers, sync_handlers = self._async_handlers_for(event_type)
+        loop = asyncio.get_running_loop()
+        tasks = [handler(event) for handler in async_handlers]
+        tasks.extend(loop.run_in_executor(None, handler, event) for handler in sync_handlers)
 
         # Wait for all handlers to complete
         if tasks:
@@ -238,19 +306,36 @@ class EventBus:
         Returns:
             List of events
         """
-        events = self._event_history
+        # Most recent first
+        events = reversed(self._event_history)
 
         if event_type:
-            events = [e for e in events if e.event_type == event_type]
+            events = (e for e in events if e.event_type == event_type)
 
-        # Return most recent first
-        events = list(reversed(events[-limit:]))
+        return [e.to_dict() for e in islice(events, limit)]
+
+    def get_event_history_json(self, event_type: Optional[EventType] = None, limit: int = 100) -> bytes:
+        """
+        Get recent event history encoded as JSON
 
-        return [e.to_dict() for e in events]
+        Uses orjson when installed so endpoints can return the bytes as-is
+        instead of re-encoding the list with the stdlib encoder.
+
+        Args:
+            event_type: Optional filter by event type
+            limit: Maximum number of events to return
+
+        Returns:
+            UTF-8 JSON array of events, most recent first
+        """
+        events = self.get_event_history(event_type, limit)
+        if HAS_ORJSON:
+            return orjson.dumps(events, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC, default=str)
+        return json.dumps(events, default=str).encode()
 
     def clear_history(self):
         """Clear event history"""
-        self._event_history = []
+        self._event_history.clear()
         logger.info("Event history cleared")
 
     def get_subscriber_count(self, event_type: Optional[EventType] = None) -> int:
@@ -264,7 +349,7 @@ class EventBus:
             Number of subscribers
         """
         if event_type:
-            return len(self._subscribers.get(event_type, []))
+            return len(self._subscribers.get(event_type, ()))
         else:
             total = sum(len(handlers) for handlers in self._subscribers.values())
             total += len(self._wildcard_subscribers)
@@ -280,7 +365,9 @@ def get_event_bus() -> EventBus:
     global _event_bus
 
     if _event_bus is None:
-        _event_bus = EventBus()
+        with EventBus._lock:
+            if _event_bus is None:
+                _event_bus = EventBus()
 
     return _event_bus
 
@@ -0,0 +1,134 @@
+"""
+Process Event Writer
+
+Writes process_events rows off the request path, in multi-row batches,
+for the WorkflowEngine and TaskRouter audit trails.
+"""
+
+import logging
+import queue
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+EVENT_QUEUE_MAX_SIZE = 10_000
+EVENT_BATCH_SIZE = 500
+EVENT_FLUSH_TIMEOUT_SECONDS = 5.0
+_STOP = object()  # Sentinel telling the writer thread to exit
+
+
+class ProcessEventWriter:
+    """
+    Background batch writer for process_events rows
+
+    Rows are stamped with the time they were queued and written to the
+    timestamp column, so events keep their order in the audit trail however
+    long they wait for a flush. When the queue is full, rows are dropped (and
+    counted in dropped_events) rather than blocking the caller.
+    """
+
+    def __init__(
+        self,
+        db,
+        name: str,
+        columns: Sequence[str],
+        placeholders: Optional[Sequence[str]] = None,
+        flush_interval: float = 0.0,
+        max_queue_size: int = EVENT_QUEUE_MAX_SIZE,
+        batch_size: int = EVENT_BATCH_SIZE,
+    ):
+        """
+        Args:
+            db: PostgreSQL client used for execute_values
+            name: Name of the writer thread
+            columns: process_events columns of each queued row, without timestamp
+            placeholders: Per-column SQL placeholders (default %s), e.g. to build
+                a column value in PostgreSQL
+            flush_interval: Seconds to wait for more rows before writing a batch
+            max_queue_size: Maximum queued rows before new rows are dropped
+            batch_size: Maximum rows per INSERT
+        """
+        self.db = db
+        self.name = name
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.dropped_events = 0
+
+        placeholders = list(placeholders or ["%s"] * len(columns))
+        self._query = f"INSERT INTO process_events ({', '.join([*columns, 'timestamp'])}) VALUES %s"
+        self._template = f"({', '.join([*placeholders, '%s'])})"
+
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def put(self, row: Sequence[Any]) -> bool:
+        """
+        Queue a row (one value per column) stamped with the current time
+
+        Returns:
+            False if the queue was full and the row was dropped
+        """
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                    self._thread.start()
+
+        try:
+            self._queue.put_nowait((*row, datetime.now(timezone.utc)))
+        except queue.Full:
+            self.dropped_events += 1
+            logger.warning(f"{self.name} queue full, dropped event ({self.dropped_events} dropped so far)")
+            return False
+
+        return True
+
+    def _run(self):
+        """Write queued rows every flush_interval seconds or batch_size rows until close()"""
+        while True:
+            row = self._queue.get()
+            batch = []
+            deadline = time.monotonic() + self.flush_interval
+            while row is not _STOP:
+                batch.append(row)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    row = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+
+            self._write(batch)
+
+            if row is _STOP:
+                return
+
+    def _write(self, rows: List[tuple]):
+        """Insert rows as multi-row INSERTs, logging (not raising) failures"""
+        if not rows:
+            return
+
+        try:
+            self.db.execute_values(self._query, rows, template=self._template, page_size=self.batch_size)
+        except Exception as e:
+            logger.error(f"Failed to write {len(rows)} process event(s): {e}")
+
+    def close(self):
+        """Flush queued rows and stop the writer thread"""
+        with self._lock:
+            thread, self._thread = self._thread, None
+
+        if thread is None or not thread.is_alive():
+            return
+
+        try:
+            self._queue.put(_STOP, timeout=EVENT_FLUSH_TIMEOUT_SECONDS)
+        except queue.Full:
+            logger.warning(f"{self.name} did not drain its queue, queued events were not written")
+            return
+
+        thread.join(timeout=EVENT_FLUSH_TIMEOUT_SECONDS)
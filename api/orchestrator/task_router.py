@@ -8,15 +8,93 @@ Handles task routing using different assignment strategies:
 - Manual: Direct assignment
 """
 
+import atexit
+import heapq
 import logging
-from enum import Enum
-from typing import Any, Dict, List, Optional
+import os
+from collections import Counter
+from enum import Enum, unique
+from itertools import chain
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
-from ..database import get_postgres_client
+import yaml
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+from ..cache import Cache
+from ..database import get_postgres_client, get_redis_client
+from .event_bus import Event, EventType, get_event_bus
+from .event_writer import ProcessEventWriter
+from .workflow_engine import _TASK_STATUSES_BEFORE, InvalidTransitionError, TaskStatus, WorkflowNotFoundError
 
 logger = logging.getLogger(__name__)
 
+# Statuses a task may be assigned from; assignment updates are guarded so
+# finished tasks are never reopened
+_ASSIGNABLE_STATUSES = _TASK_STATUSES_BEFORE[TaskStatus.ASSIGNED]
+
+# Team rosters change on the order of minutes, so lookups are cached briefly
+TEAM_MEMBERS_TTL_SECONDS = 60
+TEAM_MEMBERS_MAX_ENTRIES = 128
+
+# Skill-based score is SKILL_MATCH_WEIGHT * skill_fit - active_tasks, so one
+# unit of TF-IDF weighted skill fit outweighs this many open tasks
+SKILL_MATCH_WEIGHT = 5.0
+
+# Per-user active task counters in Redis, shared by all API workers
+_WORKLOAD_KEY = "task_router:load:{}"
+# Counters expire and are re-seeded from PostgreSQL, which bounds drift from
+# assignments made outside the router (e.g. WorkflowEngine.assign_task)
+_WORKLOAD_TTL_SECONDS = 60
+# Only adjust live counters, so an expired counter is re-seeded rather than
+# restarted from zero
+_INCR_IF_EXISTS = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return redis.call('INCRBY', KEYS[1], ARGV[1])
+end
+return nil
+"""
+# Atomically pick the least loaded user (ties by user ID) and count the new
+# task against them, so concurrent workers cannot both pick the same minimum.
+# KEYS are workload counters, ARGV the matching user IDs; nil if any counter
+# is missing and needs seeding.
+_CLAIM_LEAST_LOADED = """
+local best, best_load
+for i, key in ipairs(KEYS) do
+    local load = redis.call('GET', key)
+    if not load then
+        return nil
+    end
+    load = tonumber(load)
+    if best == nil or load < best_load or (load == best_load and ARGV[i] < ARGV[best]) then
+        best, best_load = i, load
+    end
+end
+redis.call('INCRBY', KEYS[best], 1)
+return {ARGV[best], best_load}
+"""
+# Per-team round-robin positions in Redis, shared by all API workers
+_ROUND_ROBIN_KEY = "task_router:rr:{}"
+
+
+def _skill_profiles_path() -> Path:
+    """Skill profile file loaded at startup (TASK_SKILL_PROFILES, default config/skill_profiles.yaml)"""
+    default = Path(__file__).resolve().parent.parent.parent / "config" / "skill_profiles.yaml"
+    return Path(os.environ.get("TASK_SKILL_PROFILES", default))
 
+
+def _audit_events_enabled() -> bool:
+    """Whether assignments are logged to process_events (TASK_AUDIT_EVENTS, on by default)"""
+    return os.environ.get("TASK_AUDIT_EVENTS", "true").lower() in ("1", "true", "yes")
+
+
+@unique
 class AssignmentMethod(str, Enum):
     """Assignment method enum"""
 
@@ -36,7 +114,46 @@ class TaskRouter:
 
     def __init__(self):
         self.db = get_postgres_client()
-        self._round_robin_index = {}  # Track round-robin position per team
+        self.redis = get_redis_client()
+        self._audit_enabled = _audit_events_enabled()
+        # Assignment events are written off the request path by a background thread;
+        # details arrive as a flat key/value array and are built into JSONB in PostgreSQL
+        self._events = ProcessEventWriter(
+            self.db,
+            "task-router-events",
+            (
+                "process_instance_id",
+                "task_id",
+                "event_type",
+                "event_category",
+                "user_id",
+                "message",
+                "details",
+                "automated",
+            ),
+            placeholders=("%s", "%s", "%s", "%s", "%s", "%s", "jsonb_object(%s::text[])", "%s"),
+        )
+        self._round_robin_index = {}  # Track round-robin position per team (without Redis)
+        self._team_members_cache = Cache(ttl_seconds=TEAM_MEMBERS_TTL_SECONDS, max_entries=TEAM_MEMBERS_MAX_ENTRIES)
+        # Skill profiles as a dense users x skills float32 matrix (see load_skill_profiles)
+        self._skill_matrix = None
+        self._skill_rows: Dict[str, int] = {}
+        self._skill_columns: Dict[str, int] = {}
+        self.load_skill_profiles_file(_skill_profiles_path())
+        # Pool-based strategies, all called as (task_id, team, pool, assigned_by, task_requirements)
+        self._strategies = {
+            AssignmentMethod.ROUND_ROBIN: self._assign_round_robin,
+            AssignmentMethod.LOAD_BALANCED: self._assign_load_balanced,
+            AssignmentMethod.SKILL_BASED: self._assign_skill_based,
+        }
+
+        if self._audit_enabled:
+            atexit.register(self.close)
+
+        if self.redis is not None:
+            self._incr_if_exists = self.redis.register_script(_INCR_IF_EXISTS)
+            self._claim_least_loaded = self.redis.register_script(_CLAIM_LEAST_LOADED)
+            get_event_bus().subscribe(EventType.TASK_COMPLETED, self._on_task_completed)
 
     def assign_task(
         self,
@@ -61,28 +178,31 @@ class TaskRouter:
         Returns:
             User ID assigned to
         """
-        if method == AssignmentMethod.MANUAL:
-            raise ValueError("Manual assignment requires explicit user_id")
-
-        elif method == AssignmentMethod.ROUND_ROBIN:
-            return self._assign_round_robin(task_id, team, pool, assigned_by)
-
-        elif method == AssignmentMethod.LOAD_BALANCED:
-            return self._assign_load_balanced(task_id, team, pool, assigned_by)
+        handler = self._strategies.get(method)
+        if handler is None:
+            if method is AssignmentMethod.MANUAL:
+                raise ValueError("Manual assignment requires explicit user_id")
+            raise ValueError(f"Unknown assignment method: {method}")
 
-        elif method == AssignmentMethod.SKILL_BASED:
-            return self._assign_skill_based(task_id, team, pool, assigned_by, task_requirements)
+        if pool:
+            # Deduplicate once; strategies index and iterate the pool repeatedly
+            pool = tuple(dict.fromkeys(pool))
 
-        else:
-            raise ValueError(f"Unknown assignment method: {method}")
+        return handler(task_id, team, pool, assigned_by, task_requirements)
 
     def _assign_round_robin(
-        self, task_id: str, team: Optional[str], pool: Optional[List[str]], assigned_by: str
+        self,
+        task_id: str,
+        team: Optional[str],
+        pool: Optional[Sequence[str]],
+        assigned_by: str,
+        task_requirements: Optional[Dict[str, Any]] = None,
     ) -> str:
         """
         Round-robin assignment
 
         Distributes tasks evenly across available users in rotation.
+        task_requirements is ignored.
         """
         # Get candidate pool
         candidates = pool or self._get_team_members(team)
@@ -90,31 +210,49 @@ class TaskRouter:
         if not candidates:
             raise ValueError(f"No candidates available for assignment (team={team})")
 
-        # Get or initialize round-robin index for this team/pool
-        pool_key = team or "default"
-        if pool_key not in self._round_robin_index:
-            self._round_robin_index[pool_key] = 0
-
-        # Get next user in rotation
-        index = self._round_robin_index[pool_key] % len(candidates)
+        # Get next user in rotation for this team/pool
+        index = self._next_round_robin_index(team or "default") % len(candidates)
         assigned_to = candidates[index]
 
-        # Increment for next time
-        self._round_robin_index[pool_key] = (index + 1) % len(candidates)
-
         # Perform assignment
         self._execute_assignment(task_id, assigned_to, assigned_by, AssignmentMethod.ROUND_ROBIN)
 
         logger.info(f"Task {task_id} assigned to {assigned_to} via round-robin (index {index}/{len(candidates)})")
         return assigned_to
 
+    def _next_round_robin_index(self, pool_key: str, count: int = 1) -> int:
+        """
+        Claim the next round-robin position(s) for a team/pool
+
+        With Redis the position is a shared INCR counter, so rotation stays
+        fair across API workers; otherwise it is tracked per process.
+
+        Returns:
+            The first of ``count`` consecutive claimed positions
+        """
+        if self.redis is not None:
+            try:
+                return self.redis.incr(_ROUND_ROBIN_KEY.format(pool_key), count) - count
+            except Exception as e:
+                logger.warning(f"Failed to advance round-robin counter in Redis: {e}")
+
+        index = self._round_robin_index.get(pool_key, 0)
+        self._round_robin_index[pool_key] = index + count
+        return index
+
     def _assign_load_balanced(
-        self, task_id: str, team: Optional[str], pool: Optional[List[str]], assigned_by: str
+        self,
+        task_id: str,
+        team: Optional[str],
+        pool: Optional[Sequence[str]],
+        assigned_by: str,
+        task_requirements: Optional[Dict[str, Any]] = None,
     ) -> str:
         """
         Load-balanced assignment
 
         Assigns to the user with the fewest active tasks.
+        task_requirements is ignored.
         """
         # Get candidate pool
         candidates = pool or self._get_team_members(team)
@@ -122,50 +260,304 @@ class TaskRouter:
         if not candidates:
             raise ValueError(f"No candidates available for assignment (team={team})")
 
-        # Get current workload for each candidate
-        workloads = self._get_user_workloads(candidates)
-
-        # Find user with minimum workload
-        min_workload = min(workloads.values())
-        least_busy = [user for user, load in workloads.items() if load == min_workload]
+        claimed = self._claim_least_busy(candidates)
+        if claimed is not None:
+            # Already counted against the user in Redis; undo that if the assignment fails
+            assigned_to, min_workload = claimed
+            try:
+                self._execute_assignment(
+                    task_id, assigned_to, assigned_by, AssignmentMethod.LOAD_BALANCED, count_workload=False
+                )
+            except Exception:
+                self._adjust_workloads({assigned_to: -1})
+                raise
+        else:
+            assigned_to, min_workload = self._get_least_busy(candidates)
 
-        # If multiple users have same workload, pick first alphabetically for consistency
-        assigned_to = sorted(least_busy)[0]
-
-        # Perform assignment
-        self._execute_assignment(task_id, assigned_to, assigned_by, AssignmentMethod.LOAD_BALANCED)
+            # Perform assignment
+            self._execute_assignment(task_id, assigned_to, assigned_by, AssignmentMethod.LOAD_BALANCED)
 
         logger.info(f"Task {task_id} assigned to {assigned_to} via load-balancing (current load: {min_workload})")
         return assigned_to
 
+    def _claim_least_busy(self, candidates: Sequence[str]) -> Optional[Tuple[str, int]]:
+        """
+        Pick and count the least busy candidate in one atomic Redis step
+
+        Missing counters are seeded from PostgreSQL and the claim retried once.
+
+        Returns:
+            (user_id, load before this task), or None without Redis or on error
+        """
+        if self.redis is None:
+            return None
+
+        keys = [_WORKLOAD_KEY.format(user_id) for user_id in candidates]
+        try:
+            claimed = self._claim_least_loaded(keys=keys, args=candidates)
+            if claimed is None:
+                self._get_user_workloads(candidates)
+                claimed = self._claim_least_loaded(keys=keys, args=candidates)
+        except Exception as e:
+            logger.warning(f"Failed to claim least busy user in Redis: {e}")
+            return None
+
+        if claimed is None:
+            return None
+
+        user_id, load = claimed
+        return user_id, int(load)
+
     def _assign_skill_based(
         self,
         task_id: str,
         team: Optional[str],
-        pool: Optional[List[str]],
+        pool: Optional[Sequence[str]],
         assigned_by: str,
         task_requirements: Optional[Dict[str, Any]],
     ) -> str:
         """
         Skill-based assignment
 
-        Matches task requirements to user skills/capabilities.
-        Note: Requires user skills to be stored in database.
-        For now, falls back to load-balanced assignment.
+        Matches task_requirements["skills"] (a list of skill names or a
+        {skill: weight} dict) against the profiles from load_skill_profiles
+        (loaded at startup from config/skill_profiles.yaml),
+        scoring each candidate as SKILL_MATCH_WEIGHT * skill_fit - active_tasks.
+        Falls back to load-balanced assignment when there are no profiles,
+        no required skills, or no profiled candidate has any of them.
+        """
+        candidates = pool or self._get_team_members(team)
+        skills = (task_requirements or {}).get("skills")
+
+        task_vector = self._skill_vector(skills) if skills and self._skill_matrix is not None else None
+        profiled = [user for user in candidates if user in self._skill_rows]
+
+        if task_vector is None or not profiled:
+            logger.warning("No skill profiles match this task, falling back to load-balanced")
+            return self._assign_load_balanced(task_id, team, pool, assigned_by)
+
+        # One matrix-vector product scores every profiled candidate
+        skill_fit = self._skill_matrix[[self._skill_rows[user] for user in profiled]] @ task_vector
+        if not skill_fit.any():
+            logger.warning("No candidate has the required skills, falling back to load-balanced")
+            return self._assign_load_balanced(task_id, team, pool, assigned_by)
+
+        workloads = self._get_user_workloads(profiled)
+        loads = np.fromiter((workloads[user] for user in profiled), dtype=np.float32, count=len(profiled))
+        scores = SKILL_MATCH_WEIGHT * skill_fit - loads
+
+        best = int(np.argmax(scores))
+        assigned_to = profiled[best]
+
+        self._execute_assignment(task_id, assigned_to, assigned_by, AssignmentMethod.SKILL_BASED)
+
+        logger.info(f"Task {task_id} assigned to {assigned_to} via skill match (score {scores[best]:.2f})")
+        return assigned_to
+
+    def load_skill_profiles(self, profiles: Dict[str, Dict[str, float]]):
+        """
+        Materialize user skill profiles for skill-based assignment
+
+        Proficiencies are weighted by inverse document frequency, so skills
+        most users share count for less than rare ones. Call again whenever
+        a profile changes; the matrix is rebuilt from scratch.
+
+        Args:
+            profiles: Mapping of user_id to {skill: proficiency (0-1)}
+        """
+        if not HAS_NUMPY:
+            logger.warning("numpy not installed; skill-based assignment will fall back to load-balanced")
+            return
+
+        users = list(profiles)
+        columns: Dict[str, int] = {}
+        for skills in profiles.values():
+            for skill in skills:
+                columns.setdefault(skill, len(columns))
+
+        matrix = np.zeros((len(users), len(columns)), dtype=np.float32)
+        for row, user in enumerate(users):
+            for skill, proficiency in profiles[user].items():
+                matrix[row, columns[skill]] = proficiency
+
+        # Smoothed IDF, as in scikit-learn's TfidfTransformer
+        document_frequency = np.count_nonzero(matrix, axis=0)
+        idf = np.log((1 + len(users)) / (1 + document_frequency)) + 1
+        matrix *= idf.astype(np.float32)
+
+        self._skill_matrix = matrix
+        self._skill_rows = {user: row for row, user in enumerate(users)}
+        self._skill_columns = columns
+
+    def load_skill_profiles_file(self, path: Path):
+        """
+        Load skill profiles from a YAML file of {user_id: {skill: proficiency}}
+
+        Called at startup with TASK_SKILL_PROFILES (default
+        config/skill_profiles.yaml). Without a readable file, skill-based
+        assignment falls back to load-balanced.
+        """
+        if not path.exists():
+            logger.info(f"No skill profiles at {path}; skill-based assignment will fall back to load-balanced")
+            return
+
+        try:
+            with open(path, "r", encoding="utf-8") as fh:
+                profiles = yaml.safe_load(fh) or {}
+        except (yaml.YAMLError, OSError) as e:
+            logger.warning(f"Failed to load skill profiles from {path}: {e}")
+            return
+
+        self.load_skill_profiles(profiles)
+        logger.info(f"Loaded skill profiles for {len(profiles)} users from {path}")
+
+    def _skill_vector(self, skills: Union[List[str], Dict[str, float]]) -> Optional["np.ndarray"]:
+        """Build the task's skill weight vector, or None if no skill is known"""
+        weights = skills if isinstance(skills, dict) else dict.fromkeys(skills, 1.0)
+
+        vector = np.zeros(len(self._skill_columns), dtype=np.float32)
+        for skill, weight in weights.items():
+            column = self._skill_columns.get(skill)
+            if column is not None:
+                vector[column] = weight
+
+        # Normalize so the score scale does not depend on how many skills are listed
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else None
+
+    def assign_tasks_bulk(
+        self,
+        task_ids: List[str],
+        method: AssignmentMethod,
+        team: Optional[str] = None,
+        pool: Optional[List[str]] = None,
+        assigned_by: str = "system",
+    ) -> Dict[str, str]:
+        """
+        Assign many tasks in one round-trip
+
+        Assignees are chosen up front in Python (rotating through the pool, or
+        repeatedly taking the least busy user), then every task is updated and
+        its assignment recorded by a single statement.
+
+        Args:
+            task_ids: Tasks to assign
+            method: ROUND_ROBIN or LOAD_BALANCED
+            team: Team name for pool-based assignment
+            pool: List of user IDs to choose from
+            assigned_by: User making the assignment
+
+        Returns:
+            Dict mapping task_id to assigned user, for the tasks that exist
+            and are in an assignable status
+        """
+        if not task_ids:
+            return {}
+
+        method = AssignmentMethod(method)
+        candidates = tuple(dict.fromkeys(pool)) if pool else self._get_team_members(team)
+        if not candidates:
+            raise ValueError(f"No candidates available for assignment (team={team})")
+
+        if method is AssignmentMethod.ROUND_ROBIN:
+            start = self._next_round_robin_index(team or "default", len(task_ids))
+            assignees = [candidates[(start + offset) % len(candidates)] for offset in range(len(task_ids))]
+        elif method is AssignmentMethod.LOAD_BALANCED:
+            heap = [(load, user) for user, load in self._get_user_workloads(candidates).items()]
+            heapq.heapify(heap)
+            assignees = []
+            for _ in task_ids:
+                load, user = heap[0]
+                assignees.append(user)
+                heapq.heapreplace(heap, (load + 1, user))
+        else:
+            raise ValueError(f"Bulk assignment does not support {method}")
+
+        method_value = method.value
+
+        try:
+            query = """
+                WITH updated AS (
+                    UPDATE tasks
+                    SET assigned_to = batch.assignee,
+                        status = 'assigned',
+                        assignment_method = %s,
+                        updated_at = NOW()
+                    FROM unnest(%s::text[]::uuid[], %s::text[]) AS batch(task_id, assignee)
+                    WHERE tasks.id = batch.task_id
+                        AND tasks.status = ANY(%s::text[])
+                    RETURNING tasks.id, tasks.process_instance_id, tasks.assigned_to, tasks.assignment_method
+                ),
+                history AS (
+                    INSERT INTO task_assignments (
+                        task_id,
+                        assigned_to,
+                        assigned_by,
+                        assignment_method
+                    )
+                    SELECT id, assigned_to, %s, assignment_method FROM updated
+                )
+                SELECT id, process_instance_id, assigned_to FROM updated
+            """
+
+            rows = self.db.execute_prepared(
+                "task_router_assign_bulk",
+                query,
+                (method_value, list(task_ids), assignees, _ASSIGNABLE_STATUSES, assigned_by),
+            )
+
+        except Exception as e:
+            logger.error(f"Failed to execute bulk assignment: {e}")
+            raise
+
+        assignments = {}
+        for row in rows or []:
+            task_id, assigned_to = str(row["id"]), row["assigned_to"]
+            assignments[task_id] = assigned_to
+            if self._audit_enabled:
+                self._log_event(
+                    row["process_instance_id"],
+                    task_id,
+                    "task_assigned",
+                    assigned_by,
+                    f"Task assigned to {assigned_to} via {method_value}",
+                    {"method": method_value, "assigned_to": assigned_to},
+                    automated=True,
+                )
+
+        self._adjust_workloads(Counter(assignments.values()))
+
+        logger.info(f"Assigned {len(assignments)}/{len(task_ids)} tasks via bulk {method_value}")
+        return assignments
+
+    def _get_team_members(self, team: Optional[str]) -> Tuple[str, ...]:
         """
-        # TODO: Implement skill matching when user skill profiles are available
-        # This would:
-        # 1. Parse task_requirements to extract needed skills
-        # 2. Query user profiles for skill matches
-        # 3. Score candidates based on skill fit
-        # 4. Assign to best match (or best match with lowest workload)
+        Get team members, cached per team for TEAM_MEMBERS_TTL_SECONDS
 
-        logger.warning("Skill-based assignment not fully implemented, falling back to load-balanced")
-        return self._assign_load_balanced(task_id, team, pool, assigned_by)
+        Returned as a tuple so the cached roster cannot be mutated by callers.
+        """
+        key = team or ""
+        members = self._team_members_cache.get(key)
+        if members is None:
+            members = tuple(dict.fromkeys(self._load_team_members(team)))
+            self._team_members_cache.set(key, members)
+        return members
+
+    def invalidate_team_members(self, team: Optional[str] = None):
+        """
+        Drop cached team rosters after a membership change
+
+        Args:
+            team: Team whose roster changed, or None to drop all teams
+        """
+        if team is None:
+            self._team_members_cache.clear()
+        else:
+            self._team_members_cache.invalidate(team)
 
-    def _get_team_members(self, team: Optional[str]) -> List[str]:
+    def _load_team_members(self, team: Optional[str]) -> List[str]:
         """
-        Get list of team members
+        Look up the members of a team
 
         Note: This is a placeholder. In production, this would query
         a user/team database or directory service.
@@ -182,7 +574,7 @@ class TaskRouter:
             # Default team
             return ["user-1", "user-2", "user-3"]
 
-    def _get_user_workloads(self, user_ids: List[str]) -> Dict[str, int]:
+    def _get_user_workloads(self, user_ids: Sequence[str]) -> Dict[str, int]:
         """
         Get current active task count for each user
 
@@ -192,6 +584,11 @@ class TaskRouter:
         Returns:
             Dict mapping user_id to active task count
         """
+        if self.redis is not None:
+            workloads = self._get_cached_workloads(user_ids)
+            if workloads is not None:
+                return workloads
+
         try:
             # Query active task counts
             query = """
@@ -204,22 +601,114 @@ class TaskRouter:
                 GROUP BY assigned_to
             """
 
-            results = self.db.execute_query(query, (user_ids,))
+            # psycopg2 adapts lists (not tuples) to arrays
+            results = self.db.execute_prepared("task_router_workloads", query, (list(user_ids),))
 
             # Build workload dict (default to 0 for users with no tasks)
-            workloads = {user_id: 0 for user_id in user_ids}
+            workloads = dict.fromkeys(user_ids, 0)
 
             for row in results or []:
                 workloads[row["assigned_to"]] = row["task_count"]
 
+            if self.redis is not None:
+                self._seed_workloads(workloads)
+
             return workloads
 
         except Exception as e:
             logger.error(f"Failed to get user workloads: {e}")
             # Return equal workload on error (will use round-robin-like behavior)
-            return {user_id: 0 for user_id in user_ids}
+            return dict.fromkeys(user_ids, 0)
+
+    def _get_least_busy(self, user_ids: Sequence[str]) -> Tuple[str, int]:
+        """
+        Find the user with the fewest active tasks, breaking ties alphabetically
+
+        PostgreSQL ranks the candidates and returns only the winner, so no
+        per-user workload dict is built. The "C" collation makes the
+        tiebreak match Python string ordering.
 
-    def _execute_assignment(self, task_id: str, assigned_to: str, assigned_by: str, method: AssignmentMethod):
+        Returns:
+            (user_id, active task count)
+        """
+        try:
+            query = """
+                SELECT candidate.user_id, COUNT(tasks.id) as task_count
+                FROM unnest(%s::text[]) AS candidate(user_id)
+                LEFT JOIN tasks
+                  ON tasks.assigned_to = candidate.user_id
+                 AND tasks.status IN ('assigned', 'in_progress')
+                GROUP BY candidate.user_id
+                ORDER BY task_count, candidate.user_id COLLATE "C"
+                LIMIT 1
+            """
+
+            row = self.db.execute_prepared("task_router_least_busy", query, (list(user_ids),), fetch="one")
+            if row:
+                return row["user_id"], row["task_count"]
+
+        except Exception as e:
+            logger.error(f"Failed to get least busy user: {e}")
+
+        # Treat everyone as equally loaded on error, like _get_user_workloads
+        return min(user_ids), 0
+
+    def _get_cached_workloads(self, user_ids: Sequence[str]) -> Optional[Dict[str, int]]:
+        """
+        Read active task counts from the Redis counters in one MGET
+
+        Returns:
+            Dict mapping user_id to active task count, or None if any counter
+            is missing (expired or never seeded) or Redis is unavailable
+        """
+        try:
+            counts = self.redis.mget([_WORKLOAD_KEY.format(user_id) for user_id in user_ids])
+        except Exception as e:
+            logger.warning(f"Failed to read workload counters from Redis: {e}")
+            return None
+
+        if any(count is None for count in counts):
+            return None
+
+        return {user_id: int(count) for user_id, count in zip(user_ids, counts)}
+
+    def _seed_workloads(self, workloads: Dict[str, int]):
+        """Store counts read from PostgreSQL as Redis counters, keeping any live counter"""
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            for user_id, count in workloads.items():
+                pipe.set(_WORKLOAD_KEY.format(user_id), count, ex=_WORKLOAD_TTL_SECONDS, nx=True)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Failed to seed workload counters in Redis: {e}")
+
+    def _adjust_workloads(self, deltas: Dict[str, int]):
+        """Apply active task count changes to the live Redis counters"""
+        if self.redis is None:
+            return
+
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            for user_id, delta in deltas.items():
+                self._incr_if_exists(keys=[_WORKLOAD_KEY.format(user_id)], args=[delta], client=pipe)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Failed to update workload counters in Redis: {e}")
+
+    def _on_task_completed(self, event: Event):
+        """Release the completed task from its assignee's workload counter"""
+        assigned_to = event.data.get("assigned_to")
+        if assigned_to:
+            self._adjust_workloads({assigned_to: -1})
+
+    def _execute_assignment(
+        self,
+        task_id: str,
+        assigned_to: str,
+        assigned_by: str,
+        method: AssignmentMethod,
+        count_workload: bool = True,
+    ):
         """
         Execute the actual task assignment in database
 
@@ -228,66 +717,110 @@ class TaskRouter:
             assigned_to: User to assign to
             assigned_by: User making assignment
             method: Assignment method used
+            count_workload: Add the task to the user's Redis workload counter
+                (False when the caller has already counted it)
+
+        Raises:
+            WorkflowNotFoundError: If the task does not exist
+            InvalidTransitionError: If the task's status does not allow assignment
         """
+        method_value = method.value
+
         try:
-            # Update task
+            # Update task and record the assignment in one round-trip; the insert
+            # only fires when the UPDATE matched a task
             query = """
-                UPDATE tasks
-                SET assigned_to = %s,
-                    status = 'assigned',
-                    assignment_method = %s,
-                    updated_at = NOW()
-                WHERE id = %s
-                RETURNING process_instance_id
+                WITH updated AS (
+                    UPDATE tasks
+                    SET assigned_to = %s,
+                        status = 'assigned',
+                        assignment_method = %s,
+                        updated_at = NOW()
+                    WHERE id = %s
+                        AND status = ANY(%s::text[])
+                    RETURNING id, process_instance_id, assigned_to, assignment_method
+                ),
+                history AS (
+                    INSERT INTO task_assignments (
+                        task_id,
+                        assigned_to,
+                        assigned_by,
+                        assignment_method
+                    )
+                    SELECT id, assigned_to, %s, assignment_method FROM updated
+                )
+                SELECT process_instance_id FROM updated
             """
 
-            result = self.db.execute_command(query, (assigned_to, method.value, task_id), returning=True)
+            result = self.db.execute_prepared(
+                "task_router_assign",
+                query,
+                (assigned_to, method_value, task_id, _ASSIGNABLE_STATUSES, assigned_by),
+                fetch="one",
+            )
 
             if not result:
-                raise ValueError(f"Task {task_id} not found")
-
-            # Record assignment in history
-            self.db.execute_command(
-                """
-                INSERT INTO task_assignments (
-                    task_id,
-                    assigned_to,
-                    assigned_by,
-                    assignment_method
-                )
-                VALUES (%s, %s, %s, %s)
-                """,
-                (task_id, assigned_to, assigned_by, method.value),
-            )
+                task = self.db.execute_query("SELECT status FROM tasks WHERE id = %s", (task_id,), fetch="one")
+                if not task:
+                    raise WorkflowNotFoundError(f"Task {task_id} not found")
+                raise InvalidTransitionError(f"Task {task_id} cannot be assigned from status {task['status']}")
 
-            # Log event
-            self.db.execute_command(
-                """
-                INSERT INTO process_events (
-                    process_instance_id,
-                    task_id,
-                    event_type,
-                    event_category,
-                    user_id,
-                    message,
-                    details,
-                    automated
-                )
-                VALUES (%s, %s, 'task_assigned', 'assignment', %s, %s, %s, true)
-                """,
-                (
+            if self._audit_enabled:
+                self._log_event(
                     result["process_instance_id"],
                     task_id,
+                    "task_assigned",
                     assigned_by,
-                    f"Task assigned to {assigned_to} via {method.value}",
-                    {"method": method.value, "assigned_to": assigned_to},
-                ),
-            )
+                    f"Task assigned to {assigned_to} via {method_value}",
+                    {"method": method_value, "assigned_to": assigned_to},
+                    automated=True,
+                )
 
         except Exception as e:
             logger.error(f"Failed to execute assignment: {e}")
             raise
 
+        if count_workload:
+            self._adjust_workloads({assigned_to: 1})
+
+    def _log_event(
+        self,
+        process_instance_id: Any,
+        task_id: str,
+        event_type: str,
+        user_id: str,
+        message: str,
+        details: Dict[str, Optional[str]],
+        automated: bool = False,
+    ):
+        """
+        Queue an assignment event for the background process_events writer
+
+        details holds string (or None) values only: it is sent as a flat
+        key/value array and built into JSONB by jsonb_object() in PostgreSQL.
+        """
+        self._events.put(
+            (
+                process_instance_id,
+                task_id,
+                event_type,
+                "assignment",
+                user_id,
+                message,
+                list(chain.from_iterable(details.items())),
+                automated,
+            )
+        )
+
+    @property
+    def dropped_events(self) -> int:
+        """Assignment events dropped because the writer queue was full"""
+        return self._events.dropped_events
+
+    def close(self):
+        """Flush queued assignment events and stop the background writer"""
+        self._events.close()
+
     def reassign_task(self, task_id: str, new_assignee: str, reassigned_by: str, reason: str) -> Dict[str, Any]:
         """
         Reassign a task to a different user
@@ -302,74 +835,73 @@ class TaskRouter:
             Updated task
         """
         try:
-            # Get current assignment
-            current = self.db.execute_query(
-                "SELECT assigned_to, process_instance_id FROM tasks WHERE id = %s", (task_id,), fetch="one"
-            )
-
-            if not current:
-                raise ValueError(f"Task {task_id} not found")
-
-            # Update task
+            # Lock the current row, reassign it, close the active assignment and open
+            # a new one in one round-trip. The insert and the assignment UPDATE read
+            # the same snapshot, so the new assignment row is not itself marked as
+            # reassigned. The previous assignee is read under the row lock here; a
+            # cached copy could be stale and would not save a round-trip.
             query = """
-                UPDATE tasks
-                SET assigned_to = %s,
-                    updated_at = NOW()
-                WHERE id = %s
-                RETURNING *
+                WITH current_task AS (
+                    SELECT id, assigned_to, process_instance_id
+                    FROM tasks
+                    WHERE id = %s
+                    FOR UPDATE
+                ),
+                updated AS (
+                    UPDATE tasks
+                    SET assigned_to = %s,
+                        updated_at = NOW()
+                    FROM current_task
+                    WHERE tasks.id = current_task.id
+                    RETURNING tasks.*
+                ),
+                closed AS (
+                    UPDATE task_assignments
+                    SET status = 'reassigned'
+                    WHERE task_id IN (SELECT id FROM current_task) AND status = 'active'
+                ),
+                opened AS (
+                    INSERT INTO task_assignments (
+                        task_id,
+                        assigned_to,
+                        assigned_by,
+                        assignment_method,
+                        reason
+                    )
+                    SELECT id, %s, %s, 'manual', %s FROM current_task
+                )
+                SELECT updated.*, current_task.assigned_to AS previous_assignee
+                FROM updated, current_task
             """
 
-            task = self.db.execute_command(query, (new_assignee, task_id), returning=True)
-
-            # Mark old assignment as reassigned
-            self.db.execute_command(
-                """
-                UPDATE task_assignments
-                SET status = 'reassigned'
-                WHERE task_id = %s AND status = 'active'
-                """,
-                (task_id,),
+            task = self.db.execute_prepared(
+                "task_router_reassign",
+                query,
+                (task_id, new_assignee, new_assignee, reassigned_by, reason),
+                fetch="one",
             )
 
-            # Create new assignment record
-            self.db.execute_command(
-                """
-                INSERT INTO task_assignments (
-                    task_id,
-                    assigned_to,
-                    assigned_by,
-                    assignment_method,
-                    reason
-                )
-                VALUES (%s, %s, %s, 'manual', %s)
-                """,
-                (task_id, new_assignee, reassigned_by, reason),
-            )
+            if not task:
+                raise ValueError(f"Task {task_id} not found")
 
-            # Log event
-            self.db.execute_command(
-                """
-                INSERT INTO process_events (
-                    process_instance_id,
-                    task_id,
-                    event_type,
-                    event_category,
-                    user_id,
-                    message,
-                    details
-                )
-                VALUES (%s, %s, 'task_reassigned', 'assignment', %s, %s, %s)
-                """,
-                (
-                    current["process_instance_id"],
+            previous_assignee = task.pop("previous_assignee")
+            if self._audit_enabled:
+                self._log_event(
+                    task["process_instance_id"],
                     task_id,
+                    "task_reassigned",
                     reassigned_by,
-                    f"Task reassigned from {current['assigned_to']} to {new_assignee}",
-                    {"from": current["assigned_to"], "to": new_assignee, "reason": reason},
-                ),
-            )
+                    f"Task reassigned from {previous_assignee} to {new_assignee}",
+                    {"from": previous_assignee, "to": new_assignee, "reason": reason},
+                )
 
-            logger.info(f"Task {task_id} reassigned from {current['assigned_to']} to {new_assignee}")
+            if task.get("status") in ("assigned", "in_progress") and previous_assignee != new_assignee:
+                deltas = {new_assignee: 1}
+                if previous_assignee:
+                    deltas[previous_assignee] = -1
+                self._adjust_workloads(deltas)
+
+            logger.info(f"Task {task_id} reassigned from {previous_assignee} to {new_assignee}")
             return task
 
         except Exception as e:
@@ -387,54 +919,34 @@ class TaskRouter:
             Assignment statistics
         """
         try:
-            # Get assignment method breakdown
-            method_query = """
-                SELECT
-                    assignment_method,
-                    COUNT(*) as count
-                FROM task_assignments
-                WHERE assigned_at > NOW() - INTERVAL '7 days'
-                GROUP BY assignment_method
-            """
-
-            methods = self.db.execute_query(method_query)
-
-            # Get user workload distribution
-            workload_query = """
-                SELECT
-                    assigned_to,
-                    COUNT(*) as active_tasks,
-                    AVG(EXTRACT(EPOCH FROM (NOW() - assigned_at))/60) as avg_age_mins
-                FROM tasks
-                WHERE status IN ('assigned', 'in_progress')
-                GROUP BY assigned_to
-                ORDER BY active_tasks DESC
-            """
-
-            workloads = self.db.execute_query(workload_query)
-
-            # Get reassignment rate
-            reassign_query = """
-                SELECT
-                    COUNT(*) FILTER (WHERE status = 'reassigned') as reassigned,
-                    COUNT(*) as total
-                FROM task_assignments
-                WHERE assigned_at > NOW() - INTERVAL '7 days'
+            # Precomputed by mv_assignment_stats_7d, see refresh_assignment_stats
+            query = """
+                SELECT assignment_methods, user_workloads, reassigned, total, refreshed_at
+                FROM mv_assignment_stats_7d
             """
 
-            reassign_stats = self.db.execute_query(reassign_query, fetch="one")
+            stats = self.db.execute_query(query, fetch="one", cache_read=True) or {}
 
             reassignment_rate = 0
-            if reassign_stats and reassign_stats["total"] > 0:
-                reassignment_rate = (reassign_stats["reassigned"] / reassign_stats["total"]) * 100
+            if stats.get("total"):
+                reassignment_rate = (stats["reassigned"] / stats["total"]) * 100
 
             return {
-                "assignment_methods": {row["assignment_method"]: row["count"] for row in (methods or [])},
-                "user_workloads": workloads or [],
+                "assignment_methods": stats.get("assignment_methods") or {},
+                "user_workloads": stats.get("user_workloads") or [],
                 "reassignment_rate": round(reassignment_rate, 2),
-                "total_reassignments": reassign_stats["reassigned"] if reassign_stats else 0,
+                "total_reassignments": stats.get("reassigned", 0),
+                "refreshed_at": stats.get("refreshed_at"),
             }
 
         except Exception as e:
             logger.error(f"Failed to get assignment stats: {e}")
             raise
+
+    def refresh_assignment_stats(self):
+        """Recompute mv_assignment_stats_7d without blocking readers"""
+        try:
+            self.db.execute_command("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_assignment_stats_7d")
+        except Exception as e:
+            logger.error(f"Failed to refresh assignment stats: {e}")
+            raise
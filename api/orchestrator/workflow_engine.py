@@ -4,18 +4,37 @@ Workflow Engine - Process Orchestration
 Manages process instance lifecycle, task execution, and state transitions.
 """
 
+import atexit
 import logging
-from datetime import datetime, timedelta
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import Any, Dict, List, Optional
-from uuid import UUID
+from typing import Any, Dict, List, Optional, Sequence, Set
+from uuid import UUID, uuid4
 import json
 from pathlib import Path
 
+from ..cache import Cache
 from ..database import get_postgres_client
+from .event_writer import ProcessEventWriter
 
 logger = logging.getLogger(__name__)
 
+PROCESS_PRIORITY_TTL_SECONDS = 300
+PROCESS_PRIORITY_MAX_ENTRIES = 2048
+
+TASK_DISPATCH_WORKERS = 4
+
+EVENT_FLUSH_INTERVAL_SECONDS = 0.1
+
+
+class WorkflowNotFoundError(ValueError):
+    """Raised when the process or task being changed does not exist"""
+
+
+class InvalidTransitionError(ValueError):
+    """Raised when a status change is not allowed from the row's current status"""
+
 
 class ProcessStatus(str, Enum):
     """Process status enum"""
@@ -49,6 +68,66 @@ class SLAStatus(str, Enum):
     MET = "met"
 
 
+# Status strings bound once so lifecycle calls don't resolve enum .value each time
+_PROCESS_RUNNING = ProcessStatus.RUNNING.value
+_PROCESS_FAILED = ProcessStatus.FAILED.value
+_TASK_PENDING = TaskStatus.PENDING.value
+_TASK_ASSIGNED = TaskStatus.ASSIGNED.value
+_TASK_IN_PROGRESS = TaskStatus.IN_PROGRESS.value
+_TASK_COMPLETED = TaskStatus.COMPLETED.value
+
+_TASK_AUTOMATED = "automated"
+_FINISHED_PROCESS_STATUSES = frozenset({ProcessStatus.COMPLETED, ProcessStatus.FAILED, ProcessStatus.CANCELLED})
+# Process statuses in which ready automated tasks may still be started
+_DISPATCHABLE_PROCESS_STATUSES = frozenset({ProcessStatus.PENDING.value, ProcessStatus.RUNNING.value})
+
+# Legal status transitions (source -> targets); finished statuses have none
+_ALLOWED_PROCESS_TRANSITIONS = {
+    ProcessStatus.PENDING: {
+        ProcessStatus.RUNNING,
+        ProcessStatus.SUSPENDED,
+        ProcessStatus.COMPLETED,
+        ProcessStatus.FAILED,
+        ProcessStatus.CANCELLED,
+    },
+    ProcessStatus.RUNNING: {
+        ProcessStatus.SUSPENDED,
+        ProcessStatus.COMPLETED,
+        ProcessStatus.FAILED,
+        ProcessStatus.CANCELLED,
+    },
+    ProcessStatus.SUSPENDED: {
+        ProcessStatus.RUNNING,
+        ProcessStatus.COMPLETED,
+        ProcessStatus.FAILED,
+        ProcessStatus.CANCELLED,
+    },
+}
+_ALLOWED_TASK_TRANSITIONS = {
+    TaskStatus.PENDING: {TaskStatus.ASSIGNED, TaskStatus.IN_PROGRESS, TaskStatus.COMPLETED},
+    TaskStatus.ASSIGNED: {TaskStatus.ASSIGNED, TaskStatus.IN_PROGRESS, TaskStatus.COMPLETED},
+    TaskStatus.IN_PROGRESS: {TaskStatus.COMPLETED},
+}
+
+
+def _statuses_before(transitions: Dict[Enum, set]) -> Dict[Enum, List[str]]:
+    """Invert a transition map into target -> source status strings, the form used by SQL guards"""
+    sources: Dict[Enum, List[str]] = {}
+    for source, targets in transitions.items():
+        for target in targets:
+            sources.setdefault(target, []).append(source.value)
+    return sources
+
+
+# Statuses a row must currently have to move to a given status; updates are
+# guarded with "status = ANY(...)" so illegal or concurrent transitions change nothing
+_PROCESS_STATUSES_BEFORE = _statuses_before(_ALLOWED_PROCESS_TRANSITIONS)
+_TASK_STATUSES_BEFORE = _statuses_before(_ALLOWED_TASK_TRANSITIONS)
+
+# Event type per process status; str-valued, so plain status strings look up too
+_EVENT_TYPE_BY_STATUS = {status: f"process_{status.value}" for status in ProcessStatus}
+
+
 class WorkflowEngine:
     """
     Workflow orchestration engine
@@ -64,6 +143,40 @@ class WorkflowEngine:
 
     def __init__(self):
         self.db = get_postgres_client()
+        self._process_priorities = Cache(
+            ttl_seconds=PROCESS_PRIORITY_TTL_SECONDS, max_entries=PROCESS_PRIORITY_MAX_ENTRIES
+        )
+
+        # Process events are written off the request path by a background thread
+        self._events = ProcessEventWriter(
+            self.db,
+            "workflow-engine-events",
+            (
+                "process_instance_id",
+                "task_id",
+                "event_type",
+                "event_category",
+                "severity",
+                "user_id",
+                "message",
+                "old_status",
+                "new_status",
+                "details",
+                "automated",
+            ),
+            flush_interval=EVENT_FLUSH_INTERVAL_SECONDS,
+        )
+        # In-memory dependency graph of automated tasks waiting on predecessors:
+        # process id -> task id -> unfinished predecessor ids, plus the reverse
+        # index process id -> predecessor id -> dependent task ids
+        self._dag: Dict[str, Dict[str, Set[str]]] = {}
+        self._dependents: Dict[str, Dict[str, Set[str]]] = {}
+        self._dag_locks: Dict[str, threading.Lock] = {}
+        self._dispatcher = ThreadPoolExecutor(
+            max_workers=TASK_DISPATCH_WORKERS, thread_name_prefix="workflow-engine-dispatch"
+        )
+
+        atexit.register(self.close)
 
     # ========================================================================
     # Process Instance Management
@@ -99,11 +212,6 @@ class WorkflowEngine:
             Created process instance
         """
         try:
-            # Calculate due date from SLA
-            due_date = None
-            if sla_target_mins:
-                due_date = datetime.now() + timedelta(minutes=sla_target_mins)
-
             # Create process instance
             query = """
                 INSERT INTO process_instances (
@@ -120,26 +228,27 @@ class WorkflowEngine:
                     business_context,
                     started_at
                 )
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW())
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, NOW() + make_interval(mins => %s), %s, %s, NOW())
                 RETURNING *
             """
 
-            process = self.db.execute_command(
+            process = self.db.execute_prepared(
+                "workflow_start_process",
                 query,
                 (
                     process_definition_id,
                     process_name,
                     process_type,
-                    ProcessStatus.RUNNING.value,
+                    _PROCESS_RUNNING,
                     initiated_by,
                     assigned_to,
                     priority,
                     sla_target_mins,
-                    due_date,
+                    sla_target_mins,
                     json.dumps(input_data or {}),
                     json.dumps(business_context or {}),
                 ),
-                returning=True,
+                fetch="one",
             )
 
             # Log event
@@ -158,7 +267,7 @@ class WorkflowEngine:
             try:
                 definition = self._load_definition(process_definition_id)
                 if definition and "start_step_id" in definition:
-                    self._create_step_task(process["id"], definition, definition["start_step_id"], initiated_by)
+                    self._create_step_tasks(process["id"], definition, [definition["start_step_id"]], initiated_by)
             except Exception as e:
                 logger.warning(f"Could not initialize workflow from definition: {e}") 
                 # Continue without error to maintain backward compatibility
@@ -191,54 +300,64 @@ class WorkflowEngine:
             Updated process instance
         """
         try:
-            # Get current process
-            current = self.db.execute_query(
-                "SELECT * FROM process_instances WHERE id = %s", (str(process_id),), fetch="one"
-            )
-
-            if not current:
-                raise ValueError(f"Process {process_id} not found")
-
-            # Build update query
-            updates = ["status = %s", "updated_at = NOW()"]
-            params = [new_status.value]
-
-            if new_status == ProcessStatus.COMPLETED:
-                updates.append("completed_at = NOW()")
-                updates.append("progress_percentage = 100")
-                if output_data:
-                    updates.append("output_data = %s")
-                    params.append(json.dumps(output_data))
-
-            if new_status == ProcessStatus.FAILED:
-                if error_message:
-                    updates.append("error_message = %s")
-                    params.append(error_message)
+            status = new_status.value
 
-            params.append(str(process_id))
-
-            query = f"""
+            # One fixed statement for every status (so a single prepared plan is
+            # reused); the FROM subquery reads the status before this update and
+            # the status guard rejects illegal transitions without a prior SELECT
+            query = """
                 UPDATE process_instances
-                SET {', '.join(updates)}
-                WHERE id = %s
-                RETURNING *
+                SET status = %s,
+                    updated_at = NOW(),
+                    completed_at = CASE WHEN %s::text = 'completed' THEN NOW() ELSE process_instances.completed_at END,
+                    progress_percentage = CASE
+                        WHEN %s::text = 'completed' THEN 100
+                        ELSE process_instances.progress_percentage
+                    END,
+                    output_data = COALESCE(%s, process_instances.output_data),
+                    error_message = COALESCE(%s, process_instances.error_message)
+                FROM (SELECT id, status FROM process_instances WHERE id = %s) previous
+                WHERE process_instances.id = previous.id
+                    AND process_instances.status = ANY(%s::text[])
+                RETURNING process_instances.*, previous.status as previous_status
             """
 
-            process = self.db.execute_command(query, tuple(params), returning=True)
+            process = self.db.execute_prepared(
+                "workflow_update_process_status",
+                query,
+                (
+                    status,
+                    status,
+                    status,
+                    json.dumps(output_data) if output_data and new_status == ProcessStatus.COMPLETED else None,
+                    error_message if new_status == ProcessStatus.FAILED else None,
+                    str(process_id),
+                    _PROCESS_STATUSES_BEFORE.get(new_status, []),
+                ),
+                fetch="one",
+            )
+
+            if not process:
+                self._reject_transition("process_instances", "Process", process_id, status)
+
+            previous_status = process.pop("previous_status")
+            self._process_priorities.invalidate(str(process_id))
+            if new_status in _FINISHED_PROCESS_STATUSES:
+                self._forget_dependencies(process_id)
 
             # Log event
             self._log_event(
                 process_instance_id=process_id,
-                event_type=f"process_{new_status.value}",
+                event_type=_EVENT_TYPE_BY_STATUS[new_status],
                 event_category="lifecycle",
                 user_id=user_id or "system",
-                message=f"Process status changed to {new_status.value}",
-                old_status=current["status"],
-                new_status=new_status.value,
+                message=f"Process status changed to {status}",
+                old_status=previous_status,
+                new_status=status,
                 details={"error": error_message} if error_message else {},
             )
 
-            logger.info(f"Process {process_id} status updated to {new_status.value}")
+            logger.info(f"Process {process_id} status updated to {status}")
             return process
 
         except Exception as e:
@@ -308,23 +427,13 @@ class WorkflowEngine:
             Created task
         """
         try:
-            # Get process to inherit priority
-            process = self.db.execute_query(
-                "SELECT priority FROM process_instances WHERE id = %s", (str(process_instance_id),), fetch="one"
-            )
-
-            if not process:
-                raise ValueError(f"Process {process_instance_id} not found")
-
-            # Calculate due date
-            due_date = None
-            if sla_target_mins:
-                due_date = datetime.now() + timedelta(minutes=sla_target_mins)
+            # Get process priority to inherit
+            process_priority = self._get_process_priority(process_instance_id)
 
             # Determine initial status
-            status = TaskStatus.PENDING.value
+            status = _TASK_PENDING
             if assigned_to:
-                status = TaskStatus.ASSIGNED.value
+                status = _TASK_ASSIGNED
 
             # Create task
             query = """
@@ -341,11 +450,12 @@ class WorkflowEngine:
                     due_date,
                     input_data
                 )
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                VALUES (%s, %s, %s, %s, %s, %s, %s::text[]::uuid[], %s, %s, NOW() + make_interval(mins => %s), %s)
                 RETURNING *
             """
 
-            task = self.db.execute_command(
+            task = self.db.execute_prepared(
+                "workflow_create_task",
                 query,
                 (
                     str(process_instance_id),
@@ -355,12 +465,12 @@ class WorkflowEngine:
                     status,
                     assigned_to,
                     [str(tid) for tid in (depends_on or [])],
-                    priority or process["priority"],
+                    priority or process_priority,
+                    sla_target_mins,
                     sla_target_mins,
-                    due_date,
                     json.dumps(input_data or {}),
                 ),
-                returning=True,
+                fetch="one",
             )
 
             # Log event
@@ -374,6 +484,8 @@ class WorkflowEngine:
                 details={"type": task_type, "assigned_to": assigned_to},
             )
 
+            self._track_dependencies(process_instance_id, task["id"], task_type, depends_on)
+
             logger.info(f"Created task {task['id']}: {task_name}")
             return task
 
@@ -381,6 +493,136 @@ class WorkflowEngine:
             logger.error(f"Failed to create task: {e}")
             raise
 
+    def create_tasks_bulk(
+        self, process_instance_id: UUID, task_specs: Sequence[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Create many tasks within a process in one INSERT
+
+        Args:
+            process_instance_id: Parent process ID
+            task_specs: One dict per task with the create_task keyword arguments
+                (task_definition_id, task_name, task_type and optionally assigned_to,
+                depends_on, priority, sla_target_mins, input_data)
+
+        Returns:
+            Created tasks, in task_specs order
+        """
+        if not task_specs:
+            return []
+
+        try:
+            # Every column is sent as a text[] and cast per row, so one prepared plan
+            # serves any batch; depends_on travels as an array literal per task.
+            # Task ids are generated here so the inserted rows can be joined back to
+            # their batch position (INSERT ... RETURNING does not keep input order).
+            query = """
+                WITH batch AS (
+                    SELECT *
+                    FROM unnest(
+                        %s::text[], %s::text[], %s::text[], %s::text[], %s::text[],
+                        %s::text[], %s::text[], %s::text[], %s::text[]
+                    ) WITH ORDINALITY AS batch(
+                        id,
+                        task_definition_id,
+                        task_name,
+                        task_type,
+                        assigned_to,
+                        depends_on,
+                        priority,
+                        sla_target_mins,
+                        input_data,
+                        position
+                    )
+                ),
+                inserted AS (
+                    INSERT INTO tasks (
+                        id,
+                        process_instance_id,
+                        task_definition_id,
+                        task_name,
+                        task_type,
+                        status,
+                        assigned_to,
+                        depends_on,
+                        priority,
+                        sla_target_mins,
+                        due_date,
+                        input_data
+                    )
+                    SELECT
+                        batch.id::uuid,
+                        process_instances.id,
+                        batch.task_definition_id,
+                        batch.task_name,
+                        batch.task_type,
+                        CASE WHEN batch.assigned_to IS NULL THEN %s ELSE %s END,
+                        batch.assigned_to,
+                        batch.depends_on::uuid[],
+                        COALESCE(batch.priority, process_instances.priority),
+                        batch.sla_target_mins::integer,
+                        NOW() + make_interval(mins => batch.sla_target_mins::integer),
+                        batch.input_data::jsonb
+                    FROM process_instances, batch
+                    WHERE process_instances.id = %s
+                    RETURNING *
+                )
+                SELECT inserted.*
+                FROM inserted
+                JOIN batch ON inserted.id = batch.id::uuid
+                ORDER BY batch.position
+            """
+
+            task_ids = [str(uuid4()) for _ in task_specs]
+            tasks = self.db.execute_prepared(
+                "workflow_create_tasks_bulk",
+                query,
+                (
+                    task_ids,
+                    [spec["task_definition_id"] for spec in task_specs],
+                    [spec["task_name"] for spec in task_specs],
+                    [spec["task_type"] for spec in task_specs],
+                    [spec.get("assigned_to") for spec in task_specs],
+                    ["{" + ",".join(str(tid) for tid in spec.get("depends_on") or []) + "}" for spec in task_specs],
+                    [spec.get("priority") for spec in task_specs],
+                    [
+                        str(spec["sla_target_mins"]) if spec.get("sla_target_mins") is not None else None
+                        for spec in task_specs
+                    ],
+                    [json.dumps(spec.get("input_data") or {}) for spec in task_specs],
+                    _TASK_PENDING,
+                    _TASK_ASSIGNED,
+                    str(process_instance_id),
+                ),
+            )
+
+            if not tasks:
+                raise WorkflowNotFoundError(f"Process {process_instance_id} not found")
+
+            # Match rows to specs by the generated id rather than by position
+            specs_by_id = dict(zip(task_ids, task_specs))
+
+            # The background writer flushes these as one multi-row INSERT
+            for task in tasks:
+                spec = specs_by_id[str(task["id"])]
+                self._track_dependencies(process_instance_id, task["id"], task["task_type"], spec.get("depends_on"))
+                self._log_event(
+                    process_instance_id=process_instance_id,
+                    task_id=task["id"],
+                    event_type="task_created",
+                    event_category="lifecycle",
+                    user_id="system",
+                    message=f"Task '{task['task_name']}' created",
+                    details={"type": task["task_type"], "assigned_to": task["assigned_to"]},
+                )
+
+            logger.info(f"Created {len(tasks)} tasks for process {process_instance_id}")
+            return tasks
+
+        except Exception as e:
+            logger.error(f"Failed to create tasks: {e}")
+            raise
+
     def assign_task(
         self, task_id: UUID, assigned_to: str, assigned_by: str, assignment_method: str = "manual"
     ) -> Dict[str, Any]:
@@ -405,20 +647,35 @@ class WorkflowEngine:
                     assignment_method = %s,
                     updated_at = NOW()
                 WHERE id = %s
+                    AND status = ANY(%s::text[])
                 RETURNING *
             """
 
-            task = self.db.execute_command(
-                query, (assigned_to, TaskStatus.ASSIGNED.value, assignment_method, str(task_id)), returning=True
+            task = self.db.execute_prepared(
+                "workflow_assign_task",
+                query,
+                (
+                    assigned_to,
+                    _TASK_ASSIGNED,
+                    assignment_method,
+                    str(task_id),
+                    _TASK_STATUSES_BEFORE[TaskStatus.ASSIGNED],
+                ),
+                fetch="one",
             )
 
+            if not task:
+                self._reject_transition("tasks", "Task", task_id, _TASK_ASSIGNED)
+
             # Record assignment
-            self.db.execute_command(
+            self.db.execute_prepared(
+                "workflow_record_assignment",
                 """
                 INSERT INTO task_assignments (task_id, assigned_to, assigned_by, assignment_method)
                 VALUES (%s, %s, %s, %s)
                 """,
                 (str(task_id), assigned_to, assigned_by, assignment_method),
+                fetch="none",
             )
 
             # Log event
@@ -459,10 +716,19 @@ class WorkflowEngine:
                     claimed_at = NOW(),
                     updated_at = NOW()
                 WHERE id = %s
+                    AND status = ANY(%s::text[])
                 RETURNING *
             """
 
-            task = self.db.execute_command(query, (TaskStatus.IN_PROGRESS.value, user_id, str(task_id)), returning=True)
+            task = self.db.execute_prepared(
+                "workflow_start_task",
+                query,
+                (_TASK_IN_PROGRESS, user_id, str(task_id), _TASK_STATUSES_BEFORE[TaskStatus.IN_PROGRESS]),
+                fetch="one",
+            )
+
+            if not task:
+                self._reject_transition("tasks", "Task", task_id, _TASK_IN_PROGRESS)
 
             # Log event
             self._log_event(
@@ -496,20 +762,112 @@ class WorkflowEngine:
             Updated task
         """
         try:
-            query = """
-                UPDATE tasks
-                SET status = %s,
-                    completed_at = NOW(),
-                    output_data = %s,
-                    actual_duration_mins = EXTRACT(EPOCH FROM (NOW() - started_at))/60,
+            # Complete the task and lock its process row. Concurrent completions in
+            # one process queue on that lock, so the progress statement below (run
+            # in the same transaction with a fresh snapshot) sees every task that
+            # finished before it, and the last completion completes the process.
+            complete_query = """
+                WITH done AS (
+                    UPDATE tasks
+                    SET status = %s,
+                        completed_at = NOW(),
+                        output_data = %s,
+                        actual_duration_mins = EXTRACT(EPOCH FROM (NOW() - started_at))/60,
+                        updated_at = NOW()
+                    WHERE id = %s
+                        AND status = ANY(%s::text[])
+                    RETURNING *
+                ),
+                locked AS (
+                    SELECT process_instances.id
+                    FROM process_instances
+                    JOIN done ON process_instances.id = done.process_instance_id
+                    FOR UPDATE OF process_instances
+                )
+                SELECT done.*
+                FROM done
+                LEFT JOIN locked ON true
+            """
+
+            # Recompute progress and complete or fail the process
+            advance_query = """
+                WITH progress AS (
+                    SELECT
+                        process_instances.id,
+                        process_instances.status as previous_status,
+                        COUNT(*) FILTER (WHERE tasks.status = 'completed') * 100.0 / COUNT(*) as percentage,
+                        COUNT(*) FILTER (WHERE tasks.status = 'failed') as failed,
+                        CASE
+                            WHEN COUNT(*) FILTER (WHERE tasks.status = 'completed') = COUNT(*)
+                                AND process_instances.status = ANY(%s::text[])
+                                THEN 'completed'
+                            WHEN COUNT(*) FILTER (WHERE tasks.status = 'failed') > 0
+                                AND process_instances.status = ANY(%s::text[])
+                                THEN 'failed'
+                        END as transition
+                    FROM process_instances
+                    JOIN tasks ON tasks.process_instance_id = process_instances.id
+                    WHERE process_instances.id = %s
+                    GROUP BY process_instances.id, process_instances.status
+                )
+                UPDATE process_instances
+                SET progress_percentage = CASE
+                        WHEN progress.transition = 'completed' THEN 100
+                        ELSE progress.percentage
+                    END,
+                    status = COALESCE(progress.transition, process_instances.status),
+                    completed_at = CASE
+                        WHEN progress.transition = 'completed' THEN NOW()
+                        ELSE process_instances.completed_at
+                    END,
+                    error_message = CASE
+                        WHEN progress.transition = 'failed' THEN progress.failed || ' task(s) failed'
+                        ELSE process_instances.error_message
+                    END,
                     updated_at = NOW()
-                WHERE id = %s
-                RETURNING *
+                FROM progress
+                WHERE process_instances.id = progress.id
+                RETURNING
+                    progress.transition as process_transition,
+                    progress.failed as failed_tasks,
+                    progress.previous_status as previous_process_status
             """
 
-            task = self.db.execute_command(
-                query, (TaskStatus.COMPLETED.value, json.dumps(output_data or {}), str(task_id)), returning=True
-            )
+            progress = None
+            with self.db.get_connection() as conn:
+                task = self.db.execute_prepared(
+                    "workflow_complete_task",
+                    complete_query,
+                    (
+                        _TASK_COMPLETED,
+                        json.dumps(output_data or {}),
+                        str(task_id),
+                        _TASK_STATUSES_BEFORE[TaskStatus.COMPLETED],
+                    ),
+                    fetch="one",
+                    conn=conn,
+                )
+
+                if task:
+                    progress = self.db.execute_prepared(
+                        "workflow_advance_process",
+                        advance_query,
+                        (
+                            _PROCESS_STATUSES_BEFORE[ProcessStatus.COMPLETED],
+                            _PROCESS_STATUSES_BEFORE[ProcessStatus.FAILED],
+                            str(task["process_instance_id"]),
+                        ),
+                        fetch="one",
+                        conn=conn,
+                    )
+
+            if not task:
+                self._reject_transition("tasks", "Task", task_id, _TASK_COMPLETED)
+
+            progress = progress or {}
+            transition = progress.get("process_transition")
+            failed_tasks = progress.get("failed_tasks")
+            previous_status = progress.get("previous_process_status")
 
             # Log event
             self._log_event(
@@ -522,9 +880,23 @@ class WorkflowEngine:
                 details={"duration_mins": task.get("actual_duration_mins")},
             )
 
-            # Check if we should advance the process
-            self._check_process_progress(task["process_instance_id"])
-            
+            if transition:
+                error_message = f"{failed_tasks} task(s) failed" if transition == _PROCESS_FAILED else None
+                self._log_event(
+                    process_instance_id=task["process_instance_id"],
+                    event_type=_EVENT_TYPE_BY_STATUS[transition],
+                    event_category="lifecycle",
+                    user_id="system",
+                    message=f"Process status changed to {transition}",
+                    old_status=previous_status,
+                    new_status=transition,
+                    details={"error": error_message} if error_message else {},
+                )
+                logger.info(f"Process {task['process_instance_id']} status updated to {transition}")
+                self._forget_dependencies(task["process_instance_id"])
+            else:
+                self._release_dependents(task["process_instance_id"], task_id)
+
             # [BPM] Evaluate transitions based on workflow definition
             try:
                 self._evaluate_transitions(task["process_instance_id"], task_id, output_data)
@@ -546,74 +918,79 @@ class WorkflowEngine:
         """
         Check SLA compliance for all active processes and tasks
 
+        Both tables are updated and their at-risk/breached events logged by
+        one statement, so the sweep is a single round-trip.
+
         Returns:
             Number of SLA violations found
         """
-        violations = 0
-
         try:
-            # Check processes
             query = """
-                UPDATE process_instances
-                SET sla_status = CASE
-                    WHEN due_date IS NULL THEN 'on_track'
-                    WHEN NOW() > due_date THEN 'breached'
-                    WHEN NOW() > (due_date - INTERVAL '15 minutes') THEN 'at_risk'
-                    ELSE 'on_track'
-                END,
-                sla_breach_time = CASE
-                    WHEN NOW() > due_date AND sla_status != 'breached' THEN NOW()
-                    ELSE sla_breach_time
-                END
-                WHERE status IN ('running', 'suspended')
-                RETURNING id, sla_status
-            """
-
-            results = self.db.execute_query(query)
-
-            for row in results or []:
-                if row["sla_status"] in ["at_risk", "breached"]:
-                    violations += 1
-                    self._log_event(
-                        process_instance_id=row["id"],
-                        event_type=f"sla_{row['sla_status']}",
-                        event_category="sla",
-                        severity="warning" if row["sla_status"] == "at_risk" else "error",
-                        user_id="system",
-                        message=f"Process SLA {row['sla_status']}",
+                WITH process_updates AS (
+                    UPDATE process_instances
+                    SET sla_status = CASE
+                        WHEN due_date IS NULL THEN 'on_track'
+                        WHEN NOW() > due_date THEN 'breached'
+                        WHEN NOW() > (due_date - INTERVAL '15 minutes') THEN 'at_risk'
+                        ELSE 'on_track'
+                    END,
+                    sla_breach_time = CASE
+                        WHEN NOW() > due_date AND sla_status != 'breached' THEN NOW()
+                        ELSE sla_breach_time
+                    END
+                    WHERE status IN ('running', 'suspended')
+                    RETURNING id, sla_status
+                ),
+                task_updates AS (
+                    UPDATE tasks
+                    SET sla_status = CASE
+                        WHEN due_date IS NULL THEN 'on_track'
+                        WHEN NOW() > due_date THEN 'breached'
+                        WHEN NOW() > (due_date - INTERVAL '15 minutes') THEN 'at_risk'
+                        ELSE 'on_track'
+                    END,
+                    sla_breach_time = CASE
+                        WHEN NOW() > due_date AND sla_status != 'breached' THEN NOW()
+                        ELSE sla_breach_time
+                    END
+                    WHERE status IN ('assigned', 'in_progress')
+                    RETURNING id, process_instance_id, sla_status
+                ),
+                logged AS (
+                    INSERT INTO process_events (
+                        process_instance_id,
+                        task_id,
+                        event_type,
+                        event_category,
+                        severity,
+                        user_id,
+                        message,
+                        automated
                     )
-
-            # Check tasks
-            task_query = """
-                UPDATE tasks
-                SET sla_status = CASE
-                    WHEN due_date IS NULL THEN 'on_track'
-                    WHEN NOW() > due_date THEN 'breached'
-                    WHEN NOW() > (due_date - INTERVAL '15 minutes') THEN 'at_risk'
-                    ELSE 'on_track'
-                END,
-                sla_breach_time = CASE
-                    WHEN NOW() > due_date AND sla_status != 'breached' THEN NOW()
-                    ELSE sla_breach_time
-                END
-                WHERE status IN ('assigned', 'in_progress')
-                RETURNING id, process_instance_id, sla_status
+                    SELECT
+                        process_instance_id,
+                        task_id,
+                        'sla_' || sla_status,
+                        'sla',
+                        CASE WHEN sla_status = 'at_risk' THEN 'warning' ELSE 'error' END,
+                        'system',
+                        subject || ' SLA ' || sla_status,
+                        true
+                    FROM (
+                        SELECT id AS process_instance_id, NULL::uuid AS task_id, sla_status, 'Process' AS subject
+                        FROM process_updates
+                        UNION ALL
+                        SELECT process_instance_id, id, sla_status, 'Task'
+                        FROM task_updates
+                    ) AS changes
+                    WHERE sla_status IN ('at_risk', 'breached')
+                    RETURNING 1
+                )
+                SELECT COUNT(*) AS violations FROM logged
             """
 
-            task_results = self.db.execute_query(task_query)
-
-            for row in task_results or []:
-                if row["sla_status"] in ["at_risk", "breached"]:
-                    violations += 1
-                    self._log_event(
-                        process_instance_id=row["process_instance_id"],
-                        task_id=row["id"],
-                        event_type=f"sla_{row['sla_status']}",
-                        event_category="sla",
-                        severity="warning" if row["sla_status"] == "at_risk" else "error",
-                        user_id="system",
-                        message=f"Task SLA {row['sla_status']}",
-                    )
+            result = self.db.execute_command(query, returning=True)
+            violations = result["violations"] if result else 0
 
             logger.info(f"SLA check complete: {violations} violations found")
             return violations
@@ -643,28 +1020,31 @@ class WorkflowEngine:
             logger.warning(f"Failed to load definition {definition_id}: {e}")
             return None
 
-    def _create_step_task(self, process_id: UUID, definition: Dict, step_id: str, user_id: str):
-        """Create a task for a specific workflow step"""
+    def _create_step_tasks(self, process_id: UUID, definition: Dict, step_ids: Sequence[str], user_id: str):
+        """Create the tasks for a set of workflow steps in one batch"""
         steps = {s["id"]: s for s in definition.get("steps", [])}
-        step = steps.get(step_id)
-        if not step:
-            logger.error(f"Step {step_id} not found in definition {definition['id']}")
-            return
-
-        # Determine assignment
-        assigned_to = None
-        # valid roles mapping would go here, for now simpler logic:
-        # If the step has a specific internal assignee or logic, handle it.
-        # For this MVP, we leave unassigned unless specified.
+        task_specs = []
+        for step_id in step_ids:
+            step = steps.get(step_id)
+            if not step:
+                logger.error(f"Step {step_id} not found in definition {definition['id']}")
+                continue
+
+            # Determine assignment
+            # valid roles mapping would go here, for now simpler logic:
+            # If the step has a specific internal assignee or logic, handle it.
+            # For this MVP, we leave unassigned unless specified.
+            task_specs.append(
+                {
+                    "task_definition_id": step_id,  # Using step_id as definition id
+                    "task_name": step["name"],
+                    "task_type": step["type"],
+                    "assigned_to": None,
+                    "input_data": {"workflow_step": True},
+                }
+            )
 
-        self.create_task(
-            process_instance_id=process_id,
-            task_definition_id=step_id, # Using step_id as definition id
-            task_name=step["name"],
-            task_type=step["type"],
-            assigned_to=assigned_to,
-            input_data={"workflow_step": True}
-        )
+        self.create_tasks_bulk(process_id, task_specs)
 
     def _evaluate_transitions(self, process_id: UUID, completed_task_id: UUID, output: Dict):
         """Evaluate workflow transitions after task completion"""
@@ -726,12 +1106,49 @@ class WorkflowEngine:
 
         if next_step_id:
             logger.info(f"Transitioning process {process_id} from {current_step_id} to {next_step_id}")
-            self._create_step_task(process_id, definition, next_step_id, process["initiated_by"])
+            self._create_step_tasks(process_id, definition, [next_step_id], process["initiated_by"])
 
     # ========================================================================
     # Internal Helpers
     # ========================================================================
 
+    def _reject_transition(self, table: str, kind: str, row_id: UUID, new_status: str):
+        """
+        Explain why a guarded status update changed no row
+
+        Only runs after the guard rejected the update, so the common path keeps
+        a single statement.
+
+        Raises:
+            WorkflowNotFoundError: If the row does not exist
+            InvalidTransitionError: If its current status does not allow new_status
+        """
+        row = self.db.execute_query(f"SELECT status FROM {table} WHERE id = %s", (str(row_id),), fetch="one")
+        if not row:
+            raise WorkflowNotFoundError(f"{kind} {row_id} not found")
+
+        raise InvalidTransitionError(f"{kind} {row_id} cannot change from {row['status']} to {new_status}")
+
+    def _get_process_priority(self, process_instance_id: UUID) -> str:
+        """
+        Get a process's priority, cached per process for PROCESS_PRIORITY_TTL_SECONDS
+
+        Raises:
+            ValueError: If the process does not exist
+        """
+        key = str(process_instance_id)
+        priority = self._process_priorities.get(key)
+        if priority is None:
+            process = self.db.execute_query("SELECT priority FROM process_instances WHERE id = %s", (key,), fetch="one")
+
+            if not process:
+                raise WorkflowNotFoundError(f"Process {process_instance_id} not found")
+
+            priority = process["priority"]
+            self._process_priorities.set(key, priority)
+
+        return priority
+
     def _log_event(
         self,
         process_instance_id: UUID,
@@ -745,92 +1162,157 @@ class WorkflowEngine:
         new_status: Optional[str] = None,
         details: Optional[Dict[str, Any]] = None,
     ):
-        """Log a process event"""
-        try:
-            query = """
-                INSERT INTO process_events (
-                    process_instance_id,
-                    task_id,
-                    event_type,
-                    event_category,
-                    severity,
-                    user_id,
-                    message,
-                    old_status,
-                    new_status,
-                    details,
-                    automated
-                )
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """
+        """
+        Queue a process event for the background process_events writer
 
-            self.db.execute_command(
-                query,
-                (
-                    str(process_instance_id),
-                    str(task_id) if task_id else None,
-                    event_type,
-                    event_category,
-                    severity,
-                    user_id,
-                    message,
-                    old_status,
-                    new_status,
-                    details or {},
-                    user_id == "system",
-                ),
+        Events are dropped (and counted in dropped_events) rather than
+        blocking the caller when the queue is full.
+        """
+        self._events.put(
+            (
+                str(process_instance_id),
+                str(task_id) if task_id else None,
+                event_type,
+                event_category,
+                severity,
+                user_id,
+                message,
+                old_status,
+                new_status,
+                json.dumps(details or {}),
+                user_id == "system",
             )
+        )
 
-        except Exception as e:
-            logger.error(f"Failed to log event: {e}")
-            # Don't raise - event logging shouldn't break main flow
+    @property
+    def dropped_events(self) -> int:
+        """Process events dropped because the writer queue was full"""
+        return self._events.dropped_events
+
+    def _dependency_lock(self, process_key: str) -> threading.Lock:
+        """Get the lock guarding one process's dependency graph"""
+        return self._dag_locks.setdefault(process_key, threading.Lock())
+
+    def _track_dependencies(
+        self, process_instance_id: UUID, task_id: Any, task_type: str, depends_on: Optional[Sequence[Any]]
+    ):
+        """
+        Add an automated task with unfinished predecessors to the dependency graph
+
+        Predecessors already completed in the database are skipped, and the task
+        is dispatched at once if none remain. The graph lives in this process's
+        memory only: a predecessor completed through another API worker, or
+        before a restart, does not release the task.
+        """
+        if task_type != _TASK_AUTOMATED or not depends_on:
+            return
+
+        process_key, task_key = str(process_instance_id), str(task_id)
 
-    def _check_process_progress(self, process_id: UUID):
-        """Check if process should advance based on task completion"""
+        # Checked under the lock so a completion committing meanwhile waits in
+        # _release_dependents until the task is registered
+        with self._dependency_lock(process_key):
+            rows = self.db.execute_prepared(
+                "workflow_unfinished_predecessors",
+                "SELECT id FROM tasks WHERE id = ANY(%s::text[]::uuid[]) AND status <> %s",
+                ([str(tid) for tid in depends_on], _TASK_COMPLETED),
+            )
+            predecessors = {str(row["id"]) for row in rows or []}
+
+            if predecessors:
+                self._dag.setdefault(process_key, {})[task_key] = predecessors
+                dependents = self._dependents.setdefault(process_key, {})
+                for predecessor in predecessors:
+                    dependents.setdefault(predecessor, set()).add(task_key)
+
+        if not predecessors:
+            self._dispatch_ready([task_key])
+
+    def _release_dependents(self, process_instance_id: UUID, completed_task_id: Any):
+        """Start automated tasks whose last unfinished predecessor just completed"""
+        process_key, completed_key = str(process_instance_id), str(completed_task_id)
+        ready = []
+
+        with self._dependency_lock(process_key):
+            waiting = self._dag.get(process_key, {})
+            for dependent in self._dependents.get(process_key, {}).pop(completed_key, ()):
+                predecessors = waiting.get(dependent)
+                if predecessors is None:
+                    continue
+
+                predecessors.discard(completed_key)
+                if not predecessors:
+                    del waiting[dependent]
+                    ready.append(dependent)
+
+        self._dispatch_ready(ready)
+
+    def _dispatch_ready(self, task_keys: List[str]):
+        """Hand ready automated tasks to the dispatcher thread pool"""
+        for task_key in task_keys:
+            try:
+                self._dispatcher.submit(self._start_ready_task, task_key)
+            except RuntimeError:
+                logger.warning(f"Dispatcher is shut down, task {task_key} was not started")
+
+    def _forget_dependencies(self, process_instance_id: UUID):
+        """Drop the dependency graph of a process that has finished"""
+        process_key = str(process_instance_id)
+        with self._dependency_lock(process_key):
+            self._dag.pop(process_key, None)
+            self._dependents.pop(process_key, None)
+        self._dag_locks.pop(process_key, None)
+
+    def _start_ready_task(self, task_id: str):
+        """Start an automated task on a dispatcher thread, unless its process was suspended or has finished"""
         try:
-            # Get task stats
-            stats = self.db.execute_query(
+            process = self.db.execute_prepared(
+                "workflow_ready_task_process_status",
                 """
-                SELECT
-                    COUNT(*) as total,
-                    COUNT(*) FILTER (WHERE status = 'completed') as completed,
-                    COUNT(*) FILTER (WHERE status = 'failed') as failed
-                FROM tasks
-                WHERE process_instance_id = %s
+                    SELECT process_instances.status
+                    FROM tasks
+                    JOIN process_instances ON process_instances.id = tasks.process_instance_id
+                    WHERE tasks.id = %s
                 """,
-                (str(process_id),),
+                (task_id,),
                 fetch="one",
             )
-
-            if not stats or stats["total"] == 0:
+            if not process or process["status"] not in _DISPATCHABLE_PROCESS_STATUSES:
+                logger.info(f"Skipped ready task {task_id}: process is {process['status'] if process else 'missing'}")
                 return
 
-            # Calculate progress
-            progress = (stats["completed"] / stats["total"]) * 100
+            self.start_task(UUID(task_id), "system")
+        except Exception as e:
+            logger.error(f"Failed to dispatch ready task {task_id}: {e}")
 
-            # Update process progress
-            self.db.execute_command(
-                """
-                UPDATE process_instances
-                SET progress_percentage = %s,
-                    updated_at = NOW()
-                WHERE id = %s
-                """,
-                (progress, str(process_id)),
-            )
+    def close(self):
+        """Finish dispatched tasks, flush queued process events and stop the background writer"""
+        self._dispatcher.shutdown(wait=True)
+        self._events.close()
 
-            # Check if all tasks complete
-            if stats["completed"] == stats["total"]:
-                self.update_process_status(process_id, ProcessStatus.COMPLETED, user_id="system")
 
-            # Check if any task failed
-            elif stats["failed"] > 0:
-                self.update_process_status(
-                    process_id,
-                    ProcessStatus.FAILED,
-                    user_id="system",
-                    error_message=f"{stats['failed']} task(s) failed",
-                )
+_workflow_engine: Optional[WorkflowEngine] = None
+_workflow_engine_lock = threading.Lock()
 
-        except Exception as e:
-            logger.error(f"Failed to check process progress: {e}")
+
+def get_workflow_engine() -> WorkflowEngine:
+    """Get singleton WorkflowEngine instance, shared by all routes so they see one dependency graph"""
+    global _workflow_engine
+
+    if _workflow_engine is None:
+        with _workflow_engine_lock:
+            if _workflow_engine is None:
+                _workflow_engine = WorkflowEngine()
+
+    return _workflow_engine
+
+
+def close_workflow_engine():
+    """Close the singleton WorkflowEngine, flushing its queued process events"""
+    global _workflow_engine
+
+    with _workflow_engine_lock:
+        engine, _workflow_engine = _workflow_engine, None
+
+    if engine:
+        engine.close()
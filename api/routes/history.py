@@ -13,12 +13,12 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
 try:
-    from ..neo4j_client import get_neo4j_client
+    from ..neo4j_client import PROJECTED_ATOM_FIELDS, get_neo4j_client
 except ImportError:
     from pathlib import Path
 
     sys.path.insert(0, str(Path(__file__).parent.parent))
-    from neo4j_client import get_neo4j_client
+    from neo4j_client import PROJECTED_ATOM_FIELDS, get_neo4j_client
 
 
 router = APIRouter()
@@ -292,6 +292,8 @@ def revert_change(change_id: str) -> Dict[str, Any]:
 
             if not update_record:
                 raise HTTPException(status_code=404, detail=f"Atom {atom_id} not found")
+            # Neighbours' cached traversals also hold this atom's projected fields
+            neo4j_client.invalidate(None if field in PROJECTED_ATOM_FIELDS else atom_id)
 
             # Create a new change record for the revert
             revert_change_id = f"change-{datetime.now().timestamp()}"
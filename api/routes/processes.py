@@ -8,22 +8,36 @@ import sys
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Response
 from pydantic import BaseModel
 
 try:
     from ..database import get_postgres_client
-    from ..orchestrator import EventType, ProcessStatus, WorkflowEngine, get_event_bus
+    from ..orchestrator import (
+        EventType,
+        InvalidTransitionError,
+        ProcessStatus,
+        WorkflowNotFoundError,
+        get_event_bus,
+        get_workflow_engine,
+    )
 except ImportError:
     from pathlib import Path
 
     sys.path.insert(0, str(Path(__file__).parent.parent))
     from database import get_postgres_client
-    from orchestrator import EventType, ProcessStatus, WorkflowEngine, get_event_bus
+    from orchestrator import (
+        EventType,
+        InvalidTransitionError,
+        ProcessStatus,
+        WorkflowNotFoundError,
+        get_event_bus,
+        get_workflow_engine,
+    )
 
 
 router = APIRouter()
-engine = WorkflowEngine()
+engine = get_workflow_engine()
 db = get_postgres_client()
 event_bus = get_event_bus()
 
@@ -304,6 +318,10 @@ def update_process_status(process_id: str, request: UpdateProcessStatusRequest)
 
     except HTTPException:
         raise
+    except WorkflowNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except InvalidTransitionError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to update process status: {str(e)}")
 
@@ -328,6 +346,10 @@ def suspend_process(process_id: str, user_id: str, reason: str) -> Dict[str, Any
 
         return process
 
+    except WorkflowNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except InvalidTransitionError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to suspend process: {str(e)}")
 
@@ -351,6 +373,10 @@ def resume_process(process_id: str, user_id: str) -> Dict[str, Any]:
 
         return process
 
+    except WorkflowNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except InvalidTransitionError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to resume process: {str(e)}")
 
@@ -383,6 +409,21 @@ def get_process_events(process_id: str, limit: int = Query(100, ge=1, le=500)) -
         raise HTTPException(status_code=500, detail=f"Failed to get process events: {str(e)}")
 
 
+@router.get("/api/processes/events/recent")
+def get_recent_events(event_type: Optional[EventType] = None, limit: int = Query(100, ge=1, le=1000)) -> Response:
+    """
+    Get recent events from the in-memory event bus history
+
+    Args:
+        event_type: Optional event type filter
+        limit: Max events to return
+
+    Returns:
+        List of events, most recent first (pre-encoded JSON)
+    """
+    return Response(content=event_bus.get_event_history_json(event_type, limit), media_type="application/json")
+
+
 @router.get("/api/processes/stats/summary")
 def get_process_stats() -> Dict[str, Any]:
     """
@@ -407,7 +448,7 @@ def get_process_stats() -> Dict[str, Any]:
             WHERE created_at > NOW() - INTERVAL '30 days'
         """
 
-        stats = db.execute_query(query, fetch="one")
+        stats = db.execute_query(query, fetch="one", cache_read=True)
         return stats or {}
 
     except Exception as e:
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import os
 import sys
@@ -9,6 +10,7 @@ from pydantic import BaseModel
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
+from cache import get_semantic_cache  # noqa: E402
 from claude_client import get_claude_client  # noqa: E402
 from logging_config import get_logger  # noqa: E402
 from neo4j_client import get_neo4j_client  # noqa: E402
@@ -251,13 +253,26 @@ async def query_rag(request: RAGQuery):
     if not HAS_CHROMA:
         raise HTTPException(status_code=500, detail="RAG system not available. Install chromadb: pip install chromadb")
 
-    # Route to appropriate RAG mode
+    # Serve near-duplicate queries from the semantic cache when enabled
+    semantic_cache = get_semantic_cache()
+    cache_namespace = f"{request.rag_mode}:{request.top_k}:{request.atom_type}"
+    query_embedding = None
+    if semantic_cache:
+        # Embedding the query blocks; keep it for set() so a miss embeds once
+        cached_response, query_embedding = await asyncio.to_thread(
+            semantic_cache.lookup, request.query, cache_namespace
+        )
+        if cached_response is not None:
+            return cached_response
+
+    # Route to appropriate RAG mode. Chroma, Neo4j and Claude clients block,
+    # so retrieval and answer generation run in worker threads
     if request.rag_mode == "entity":
-        results = entity_rag(request.query, request.top_k, request.atom_type)
+        results = await asyncio.to_thread(entity_rag, request.query, request.top_k, request.atom_type)
     elif request.rag_mode == "path":
-        results = path_rag(request.query, request.top_k)
+        results = await asyncio.to_thread(path_rag, request.query, request.top_k)
     elif request.rag_mode == "impact":
-        results = impact_rag(request.query, request.top_k)
+        results = await asyncio.to_thread(impact_rag, request.query, request.top_k)
     else:
         raise HTTPException(status_code=400, detail=f"Unknown RAG mode: {request.rag_mode}")
 
@@ -270,8 +285,12 @@ async def query_rag(request: RAGQuery):
     if claude_client:
         try:
             # Generate context-grounded answer using Claude
-            claude_response = claude_client.generate_rag_answer(
-                query=request.query, context_atoms=results, rag_mode=request.rag_mode, max_tokens=1024
+            claude_response = await asyncio.to_thread(
+                claude_client.generate_rag_answer,
+                query=request.query,
+                context_atoms=results,
+                rag_mode=request.rag_mode,
+                max_tokens=1024,
             )
 
             answer = claude_response.get("answer", "Error generating answer")
@@ -280,7 +299,10 @@ async def query_rag(request: RAGQuery):
             # Extract context atom IDs
             context_ids = [s["id"] for s in sources if s.get("id")]
 
-            return RAGResponse(answer=answer, sources=sources, context_atoms=context_ids)
+            response = RAGResponse(answer=answer, sources=sources, context_atoms=context_ids)
+            if semantic_cache and "error" not in claude_response:
+                semantic_cache.set(request.query, response, namespace=cache_namespace, embedding=query_embedding)
+            return response
         except Exception as e:  # noqa: F841
             logger.exception("Claude API request failed")
             # Fall through to fallback answer
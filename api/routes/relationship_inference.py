@@ -515,6 +515,8 @@ def apply_relationship_suggestion(source_id: str, target_id: str, edge_type: str
                 source_id=source_id,
                 target_id=target_id,
             )
+        # A new edge changes the traversals of every atom that can reach either end
+        neo4j_client.invalidate()
 
         # Update YAML file
         atoms_base = Path(__file__).parent.parent.parent / "atoms"
@@ -16,9 +16,11 @@ try:
     from ..orchestrator import (
         AssignmentMethod,
         EventType,
+        InvalidTransitionError,
         TaskRouter,
-        WorkflowEngine,
+        WorkflowNotFoundError,
         get_event_bus,
+        get_workflow_engine,
     )
 except ImportError:
     from pathlib import Path
@@ -28,14 +30,16 @@ except ImportError:
     from orchestrator import (
         AssignmentMethod,
         EventType,
+        InvalidTransitionError,
         TaskRouter,
-        WorkflowEngine,
+        WorkflowNotFoundError,
         get_event_bus,
+        get_workflow_engine,
     )
 
 
 router = APIRouter()
-engine = WorkflowEngine()
+engine = get_workflow_engine()
 task_router = TaskRouter()
 db = get_postgres_client()
 event_bus = get_event_bus()
@@ -127,6 +131,8 @@ def create_task(request: CreateTaskRequest) -> Dict[str, Any]:
 
         return task
 
+    except WorkflowNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to create task: {str(e)}")
 
@@ -239,7 +245,7 @@ def assign_task(task_id: str, request: AssignTaskRequest) -> Dict[str, Any]:
         except ValueError:
             raise HTTPException(status_code=400, detail=f"Invalid assignment method: {request.assignment_method}")
 
-        if method == AssignmentMethod.MANUAL:
+        if method is AssignmentMethod.MANUAL:
             if not request.assigned_to:
                 raise HTTPException(status_code=400, detail="assigned_to required for manual assignment")
 
@@ -263,6 +269,10 @@ def assign_task(task_id: str, request: AssignTaskRequest) -> Dict[str, Any]:
 
     except HTTPException:
         raise
+    except WorkflowNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except InvalidTransitionError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to assign task: {str(e)}")
 
@@ -289,6 +299,10 @@ def start_task(task_id: str, request: StartTaskRequest) -> Dict[str, Any]:
 
         return task
 
+    except WorkflowNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except InvalidTransitionError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to start task: {str(e)}")
 
@@ -310,11 +324,17 @@ def complete_task(task_id: str, request: CompleteTaskRequest) -> Dict[str, Any]:
 
         # Publish event
         event_bus.publish(
-            EventType.TASK_COMPLETED, {"task_id": task_id, "user_id": request.user_id}, source=request.user_id
+            EventType.TASK_COMPLETED,
+            {"task_id": task_id, "user_id": request.user_id, "assigned_to": task.get("assigned_to")},
+            source=request.user_id,
         )
 
         return task
 
+    except WorkflowNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except InvalidTransitionError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to complete task: {str(e)}")
 
@@ -414,7 +434,7 @@ def get_workload_stats() -> Dict[str, Any]:
             ORDER BY active_tasks DESC
         """
 
-        workloads = db.execute_query(query)
+        workloads = db.execute_query(query, cache_read=True)
         return {"user_workloads": workloads or []}
 
     except Exception as e:
@@ -1,3 +1,4 @@
+import asyncio
 import os
 import secrets
 
@@ -37,7 +38,9 @@ from .routes import (
     templates,
     websocket,
 )
-from .database import get_postgres_client
+from .database import close_redis_client, get_postgres_client
+from .error_responses import FastJSONResponse
+from .orchestrator import close_workflow_engine
 
 
 def get_admin_token():
@@ -47,7 +50,28 @@ def get_admin_token():
     return token
 
 
-app = FastAPI(title="GNDP API", description="Graph-Native Documentation Platform API", version="0.1.0")
+app = FastAPI(
+    title="GNDP API",
+    description="Graph-Native Documentation Platform API",
+    version="0.1.0",
+    default_response_class=FastJSONResponse,
+)
+
+
+# Staleness accepted for /api/tasks/stats/assignment (mv_assignment_stats_7d)
+ASSIGNMENT_STATS_REFRESH_SECONDS = int(os.environ.get("ASSIGNMENT_STATS_REFRESH_SECONDS", "300"))
+
+_background_tasks = []
+
+
+async def refresh_assignment_stats_periodically():
+    """Refresh the assignment stats materialized view on a fixed interval"""
+    while True:
+        await asyncio.sleep(ASSIGNMENT_STATS_REFRESH_SECONDS)
+        try:
+            await asyncio.to_thread(tasks.task_router.refresh_assignment_stats)
+        except Exception as e:
+            print(f"Warning: Assignment stats refresh failed: {e}")
 
 
 @app.on_event("startup")
@@ -60,6 +84,20 @@ async def startup_event():
     except Exception as e:
         print(f"Warning: Database initialization failed: {e}")
 
+    _background_tasks.append(asyncio.create_task(refresh_assignment_stats_periodically()))
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop background jobs, flush queued task and process events and close the Redis client"""
+    for task in _background_tasks:
+        task.cancel()
+    _background_tasks.clear()
+    await asyncio.to_thread(tasks.task_router.close)
+    await asyncio.to_thread(close_workflow_engine)
+
+    close_redis_client()
+
 
 # CORS configuration - restrict in production
 allowed_origins = os.environ.get(
@@ -114,6 +114,8 @@ def mock_neo4j_driver():
     """
     driver = MagicMock()
     session = MagicMock()
+    # Managed transactions run their work function against the session itself
+    session.execute_read.side_effect = lambda work, *args, **kwargs: work(session)
 
     # Configure session context manager
     driver.session.return_value.__enter__ = Mock(return_value=session)
@@ -162,6 +164,7 @@ def neo4j_client_with_data(mock_neo4j_client):
         Mock: Neo4j client with configured responses
     """
     session_mock = MagicMock()
+    session_mock.execute_read.side_effect = lambda work, *args, **kwargs: work(session_mock)
     mock_neo4j_client.driver.session.return_value.__enter__.return_value = session_mock
 
     # Default responses
@@ -172,14 +175,14 @@ def neo4j_client_with_data(mock_neo4j_client):
         result_mock = MagicMock()
 
         # Handle find_upstream_dependencies
-        if "requires|depends_on" in query and "->" in query:
+        if "'requires>" in query:
             if kwargs.get("atom_id") == "REQ-001":
                 result_mock.data.return_value = []  # No upstream deps
             result_mock.__iter__ = Mock(return_value=iter([]))
             return result_mock
 
         # Handle find_downstream_impacts
-        if "requires|depends_on|affects" in query and "<-" in query:
+        if "'<requires" in query:
             if kwargs.get("atom_id") == "REQ-001":
                 # Return downstream dependencies
                 result_mock.data.return_value = [{"downstream": SAMPLE_ATOMS[1], "depth": 1}]
@@ -221,11 +224,23 @@ def mock_anthropic_client():
         MagicMock: Mocked Anthropic client
     """
     mock_client = MagicMock()
-    mock_client.messages.create.return_value = MagicMock(
-        content=[MagicMock(text="This is a test answer with relevant information.")],
+    mock_client.messages.stream.return_value = _mock_message_stream("This is a test answer with relevant information.")
+    return mock_client
+
+
+def _mock_message_stream(text):
+    """Build a mock ``messages.stream`` context manager yielding ``text``."""
+    stream = MagicMock()
+    stream.text_stream = [text]
+    stream.get_final_message.return_value = MagicMock(
+        content=[MagicMock(text=text)],
         usage=MagicMock(input_tokens=100, output_tokens=50, total_tokens=150),
     )
-    return mock_client
+
+    manager = MagicMock()
+    manager.__enter__.return_value = stream
+    manager.__exit__.return_value = None
+    return manager
 
 
 @pytest.fixture
@@ -265,33 +280,24 @@ def claude_client_with_responses(mock_claude_client):
         Mock: Claude client with configured responses
     """
 
-    def create_response(mode):
-        """Generate response based on RAG mode."""
-        responses = {
-            "entity": "The authentication system uses OAuth 2.0 protocol for secure user login.",
-            "path": "REQ-001 requires DESIGN-001, which implements PROC-001, which is validated by VAL-001.",
-            "impact": "Changes to REQ-001 would impact DESIGN-001, PROC-001, and VAL-001.",
-        }
-
-        return MagicMock(
-            content=[MagicMock(text=responses.get(mode, "Answer based on context."))],
-            usage=MagicMock(input_tokens=100, output_tokens=50, total_tokens=150),
-        )
-
-    # Store original for mode detection
-    original_create = mock_claude_client.client.messages.create  # noqa: F841
+    responses = {
+        "entity": "The authentication system uses OAuth 2.0 protocol for secure user login.",
+        "path": "REQ-001 requires DESIGN-001, which implements PROC-001, which is validated by VAL-001.",
+        "impact": "Changes to REQ-001 would impact DESIGN-001, PROC-001, and VAL-001.",
+    }
 
-    def messages_create_side_effect(model, max_tokens, system, messages):
+    def messages_stream_side_effect(model, max_tokens, system, messages):
         """Determine RAG mode from system prompt."""
+        system_text = "".join(block["text"] for block in system)
         rag_mode = "entity"
-        if "PATH RAG MODE" in system:
+        if "PATH RAG MODE" in system_text:
             rag_mode = "path"
-        elif "IMPACT RAG MODE" in system:
+        elif "IMPACT RAG MODE" in system_text:
             rag_mode = "impact"
 
-        return create_response(rag_mode)
+        return _mock_message_stream(responses[rag_mode])
 
-    mock_claude_client.client.messages.create.side_effect = messages_create_side_effect
+    mock_claude_client.client.messages.stream.side_effect = messages_stream_side_effect
 
     return mock_claude_client
 
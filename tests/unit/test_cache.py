@@ -0,0 +1,210 @@
+"""
+Unit tests for the in-memory cache.
+
+Tests the Cache and SemanticCache classes with coverage of:
+- Cache key generation for hashable and unhashable arguments
+- TTL expiration and LRU eviction
+- Memoization with custom key functions
+- Semantic (embedding-similarity) lookups and namespaces
+- Reuse of the query embedding between lookup and set
+"""
+
+import pytest
+
+from api.cache import Cache, SemanticCache
+
+np = pytest.importorskip("numpy")
+
+
+class TestCache:
+    """Tests for the exact-match cache."""
+
+    def test_generate_key_hashable_and_unhashable_arguments(self):
+        """
+        Test that keys are stable for both hashable and unhashable arguments.
+
+        Verifies identical calls map to the same key and different calls do not.
+        """
+        cache = Cache()
+
+        assert cache._generate_key("f", (1, "a"), {"b": 2}) == cache._generate_key("f", (1, "a"), {"b": 2})
+        assert cache._generate_key("f", ([1],), {}) == cache._generate_key("f", ([1],), {})
+        assert cache._generate_key("f", ([1],), {}) != cache._generate_key("f", ([2],), {})
+
+    def test_memoize_distinguishes_arguments_with_equal_hashes(self):
+        """
+        Test that arguments with colliding hashes get separate entries.
+
+        Verifies keys compare arguments for equality (hash(-1) == hash(-2)).
+        """
+        cache = Cache()
+
+        @cache.memoize()
+        def double(value):
+            return value * 2
+
+        assert hash(-1) == hash(-2)
+        assert double(-1) == -2
+        assert double(-2) == -4
+
+    def test_invalidate_prefix_matches_memoize_keys(self):
+        """
+        Test prefix invalidation of tuple keys built by memoize.
+
+        Verifies the function name (the tuple's first element) is matched.
+        """
+        cache = Cache()
+
+        @cache.memoize()
+        def load(value):
+            return value
+
+        load(1)
+        load(2)
+        cache.set("other", 3)
+
+        assert cache.invalidate_prefix("load") == 2
+        assert cache.get("other") == 3
+
+    def test_expired_entries_are_not_returned(self, monkeypatch):
+        """
+        Test that entries past their TTL are treated as misses.
+
+        Verifies expiry uses the monotonic clock.
+        """
+        now = [1000.0]
+        monkeypatch.setattr("api.cache.time.monotonic", lambda: now[0])
+        cache = Cache(ttl_seconds=10)
+
+        cache.set("key", "value")
+        assert cache.get("key") == "value"
+
+        now[0] += 11
+        assert cache.get("key") is None
+        assert cache.stats()["entry_count"] == 0
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """
+        Test LRU eviction once max_entries is exceeded.
+
+        Verifies that a recently read entry survives eviction.
+        """
+        cache = Cache(max_entries=2)
+
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_invalidate_prefix_removes_matching_keys(self):
+        """
+        Test removing a group of entries by key prefix.
+
+        Verifies that only keys sharing the prefix are evicted.
+        """
+        cache = Cache()
+        cache.set("REQ-1|up", 1)
+        cache.set("REQ-1|down", 2)
+        cache.set("REQ-10|up", 3)
+
+        assert cache.invalidate_prefix("REQ-1|") == 2
+        assert cache.get("REQ-1|up") is None
+        assert cache.get("REQ-10|up") == 3
+
+    def test_memoize_with_key_fn(self):
+        """
+        Test memoize with a caller-supplied key function.
+
+        Verifies that only the fields selected by key_fn affect cache hits.
+        """
+        cache = Cache()
+        calls = []
+
+        @cache.memoize(key_fn=lambda query, atoms: (query, tuple(a["id"] for a in atoms)))
+        def answer(query, atoms):
+            calls.append(query)
+            return query.upper()
+
+        assert answer("q", [{"id": 1, "content": "x"}]) == "Q"
+        assert answer("q", [{"id": 1, "content": "y"}]) == "Q"
+        answer("q", [{"id": 2}])
+
+        assert len(calls) == 2
+
+
+class TestSemanticCache:
+    """Tests for the embedding-similarity cache tier."""
+
+    VOCAB = {"what": 0, "is": 1, "x": 2, "y": 3}
+
+    def _embed(self, text):
+        vector = np.zeros(len(self.VOCAB) + 1)
+        for word in text.lower().strip("?").split():
+            vector[self.VOCAB.get(word, len(self.VOCAB))] += 1
+        return vector
+
+    def test_similar_query_hits(self):
+        """
+        Test that a near-duplicate query returns the cached value.
+
+        Verifies that case and punctuation differences still hit.
+        """
+        cache = SemanticCache(embed_fn=self._embed, threshold=0.85)
+        cache.set("what is X", "answer")
+
+        assert cache.get("What is x?") == "answer"
+
+    def test_dissimilar_query_misses(self):
+        """
+        Test that an unrelated query does not hit.
+
+        Verifies the similarity threshold is enforced.
+        """
+        cache = SemanticCache(embed_fn=self._embed, threshold=0.85)
+        cache.set("what is X", "answer")
+
+        assert cache.get("y") is None
+
+    def test_namespaces_are_isolated(self):
+        """
+        Test that entries in one namespace are invisible to another.
+
+        Verifies answers are not shared across RAG modes.
+        """
+        cache = SemanticCache(embed_fn=self._embed)
+        cache.set("what is X", "entity answer", namespace="entity")
+
+        assert cache.get("what is X", namespace="entity") == "entity answer"
+        assert cache.get("what is X", namespace="path") is None
+
+    def test_miss_embeds_query_once(self):
+        """
+        Test that a lookup miss followed by set embeds the query once.
+
+        Verifies set() reuses the embedding returned by lookup() and the entry is indexed.
+        """
+        calls = []
+        cache = SemanticCache(embed_fn=lambda text: calls.append(text) or self._embed(text))
+
+        value, embedding = cache.lookup("what is X")
+        cache.set("what is X", "answer", embedding=embedding)
+
+        assert value is None
+        assert calls == ["what is X"]
+        assert cache.get("What is x?") == "answer"
+
+    def test_exact_hit_skips_embedding(self):
+        """
+        Test that an exact match is served without embedding the query.
+
+        Verifies lookup() returns no embedding on an exact hit.
+        """
+        cache = SemanticCache(embed_fn=self._embed)
+        cache.set("what is X", "answer")
+        cache._embed_fn = lambda text: pytest.fail(f"embedded {text!r}")
+
+        assert cache.lookup("what is X") == ("answer", None)
@@ -139,7 +139,35 @@ class TestGenerateRAGAnswer:
 
         assert "answer" in response
         # Verify the API was called
-        assert mock_claude_client.client.messages.create.called
+        assert mock_claude_client.client.messages.stream.called
+
+    def test_generate_rag_answer_marks_system_prompt_cacheable(self, mock_claude_client, sample_atoms):
+        """
+        Test that the system prompt is sent as a cacheable content block.
+
+        Verifies prompt caching is requested for the static system prompt.
+        """
+        mock_claude_client.generate_rag_answer(query="Test query", context_atoms=sample_atoms[:1])
+
+        system = mock_claude_client.client.messages.stream.call_args.kwargs["system"]
+        assert isinstance(system, list)
+        assert system[-1]["cache_control"] == {"type": "ephemeral"}
+        assert "CRITICAL RULES" in system[-1]["text"]
+
+    def test_generate_rag_answer_streams_text_to_callback(self, mock_claude_client, sample_atoms):
+        """
+        Test that streamed text deltas are forwarded to the on_text callback.
+
+        Verifies the assembled answer matches the streamed deltas.
+        """
+        deltas = []
+
+        response = mock_claude_client.generate_rag_answer(
+            query="Test query", context_atoms=sample_atoms[:1], on_text=deltas.append
+        )
+
+        assert deltas == ["This is a test answer with relevant information."]
+        assert response["answer"] == "".join(deltas)
 
     def test_generate_rag_answer_with_empty_context(self, mock_claude_client):
         """
@@ -198,7 +226,7 @@ class TestGenerateRAGAnswer:
 
         Verifies that API errors are caught and reported.
         """
-        mock_claude_client.client.messages.create.side_effect = Exception("API Error")
+        mock_claude_client.client.messages.stream.side_effect = Exception("API Error")
 
         response = mock_claude_client.generate_rag_answer(query="Test query", context_atoms=sample_atoms[:1])
 
@@ -0,0 +1,122 @@
+"""
+Unit tests for the background process_events writer.
+
+Tests the ProcessEventWriter class with a mocked database, covering:
+- Batching of queued rows into multi-row INSERTs
+- Flushing on close()
+- Enqueue-time timestamps and custom row templates
+- Dropping rows when the bounded queue is full
+"""
+
+from datetime import datetime
+from unittest.mock import MagicMock
+
+from api.orchestrator.event_writer import ProcessEventWriter
+
+
+def _written_rows(db):
+    """All rows passed to execute_values, in call order."""
+    return [row for call in db.execute_values.call_args_list for row in call.args[1]]
+
+
+class TestProcessEventWriter:
+    """Tests for ProcessEventWriter."""
+
+    def test_close_flushes_queued_rows(self):
+        """
+        Test that rows queued before close() are written.
+
+        Verifies the writer thread is stopped afterwards.
+        """
+        db = MagicMock()
+        writer = ProcessEventWriter(db, "test-events", ("event_type", "message"), flush_interval=60)
+
+        writer.put(("task_created", "first"))
+        writer.put(("task_started", "second"))
+        thread = writer._thread
+        writer.close()
+
+        assert [row[:2] for row in _written_rows(db)] == [("task_created", "first"), ("task_started", "second")]
+        assert not thread.is_alive()
+
+    def test_rows_are_written_in_batches(self):
+        """
+        Test that no INSERT holds more than batch_size rows.
+
+        Verifies every queued row is still written once.
+        """
+        db = MagicMock()
+        writer = ProcessEventWriter(db, "test-events", ("message",), flush_interval=60, batch_size=2)
+
+        for i in range(5):
+            writer.put((str(i),))
+        writer.close()
+
+        assert all(len(call.args[1]) <= 2 for call in db.execute_values.call_args_list)
+        assert [row[0] for row in _written_rows(db)] == ["0", "1", "2", "3", "4"]
+
+    def test_rows_carry_enqueue_timestamp(self):
+        """
+        Test that each row is stamped when queued, not when flushed.
+
+        Verifies the timestamp column is inserted explicitly.
+        """
+        db = MagicMock()
+        writer = ProcessEventWriter(db, "test-events", ("message",), flush_interval=60)
+
+        writer.put(("first",))
+        writer.put(("second",))
+        writer.close()
+
+        query = db.execute_values.call_args.args[0]
+        first, second = _written_rows(db)
+        assert "(message, timestamp)" in query
+        assert isinstance(first[1], datetime) and first[1].tzinfo is not None
+        assert first[1] <= second[1]
+
+    def test_placeholders_build_row_template(self):
+        """
+        Test per-column placeholders such as jsonb_object().
+
+        Verifies the template adds a plain placeholder for the timestamp.
+        """
+        db = MagicMock()
+        writer = ProcessEventWriter(
+            db, "test-events", ("event_type", "details"), placeholders=("%s", "jsonb_object(%s::text[])")
+        )
+
+        writer.put(("task_assigned", ["method", "manual"]))
+        writer.close()
+
+        assert db.execute_values.call_args.kwargs["template"] == "(%s, jsonb_object(%s::text[]), %s)"
+
+    def test_full_queue_drops_and_counts_rows(self):
+        """
+        Test that rows are dropped, not blocked on, when the queue is full.
+
+        Verifies dropped_events counts each dropped row.
+        """
+        db = MagicMock()
+        writer = ProcessEventWriter(db, "test-events", ("message",), max_queue_size=1)
+        writer._thread = MagicMock()  # No consumer, so the queue stays full
+
+        assert writer.put(("kept",)) is True
+        assert writer.put(("dropped",)) is False
+        assert writer.put(("dropped",)) is False
+        assert writer.dropped_events == 2
+
+    def test_write_failure_is_logged_not_raised(self):
+        """
+        Test that a failing INSERT does not stop the writer.
+
+        Verifies later rows are still written.
+        """
+        db = MagicMock()
+        db.execute_values.side_effect = [Exception("database down"), 1]
+        writer = ProcessEventWriter(db, "test-events", ("message",), batch_size=1, flush_interval=60)
+
+        writer.put(("lost",))
+        writer.put(("kept",))
+        writer.close()
+
+        assert db.execute_values.call_count == 2
@@ -0,0 +1,55 @@
+"""
+Unit tests for the change history routes.
+
+Tests revert_change against a mocked Neo4j client, covering:
+- Eviction of cached traversals after a revert
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from api.routes.history import revert_change
+
+
+def _neo4j_client(field):
+    """Neo4j client mock holding one change to ``field`` of atom REQ-001."""
+    session = MagicMock()
+    session.run.return_value.single.return_value = {
+        "c": {"atom_id": "REQ-001", "field": field, "old_value": "old", "new_value": "new"}
+    }
+    client = MagicMock()
+    client.is_connected.return_value = True
+    client.driver.session.return_value.__enter__.return_value = session
+    return client
+
+
+class TestRevertChange:
+    """Tests for POST /api/history/revert/{change_id}."""
+
+    @pytest.mark.parametrize("field", ["title", "name", "type"])
+    def test_projected_field_revert_clears_all_traversals(self, field):
+        """
+        Test that reverting a projected field evicts every cached traversal.
+
+        Verifies neighbours' rows holding the old value are not served.
+        """
+        client = _neo4j_client(field)
+
+        with patch("api.routes.history.get_neo4j_client", return_value=client):
+            revert_change("change-1")
+
+        client.invalidate.assert_called_once_with(None)
+
+    def test_other_field_revert_clears_only_the_atom(self):
+        """
+        Test that reverting an unprojected field evicts only the atom's traversals.
+
+        Verifies other atoms keep their cached results.
+        """
+        client = _neo4j_client("summary")
+
+        with patch("api.routes.history.get_neo4j_client", return_value=client):
+            revert_change("change-1")
+
+        client.invalidate.assert_called_once_with("REQ-001")
@@ -0,0 +1,122 @@
+"""
+Unit tests for the in-memory mock database engine.
+
+Tests the MockDatabaseEngine class with coverage of:
+- WHERE filters answered from the status and assignee indexes
+- Filters on columns without an index
+- LIMIT/OFFSET pagination of list queries
+"""
+
+import pytest
+
+from api.database.mock_engine import MockDatabaseEngine
+
+COUNT_TASKS = "SELECT COUNT(*) as count FROM tasks {where}"
+LIST_TASKS = """
+    SELECT *
+    FROM tasks
+    {where}
+    ORDER BY created_at DESC
+    LIMIT %s OFFSET %s
+"""
+
+
+@pytest.fixture
+def engine():
+    """Mock engine with extra tasks for alice and bob in several statuses."""
+    mock_engine = MockDatabaseEngine()
+    for i, (status, assignee) in enumerate(
+        [
+            ("assigned", "alice"),
+            ("in_progress", "alice"),
+            ("assigned", "alice"),
+            ("assigned", "bob"),
+            ("completed", "alice"),
+        ]
+    ):
+        mock_engine._create_sample_task(f"extra-{i}", "proc-3", f"Task {i}", status, assignee)
+    return mock_engine
+
+
+class TestFilters:
+    """Tests for WHERE filters in count and list queries."""
+
+    def test_status_and_assignee_filters_intersect(self, engine):
+        """
+        Test that two indexed filters return only rows matching both.
+
+        Verifies count and list queries agree.
+        """
+        where = "WHERE status = %s AND assigned_to = %s"
+
+        count = engine.execute_query(COUNT_TASKS.format(where=where), ("assigned", "alice"), fetch="one")
+        rows = engine.execute_query(LIST_TASKS.format(where=where), ("assigned", "alice", 50, 0))
+
+        assert count == {"count": 2}
+        assert {row["id"] for row in rows} == {"extra-0", "extra-2"}
+
+    def test_filter_on_column_without_index(self, engine):
+        """
+        Test filtering on a column that has no secondary index.
+
+        Verifies rows are checked one by one, alone and with an indexed filter.
+        """
+        count = engine.execute_query(COUNT_TASKS.format(where="WHERE process_instance_id = %s"), ("proc-1",))
+        mixed = engine.execute_query(
+            LIST_TASKS.format(where="WHERE status = %s AND process_instance_id = %s"), ("assigned", "proc-3", 50, 0)
+        )
+
+        assert count == {"count": 2}
+        assert {row["id"] for row in mixed} == {"extra-0", "extra-2", "extra-3"}
+
+    def test_unfiltered_count_uses_all_rows(self, engine):
+        """
+        Test a count query without a WHERE clause.
+
+        Verifies every task is counted.
+        """
+        assert engine.execute_query(COUNT_TASKS.format(where=""), ()) == {"count": len(engine.tasks)}
+
+    def test_unknown_value_matches_nothing(self, engine):
+        """
+        Test filtering on a value no row has.
+
+        Verifies an empty index bucket yields no rows.
+        """
+        where = "WHERE assigned_to = %s"
+
+        assert engine.execute_query(COUNT_TASKS.format(where=where), ("nobody",)) == {"count": 0}
+        assert engine.execute_query(LIST_TASKS.format(where=where), ("nobody", 50, 0)) == []
+
+    def test_index_updates_when_task_changes(self, engine):
+        """
+        Test that replacing a task moves it between index buckets.
+
+        Verifies filtered queries see the new status and assignee.
+        """
+        task = dict(engine.tasks["extra-0"], status="completed", assigned_to="bob")
+        engine._add_task(task)
+
+        where = "WHERE status = %s AND assigned_to = %s"
+        assert engine.execute_query(COUNT_TASKS.format(where=where), ("assigned", "alice")) == {"count": 1}
+        assert engine.execute_query(COUNT_TASKS.format(where=where), ("completed", "bob")) == {"count": 1}
+
+
+class TestPagination:
+    """Tests for LIMIT/OFFSET handling of list queries."""
+
+    def test_limit_and_offset_page_through_filtered_rows(self, engine):
+        """
+        Test that consecutive pages split the filtered rows without overlap.
+
+        Verifies the pages together hold every matching row once.
+        """
+        query = LIST_TASKS.format(where="WHERE assigned_to = %s")
+
+        first = engine.execute_query(query, ("alice", 2, 0))
+        second = engine.execute_query(query, ("alice", 2, 2))
+        past_end = engine.execute_query(query, ("alice", 2, 10))
+
+        assert len(first) == 2 and len(second) == 2
+        assert {row["id"] for row in first + second} == {"extra-0", "extra-1", "extra-2", "extra-4"}
+        assert past_end == []
@@ -19,6 +19,13 @@ from neo4j.exceptions import DatabaseError, Neo4jError, ServiceUnavailable
 from api.neo4j_client import Neo4jClient, close_neo4j_client, get_neo4j_client
 
 
+def _session_mock():
+    """Session mock whose managed transactions run their work function against the session itself."""
+    session = MagicMock()
+    session.execute_read.side_effect = lambda work, *args, **kwargs: work(session)
+    return session
+
+
 class TestNeo4jClientInitialization:
     """Tests for Neo4j client initialization and connection."""
 
@@ -93,7 +100,36 @@ class TestNeo4jClientInitialization:
                 "neo4j://localhost:7687",
                 auth=("neo4j", "password"),
                 encrypted=False,
+                max_connection_pool_size=50,
+                connection_acquisition_timeout=60.0,
+                connection_timeout=30.0,
+                max_transaction_retry_time=30.0,
             )
+            mock_driver.return_value.session.assert_called_with(database="neo4j")
+
+    def test_connect_ensures_indexes_when_enabled(self, monkeypatch):
+        """
+        Test that the Atom schema is created on connect when NEO4J_ENSURE_INDEXES is set.
+
+        Verifies the id constraint falls back to a plain index when it cannot be created.
+        """
+        monkeypatch.setenv("NEO4J_ENSURE_INDEXES", "1")
+
+        def run(query, **params):
+            if "CONSTRAINT" in query:
+                raise Neo4jError("An equivalent index already exists")
+            return MagicMock()
+
+        with patch("api.neo4j_client.GraphDatabase.driver") as mock_driver:
+            session = mock_driver.return_value.session.return_value.__enter__.return_value
+            session.run.side_effect = run
+
+            Neo4jClient(uri="neo4j://localhost:7687", user="neo4j", password="password")
+
+            queries = [c.args[0] for c in session.run.call_args_list]
+            assert any("REQUIRE a.id IS UNIQUE" in q for q in queries)
+            assert "CREATE INDEX atom_id_index IF NOT EXISTS FOR (a:Atom) ON (a.id)" in queries
+            assert "CREATE INDEX atom_type_index IF NOT EXISTS FOR (a:Atom) ON (a.type)" in queries
 
 
 class TestConnectionManagement:
@@ -118,15 +154,15 @@ class TestConnectionManagement:
 
     def test_is_connected_returns_false_on_exception(self, mock_neo4j_client):
         """
-        Test is_connected returns False when query fails.
+        Test is_connected returns False when the connectivity check fails.
 
-        Verifies that connection errors are handled gracefully.
+        Verifies that connection errors are handled gracefully without opening a session.
         """
-        session_mock = MagicMock()
-        session_mock.run.side_effect = Exception("Connection timeout")
-        mock_neo4j_client.driver.session.return_value.__enter__.return_value = session_mock
+        mock_neo4j_client.driver.verify_connectivity.side_effect = Exception("Connection timeout")
+        mock_neo4j_client.driver.session.reset_mock()
 
         assert mock_neo4j_client.is_connected() is False
+        mock_neo4j_client.driver.session.assert_not_called()
 
     def test_close_closes_driver(self, mock_neo4j_client):
         """
@@ -217,7 +253,7 @@ class TestUpstreamDependencies:
 
         Verifies that DatabaseError from Neo4j is properly caught and re-raised.
         """
-        session_mock = MagicMock()
+        session_mock = _session_mock()
         session_mock.run.side_effect = DatabaseError("Query execution failed")
         mock_neo4j_client.driver.session.return_value.__enter__.return_value = session_mock
 
@@ -237,7 +273,7 @@ class TestUpstreamDependencies:
             ("depth", 1),
         ]
 
-        session_mock = MagicMock()
+        session_mock = _session_mock()
         session_mock.run.return_value = [result_record]
         mock_neo4j_client.driver.session.return_value.__enter__.return_value = session_mock
 
@@ -246,6 +282,48 @@ class TestUpstreamDependencies:
         assert isinstance(result, list)
         assert len(result) == 1
 
+    def test_find_upstream_dependencies_cached_until_invalidated(self, mock_neo4j_client):
+        """
+        Test that repeat traversals are served from the traversal cache.
+
+        Verifies a second identical call skips Cypher and invalidate() forces a re-read.
+        """
+        session_mock = _session_mock()
+        session_mock.run.return_value = [{"upstream": {"id": "REQ-001"}, "rel_path": [], "depth": 1}]
+        mock_neo4j_client.driver.session.return_value.__enter__.return_value = session_mock
+
+        first = mock_neo4j_client.find_upstream_dependencies("DESIGN-001")
+        second = mock_neo4j_client.find_upstream_dependencies("DESIGN-001")
+        assert first == second
+        assert session_mock.run.call_count == 1
+
+        mock_neo4j_client.find_upstream_dependencies("DESIGN-001", max_depth=2)
+        assert session_mock.run.call_count == 2
+
+        mock_neo4j_client.invalidate("DESIGN-001")
+        mock_neo4j_client.find_upstream_dependencies("DESIGN-001")
+        assert session_mock.run.call_count == 3
+
+    def test_find_upstream_dependencies_batch_groups_by_atom(self, mock_neo4j_client):
+        """
+        Test batched upstream lookup for several atoms.
+
+        Verifies one query is issued with all IDs and rows are grouped per atom.
+        """
+        session_mock = _session_mock()
+        session_mock.run.return_value = [
+            {"atom_id": "PROC-001", "upstream": {"id": "DESIGN-001"}, "rel_path": [], "depth": 1},
+            {"atom_id": "PROC-001", "upstream": {"id": "REQ-001"}, "rel_path": [], "depth": 2},
+        ]
+        mock_neo4j_client.driver.session.return_value.__enter__.return_value = session_mock
+
+        result = mock_neo4j_client.find_upstream_dependencies_batch(["PROC-001", "REQ-001"])
+
+        session_mock.run.assert_called_once()
+        assert session_mock.run.call_args.kwargs["atom_ids"] == ["PROC-001", "REQ-001"]
+        assert [row["upstream"]["id"] for row in result["PROC-001"]] == ["DESIGN-001", "REQ-001"]
+        assert result["REQ-001"] == []
+
 
 class TestDownstreamImpacts:
     """Tests for finding downstream impacts."""
@@ -289,13 +367,30 @@ class TestDownstreamImpacts:
 
         Verifies that DatabaseError is properly caught and re-raised.
         """
-        session_mock = MagicMock()
+        session_mock = _session_mock()
         session_mock.run.side_effect = DatabaseError("Query execution failed")
         mock_neo4j_client.driver.session.return_value.__enter__.return_value = session_mock
 
         with pytest.raises(Neo4jError, match="Error finding downstream impacts"):
             mock_neo4j_client.find_downstream_impacts("REQ-001")
 
+    def test_find_downstream_impacts_iter_streams_with_fetch_size(self, mock_neo4j_client):
+        """
+        Test streaming downstream impacts.
+
+        Verifies the read session is opened with the fetch size and rows are yielded lazily.
+        """
+        session_mock = _session_mock()
+        session_mock.run.return_value = iter([{"downstream": {"id": "PROC-001"}, "rel_path": [], "depth": 1}])
+        mock_neo4j_client.driver.session.return_value.__enter__.return_value = session_mock
+        mock_neo4j_client.driver.session.reset_mock()
+
+        records = mock_neo4j_client.find_downstream_impacts_iter("REQ-001")
+        mock_neo4j_client.driver.session.assert_not_called()
+
+        assert list(records) == [{"downstream": {"id": "PROC-001"}, "rel_path": [], "depth": 1}]
+        assert mock_neo4j_client.driver.session.call_args.kwargs["fetch_size"] == 500
+
 
 class TestFullContext:
     """Tests for full context retrieval."""
@@ -320,7 +415,7 @@ class TestFullContext:
         related_result_record.items.return_value = [("related", related_atoms[0]), ("connection_count", 2)]
         related_result.__iter__ = Mock(return_value=iter([related_result_record]))
 
-        session_mock = MagicMock()
+        session_mock = _session_mock()
         session_mock.run.side_effect = [center_result, related_result]
         mock_neo4j_client.driver.session.return_value.__enter__.return_value = session_mock
 
@@ -339,7 +434,7 @@ class TestFullContext:
         center_result = MagicMock()
         center_result.data.return_value = []
 
-        session_mock = MagicMock()
+        session_mock = _session_mock()
         session_mock.run.return_value = center_result
         mock_neo4j_client.driver.session.return_value.__enter__.return_value = session_mock
 
@@ -360,7 +455,7 @@ class TestFullContext:
         related_result = MagicMock()
         related_result.__iter__ = Mock(return_value=iter([]))
 
-        session_mock = MagicMock()
+        session_mock = _session_mock()
         session_mock.run.side_effect = [center_result, related_result]
         mock_neo4j_client.driver.session.return_value.__enter__.return_value = session_mock
 
@@ -386,28 +481,22 @@ class TestImplementationChain:
         procedure = {"id": "PROC-001", "type": "procedure"}
         validation = {"id": "VAL-001", "type": "validation"}
 
-        req_result = MagicMock()
-        req_result.data.return_value = [requirement]
-
-        design_result = MagicMock()
-        design_result.data.return_value = [design]
-
-        proc_result = MagicMock()
-        proc_result.data.return_value = [procedure]
-
-        val_result = MagicMock()
-        val_result.data.return_value = [validation]
+        chain_result = MagicMock()
+        chain_result.data.return_value = [
+            {"r": requirement, "designs": [design], "procedures": [procedure], "validations": [validation]}
+        ]
 
-        session_mock = MagicMock()
-        session_mock.run.side_effect = [req_result, design_result, proc_result, val_result]
+        session_mock = _session_mock()
+        session_mock.run.return_value = chain_result
         mock_neo4j_client.driver.session.return_value.__enter__.return_value = session_mock
 
         result = mock_neo4j_client.find_implementation_chain("REQ-001")
 
-        assert "requirement" in result
-        assert "designs" in result
-        assert "procedures" in result
-        assert "validations" in result
+        assert session_mock.run.call_count == 1
+        assert result["requirement"] == {"r": requirement}
+        assert result["designs"] == [{"d": design}]
+        assert result["procedures"] == [{"p": procedure}]
+        assert result["validations"] == [{"v": validation}]
 
     def test_find_implementation_chain_requirement_not_found(self, mock_neo4j_client):
         """
@@ -418,7 +507,7 @@ class TestImplementationChain:
         req_result = MagicMock()
         req_result.data.return_value = []
 
-        session_mock = MagicMock()
+        session_mock = _session_mock()
         session_mock.run.return_value = req_result
         mock_neo4j_client.driver.session.return_value.__enter__.return_value = session_mock
 
@@ -444,7 +533,7 @@ class TestFindByType:
         result_record2 = MagicMock()
         result_record2.items.return_value = [("a", requirements[1])]
 
-        session_mock = MagicMock()
+        session_mock = _session_mock()
         session_mock.run.return_value = [result_record, result_record2]
         mock_neo4j_client.driver.session.return_value.__enter__.return_value = session_mock
 
@@ -459,7 +548,7 @@ class TestFindByType:
 
         Verifies that the limit parameter is passed to the query.
         """
-        session_mock = MagicMock()
+        session_mock = _session_mock()
         session_mock.run.return_value = []
         mock_neo4j_client.driver.session.return_value.__enter__.return_value = session_mock
 
@@ -469,13 +558,35 @@ class TestFindByType:
         calls = session_mock.run.call_args_list
         assert len(calls) > 0
 
+    def test_find_by_type_iter_pages_and_streams(self, mock_neo4j_client):
+        """
+        Test streaming atoms of a type with skip/limit paging.
+
+        Verifies that skip and limit reach the query and records are yielded lazily.
+        """
+        result_record = MagicMock()
+        result_record.items.return_value = [("a", {"id": "DES-001"})]
+
+        session_mock = _session_mock()
+        session_mock.run.return_value = iter([result_record, result_record])
+        mock_neo4j_client.driver.session.return_value.__enter__.return_value = session_mock
+
+        records = mock_neo4j_client.find_by_type_iter("Design", limit=2, skip=4)
+        session_mock.run.assert_not_called()
+
+        assert len(list(records)) == 2
+        kwargs = session_mock.run.call_args.kwargs
+        assert kwargs["atom_type"] == "design"
+        assert kwargs["skip"] == 4
+        assert kwargs["limit"] == 2
+
     def test_find_by_type_case_insensitive(self, mock_neo4j_client):
         """
         Test that find_by_type is case-insensitive.
 
         Verifies that type names are lowercased before query.
         """
-        session_mock = MagicMock()
+        session_mock = _session_mock()
         session_mock.run.return_value = []
         mock_neo4j_client.driver.session.return_value.__enter__.return_value = session_mock
 
@@ -494,27 +605,15 @@ class TestCountAtoms:
 
         Verifies the structure of the returned count dictionary.
         """
-        total_result = MagicMock()
-        total_result.single.return_value = {"total": 5}
-
-        type_result = MagicMock()
-        type_result_record1 = MagicMock()
-        type_result_record1.items.return_value = [("type", "requirement"), ("count", 2)]
-        type_result_record2 = MagicMock()
-        type_result_record2.items.return_value = [("type", "design"), ("count", 3)]
-        type_result.__iter__ = Mock(
-            return_value=iter([{"type": "requirement", "count": 2}, {"type": "design", "count": 3}])
-        )
-
-        session_mock = MagicMock()
-        session_mock.run.side_effect = [total_result, type_result]
+        session_mock = _session_mock()
+        session_mock.run.return_value = [{"type": "requirement", "count": 2}, {"type": "design", "count": 3}]
         mock_neo4j_client.driver.session.return_value.__enter__.return_value = session_mock
 
         result = mock_neo4j_client.count_atoms()
 
-        assert "total" in result
-        assert "by_type" in result
+        assert result["by_type"] == {"requirement": 2, "design": 3}
         assert result["total"] == 5
+        assert session_mock.run.call_count == 1
 
 
 class TestHealthCheck:
@@ -526,12 +625,9 @@ class TestHealthCheck:
 
         Verifies that successful connection returns proper health status.
         """
-        session_mock = MagicMock()
-        session_mock.run.side_effect = [
-            MagicMock(),  # RETURN 1
-            MagicMock(data=lambda: [{"component": "Neo4j Server"}]),  # dbms.components()
-            MagicMock(single=lambda: {"count": 5}),  # atom count
-            MagicMock(single=lambda: {"count": 10}),  # relationship count
+        session_mock = _session_mock()
+        session_mock.run.return_value = [
+            {"database": {"name": "Neo4j Kernel"}, "atom_count": 5, "relationship_count": 10},
         ]
         mock_neo4j_client.driver.session.return_value.__enter__.return_value = session_mock
 
@@ -539,6 +635,8 @@ class TestHealthCheck:
 
         assert result["connected"] is True
         assert result["status"] == "connected"
+        assert result["graph_stats"] == {"atom_count": 5, "relationship_count": 10}
+        assert session_mock.run.call_count == 1
 
     def test_health_check_disconnected_status_when_driver_none(self):
         """
@@ -560,7 +658,7 @@ class TestHealthCheck:
 
         Verifies proper error handling and reporting.
         """
-        session_mock = MagicMock()
+        session_mock = _session_mock()
         session_mock.run.side_effect = Exception("Query failed")
         mock_neo4j_client.driver.session.return_value.__enter__.return_value = session_mock
 
@@ -619,6 +717,22 @@ class TestSerializeRecord:
 
         assert isinstance(result, dict)
 
+    def test_serialize_record_with_driver_record(self):
+        """
+        Test serializing a real driver Record holding nodes.
+
+        Verifies nodes, lists of nodes and scalars are converted by type.
+        """
+        from neo4j import Record
+        from neo4j.graph import Graph, Node
+
+        node = Node(Graph(), "4:db:1", 1, ["Atom"], {"id": "REQ-001"})
+        record = Record({"a": node, "path": ["requires", node], "depth": 2})
+
+        result = Neo4jClient._serialize_record(record)
+
+        assert result == {"a": {"id": "REQ-001"}, "path": ["requires", {"id": "REQ-001"}], "depth": 2}
+
 
 class TestSingleton:
     """Tests for singleton pattern in get_neo4j_client."""
@@ -671,7 +785,7 @@ class TestEdgeCases:
 
         Verifies proper error handling for invalid input.
         """
-        session_mock = MagicMock()
+        session_mock = _session_mock()
         session_mock.run.return_value = []
         mock_neo4j_client.driver.session.return_value.__enter__.return_value = session_mock
 
@@ -686,7 +800,7 @@ class TestEdgeCases:
 
         Verifies proper escaping and handling of special characters.
         """
-        session_mock = MagicMock()
+        session_mock = _session_mock()
         session_mock.run.return_value = []
         mock_neo4j_client.driver.session.return_value.__enter__.return_value = session_mock
 
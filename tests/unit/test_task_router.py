@@ -0,0 +1,288 @@
+"""
+Unit tests for the task router.
+
+Tests the TaskRouter class with a mocked database and an in-memory Redis
+(fakeredis, which runs the router's Lua scripts), covering:
+- Atomic least-loaded claims, their tie-break and counter re-seeding
+- Releasing a claim when the assignment fails
+- Falling back to PostgreSQL when Redis errors
+- Shared round-robin positions and workload counters
+- IDF-weighted skill scoring
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from api.orchestrator.task_router import _WORKLOAD_KEY, HAS_NUMPY, AssignmentMethod, TaskRouter
+
+try:
+    import fakeredis
+except ImportError:
+    fakeredis = None
+
+requires_fakeredis = pytest.mark.skipif(fakeredis is None, reason="fakeredis not installed")
+requires_numpy = pytest.mark.skipif(not HAS_NUMPY, reason="numpy not installed")
+
+TASK_ID = "6f1c2a0e-4a8b-4d3e-9f6a-1b2c3d4e5f60"
+PROCESS_ID = "0b7e4a1c-2d3f-4e5a-8b9c-0d1e2f3a4b5c"
+
+
+def _statement_results(results):
+    """execute_prepared side effect returning a canned result per prepared statement name."""
+    return lambda name, *args, **kwargs: results.get(name)
+
+
+@pytest.fixture
+def server():
+    """In-memory Redis server shared by every client built from it."""
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+def redis_client(server):
+    """Redis client on the in-memory server."""
+    return fakeredis.FakeRedis(server=server, decode_responses=True)
+
+
+@pytest.fixture
+def db():
+    """Mocked PostgreSQL client: every assignment UPDATE matches a task."""
+    mock_db = MagicMock()
+    mock_db.execute_prepared.side_effect = _statement_results(
+        {"task_router_assign": {"process_instance_id": PROCESS_ID}}
+    )
+    return mock_db
+
+
+def _make_router(db, redis_client, monkeypatch):
+    """TaskRouter on the given database and Redis client, audit events and skill profiles off."""
+    monkeypatch.setenv("TASK_SKILL_PROFILES", "/nonexistent/skill_profiles.yaml")
+    with (
+        patch("api.orchestrator.task_router.get_postgres_client", return_value=db),
+        patch("api.orchestrator.task_router.get_redis_client", return_value=redis_client),
+    ):
+        task_router = TaskRouter()
+    monkeypatch.setattr(task_router, "_audit_enabled", False)
+    return task_router
+
+
+@pytest.fixture
+def router(db, redis_client, monkeypatch):
+    """TaskRouter with a mocked database and in-memory Redis, audit events off."""
+    return _make_router(db, redis_client, monkeypatch)
+
+
+def _load(redis_client, user_id):
+    """A user's workload counter, or None if it is missing."""
+    count = redis_client.get(_WORKLOAD_KEY.format(user_id))
+    return None if count is None else int(count)
+
+
+@requires_fakeredis
+class TestLeastLoadedClaim:
+    """Tests for the Lua claim of the least loaded user."""
+
+    def test_claim_breaks_ties_by_user_id(self, router, redis_client):
+        """
+        Test that equally loaded users are picked in user ID order.
+
+        Verifies the winner's counter is incremented in the same step.
+        """
+        redis_client.mset({_WORKLOAD_KEY.format("carol"): 2, _WORKLOAD_KEY.format("bob"): 1})
+        redis_client.set(_WORKLOAD_KEY.format("dave"), 1)
+
+        assert router._claim_least_busy(("carol", "dave", "bob")) == ("bob", 1)
+        assert _load(redis_client, "bob") == 2
+        assert _load(redis_client, "dave") == 1
+
+    def test_missing_counter_is_reseeded_and_claim_retried(self, router, redis_client, db):
+        """
+        Test that a missing counter is seeded from PostgreSQL before claiming.
+
+        Verifies live counters are kept rather than overwritten by the seed.
+        """
+        redis_client.set(_WORKLOAD_KEY.format("alice"), 5)
+        db.execute_prepared.side_effect = _statement_results(
+            {
+                "task_router_workloads": [
+                    {"assigned_to": "alice", "task_count": 0},
+                    {"assigned_to": "bob", "task_count": 1},
+                ]
+            }
+        )
+
+        assert router._claim_least_busy(("alice", "bob")) == ("bob", 1)
+        assert _load(redis_client, "alice") == 5
+        assert _load(redis_client, "bob") == 2
+        assert redis_client.ttl(_WORKLOAD_KEY.format("bob")) > 0
+
+    def test_failed_assignment_releases_claim(self, router, redis_client, db):
+        """
+        Test that the claimed task is uncounted when the assignment fails.
+
+        Verifies the error still reaches the caller.
+        """
+        redis_client.mset({_WORKLOAD_KEY.format("alice"): 0, _WORKLOAD_KEY.format("bob"): 3})
+        db.execute_prepared.side_effect = _statement_results({})
+        db.execute_query.return_value = {"status": "completed"}
+
+        with pytest.raises(ValueError):
+            router.assign_task(TASK_ID, AssignmentMethod.LOAD_BALANCED, pool=["alice", "bob"])
+
+        assert _load(redis_client, "alice") == 0
+
+    def test_redis_error_falls_back_to_sql(self, router, server, db):
+        """
+        Test that load balancing still works when Redis is unreachable.
+
+        Verifies the least busy user is then chosen by PostgreSQL.
+        """
+        server.connected = False
+        db.execute_prepared.side_effect = _statement_results(
+            {
+                "task_router_least_busy": {"user_id": "bob", "task_count": 0},
+                "task_router_assign": {"process_instance_id": PROCESS_ID},
+            }
+        )
+
+        assert router.assign_task(TASK_ID, AssignmentMethod.LOAD_BALANCED, pool=["alice", "bob"]) == "bob"
+
+
+@requires_fakeredis
+class TestWorkloadCounters:
+    """Tests for the MGET/SET NX workload counters."""
+
+    def test_live_counters_are_read_without_postgres(self, router, redis_client, db):
+        """
+        Test that workloads come from one MGET when every counter is live.
+
+        Verifies PostgreSQL is not queried.
+        """
+        redis_client.mset({_WORKLOAD_KEY.format("alice"): 2, _WORKLOAD_KEY.format("bob"): 0})
+
+        assert router._get_user_workloads(["alice", "bob"]) == {"alice": 2, "bob": 0}
+        db.execute_prepared.assert_not_called()
+
+    def test_completed_task_decrements_live_counter_only(self, router, redis_client):
+        """
+        Test that task completion releases the assignee's counter.
+
+        Verifies an expired counter is not recreated from zero.
+        """
+        redis_client.set(_WORKLOAD_KEY.format("alice"), 2)
+
+        router._on_task_completed(MagicMock(data={"assigned_to": "alice"}))
+        router._on_task_completed(MagicMock(data={"assigned_to": "bob"}))
+
+        assert _load(redis_client, "alice") == 1
+        assert _load(redis_client, "bob") is None
+
+
+@requires_fakeredis
+class TestRoundRobin:
+    """Tests for round-robin rotation."""
+
+    def test_rotation_is_shared_between_routers(self, db, server, monkeypatch):
+        """
+        Test that API workers sharing Redis continue one rotation.
+
+        Verifies consecutive assignments from two routers go to different users.
+        """
+        first = _make_router(db, fakeredis.FakeRedis(server=server, decode_responses=True), monkeypatch)
+        second = _make_router(db, fakeredis.FakeRedis(server=server, decode_responses=True), monkeypatch)
+        pool = ["alice", "bob", "carol"]
+
+        assigned = [
+            first.assign_task(TASK_ID, AssignmentMethod.ROUND_ROBIN, team="ops", pool=pool),
+            second.assign_task(TASK_ID, AssignmentMethod.ROUND_ROBIN, team="ops", pool=pool),
+            first.assign_task(TASK_ID, AssignmentMethod.ROUND_ROBIN, team="ops", pool=pool),
+        ]
+
+        assert assigned == ["alice", "bob", "carol"]
+
+
+@requires_numpy
+class TestSkillBasedAssignment:
+    """Tests for TF-IDF weighted skill matching."""
+
+    @pytest.fixture
+    def skill_router(self, db, monkeypatch):
+        """TaskRouter without Redis whose assignments are recorded, not executed."""
+        task_router = _make_router(db, None, monkeypatch)
+        monkeypatch.setattr(task_router, "_execute_assignment", MagicMock())
+        return task_router
+
+    def test_rare_skill_is_weighted_above_common_skill(self, skill_router, monkeypatch):
+        """
+        Test that inverse document frequency favours rare skills.
+
+        Verifies the user holding the rare skill wins at equal load.
+        """
+        skill_router.load_skill_profiles(
+            {"alice": {"python": 1.0, "fraud": 1.0}, "bob": {"python": 1.0}, "carol": {"python": 1.0}}
+        )
+        columns = skill_router._skill_columns
+        monkeypatch.setattr(skill_router, "_get_user_workloads", lambda users: dict.fromkeys(users, 0))
+
+        assert skill_router._skill_matrix[0, columns["fraud"]] > skill_router._skill_matrix[0, columns["python"]]
+        assert (
+            skill_router.assign_task(
+                TASK_ID,
+                AssignmentMethod.SKILL_BASED,
+                pool=["bob", "carol", "alice"],
+                task_requirements={"skills": ["python", "fraud"]},
+            )
+            == "alice"
+        )
+
+    def test_load_is_subtracted_from_skill_fit(self, skill_router, monkeypatch):
+        """
+        Test that equally skilled users are split by active task count.
+
+        Verifies a large enough skill advantage still outweighs load.
+        """
+        skill_router.load_skill_profiles({"alice": {"python": 1.0}, "bob": {"python": 1.0}, "carol": {"python": 0.1}})
+        monkeypatch.setattr(skill_router, "_get_user_workloads", lambda users: {"alice": 3, "bob": 1, "carol": 0})
+        requirements = {"skills": ["python"]}
+
+        assert (
+            skill_router.assign_task(
+                TASK_ID, AssignmentMethod.SKILL_BASED, pool=["alice", "bob", "carol"], task_requirements=requirements
+            )
+            == "bob"
+        )
+
+    def test_unknown_skills_fall_back_to_load_balanced(self, skill_router, db):
+        """
+        Test that a task needing no profiled skill is load balanced.
+
+        Verifies the least busy user from PostgreSQL is chosen.
+        """
+        skill_router.load_skill_profiles({"alice": {"python": 1.0}})
+        db.execute_prepared.side_effect = _statement_results(
+            {"task_router_least_busy": {"user_id": "bob", "task_count": 0}}
+        )
+
+        assert (
+            skill_router.assign_task(
+                TASK_ID, AssignmentMethod.SKILL_BASED, pool=["alice", "bob"], task_requirements={"skills": ["cobol"]}
+            )
+            == "bob"
+        )
+
+    def test_profiles_file_is_loaded(self, skill_router, tmp_path):
+        """
+        Test loading skill profiles from a YAML file.
+
+        Verifies a missing file leaves skill-based assignment disabled.
+        """
+        path = tmp_path / "skill_profiles.yaml"
+        path.write_text("alice:\n  python: 1.0\nbob:\n  fraud: 0.5\n")
+
+        skill_router.load_skill_profiles_file(tmp_path / "missing.yaml")
+        assert skill_router._skill_matrix is None
+
+        skill_router.load_skill_profiles_file(path)
+        assert set(skill_router._skill_rows) == {"alice", "bob"}
+        assert set(skill_router._skill_columns) == {"python", "fraud"}
@@ -0,0 +1,113 @@
+"""
+Unit tests for the task management routes.
+
+Tests the /api/tasks endpoints against a mocked database, covering:
+- Mapping of missing tasks to 404
+- Mapping of rejected status transitions to 409
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+TASK_ID = "6f1c2a0e-4a8b-4d3e-9f6a-1b2c3d4e5f60"
+
+
+@pytest.fixture
+def db():
+    """Mocked PostgreSQL client: guarded updates match no row unless a test says otherwise."""
+    mock_db = MagicMock()
+    mock_db.execute_prepared.return_value = None
+    mock_db.execute_query.return_value = None
+    return mock_db
+
+
+@pytest.fixture
+def client(db, monkeypatch):
+    """TestClient for the task routes, with their engine and router on the mocked database."""
+    with patch("api.database.postgres_client._postgres_client", db):
+        from api.orchestrator import TaskRouter, WorkflowEngine
+        from api.routes import tasks
+
+        engine, task_router = WorkflowEngine(), TaskRouter()
+
+    monkeypatch.setattr(tasks, "engine", engine)
+    monkeypatch.setattr(tasks, "task_router", task_router)
+    monkeypatch.setattr(tasks, "db", db)
+    monkeypatch.setattr(task_router, "_get_team_members", lambda team: ("alice", "bob"))
+
+    app = FastAPI()
+    app.include_router(tasks.router)
+    yield TestClient(app)
+
+    engine.close()
+    task_router.close()
+
+
+class TestAssignTaskRoute:
+    """Tests for POST /api/tasks/{task_id}/assign."""
+
+    @pytest.mark.parametrize("method", ["manual", "round_robin", "load_balanced"])
+    def test_completed_task_returns_409(self, client, db, method):
+        """
+        Test that assigning a completed task is rejected with 409.
+
+        Verifies every assignment method refuses to reopen the task.
+        """
+        db.execute_query.return_value = {"status": "completed"}
+
+        response = client.post(
+            f"/api/tasks/{TASK_ID}/assign", json={"assignment_method": method, "assigned_to": "alice"}
+        )
+
+        assert response.status_code == 409
+        assert "completed" in response.json()["detail"]
+
+    @pytest.mark.parametrize("method", ["manual", "round_robin"])
+    def test_missing_task_returns_404(self, client, method):
+        """
+        Test that assigning a task that does not exist returns 404.
+
+        Verifies the not-found error is not reported as a server error.
+        """
+        response = client.post(
+            f"/api/tasks/{TASK_ID}/assign", json={"assignment_method": method, "assigned_to": "alice"}
+        )
+
+        assert response.status_code == 404
+
+    def test_router_guard_only_matches_assignable_statuses(self, client, db):
+        """
+        Test that the router's UPDATE is guarded by the assignable statuses.
+
+        Verifies completed tasks are not in the guard.
+        """
+        db.execute_query.return_value = {"status": "completed"}
+
+        client.post(f"/api/tasks/{TASK_ID}/assign", json={"assignment_method": "round_robin"})
+
+        name, query, params = db.execute_prepared.call_args.args[:3]
+        assert name == "task_router_assign"
+        assert "status = ANY(%s::text[])" in query
+        assert sorted(params[3]) == ["assigned", "pending"]
+
+
+class TestCompleteTaskRoute:
+    """Tests for POST /api/tasks/{task_id}/complete."""
+
+    def test_completing_twice_returns_409(self, client, db):
+        """
+        Test that completing an already completed task returns 409.
+
+        Verifies the transition error reaches the client as a conflict.
+        """
+        db.execute_query.return_value = {"status": "completed"}
+
+        response = client.post(f"/api/tasks/{TASK_ID}/complete", json={"user_id": "alice"})
+
+        assert response.status_code == 409
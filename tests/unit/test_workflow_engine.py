@@ -0,0 +1,205 @@
+"""
+Unit tests for the workflow engine.
+
+Tests the WorkflowEngine class with a mocked database, covering:
+- Dependency tracking, release and dispatch of automated tasks
+- Status transition guards
+- Task completion in one transaction with process advancement
+"""
+
+from unittest.mock import MagicMock, patch
+from uuid import UUID, uuid4
+
+import pytest
+
+from api.orchestrator.workflow_engine import (
+    _FINISHED_PROCESS_STATUSES,
+    _PROCESS_STATUSES_BEFORE,
+    _TASK_STATUSES_BEFORE,
+    InvalidTransitionError,
+    TaskStatus,
+    WorkflowEngine,
+    _statuses_before,
+)
+
+
+@pytest.fixture
+def engine():
+    """WorkflowEngine with a mocked database and dispatcher thread pool."""
+    with patch("api.orchestrator.workflow_engine.get_postgres_client") as mock_get_client:
+        mock_get_client.return_value = MagicMock()
+        workflow_engine = WorkflowEngine()
+
+    workflow_engine._dispatcher.shutdown(wait=False)
+    workflow_engine._dispatcher = MagicMock()
+    return workflow_engine
+
+
+class TestDependencyDispatch:
+    """Tests for the in-memory dependency graph of automated tasks."""
+
+    def test_track_release_dispatch(self, engine):
+        """
+        Test that a waiting task is dispatched once its last predecessor completes.
+
+        Verifies the task is held while any predecessor is unfinished and started
+        by the dispatcher afterwards.
+        """
+        process_id, first, second, task_id = uuid4(), str(uuid4()), str(uuid4()), str(uuid4())
+        engine.db.execute_prepared.return_value = [{"id": first}, {"id": second}]
+
+        engine._track_dependencies(process_id, task_id, "automated", [first, second])
+        engine._release_dependents(process_id, first)
+
+        engine._dispatcher.submit.assert_not_called()
+
+        engine._release_dependents(process_id, second)
+
+        engine._dispatcher.submit.assert_called_once_with(engine._start_ready_task, task_id)
+        assert engine._dag[str(process_id)] == {}
+
+        engine.db.execute_prepared.return_value = {"status": "running"}
+        with patch.object(engine, "start_task") as mock_start:
+            engine._start_ready_task(task_id)
+
+        mock_start.assert_called_once_with(UUID(task_id), "system")
+
+    def test_completed_predecessors_dispatch_immediately(self, engine):
+        """
+        Test that a task whose predecessors are all completed starts at once.
+
+        Verifies nothing is added to the graph.
+        """
+        process_id, task_id = uuid4(), str(uuid4())
+        engine.db.execute_prepared.return_value = []
+
+        engine._track_dependencies(process_id, task_id, "automated", [str(uuid4())])
+
+        engine._dispatcher.submit.assert_called_once_with(engine._start_ready_task, task_id)
+        assert str(process_id) not in engine._dag
+
+    def test_ready_task_in_finished_process_is_skipped(self, engine):
+        """
+        Test that a ready task is not started once its process has left running or pending.
+
+        Verifies cancelled or suspended processes keep their tasks untouched.
+        """
+        engine.db.execute_prepared.return_value = {"status": "cancelled"}
+
+        with patch.object(engine, "start_task") as mock_start:
+            engine._start_ready_task(str(uuid4()))
+
+        mock_start.assert_not_called()
+
+    def test_forget_dependencies_drops_waiting_tasks(self, engine):
+        """
+        Test that finishing a process discards its waiting tasks.
+
+        Verifies a later predecessor completion dispatches nothing.
+        """
+        process_id, predecessor, task_id = uuid4(), str(uuid4()), str(uuid4())
+        engine.db.execute_prepared.return_value = [{"id": predecessor}]
+
+        engine._track_dependencies(process_id, task_id, "automated", [predecessor])
+        engine._forget_dependencies(process_id)
+        engine._release_dependents(process_id, predecessor)
+
+        engine._dispatcher.submit.assert_not_called()
+
+
+class TestStatusTransitions:
+    """Tests for the status guards derived from the transition maps."""
+
+    def test_statuses_before_inverts_transition_map(self):
+        """
+        Test that each target status maps to the statuses that may reach it.
+
+        Verifies values are plain strings, as bound to SQL guards.
+        """
+        transitions = {
+            TaskStatus.PENDING: {TaskStatus.ASSIGNED, TaskStatus.COMPLETED},
+            TaskStatus.ASSIGNED: {TaskStatus.COMPLETED},
+        }
+
+        sources = _statuses_before(transitions)
+
+        assert sources[TaskStatus.ASSIGNED] == ["pending"]
+        assert sorted(sources[TaskStatus.COMPLETED]) == ["assigned", "pending"]
+        assert TaskStatus.PENDING not in sources
+
+    def test_finished_statuses_cannot_be_left(self):
+        """
+        Test that no guard accepts a finished task or process.
+
+        Verifies completed rows are never reopened.
+        """
+        assert all("completed" not in statuses for statuses in _TASK_STATUSES_BEFORE.values())
+        assert all(
+            status.value not in statuses
+            for statuses in _PROCESS_STATUSES_BEFORE.values()
+            for status in _FINISHED_PROCESS_STATUSES
+        )
+
+
+class TestCompleteTask:
+    """Tests for task completion and process advancement."""
+
+    def test_complete_and_advance_share_one_transaction(self, engine):
+        """
+        Test that both completion statements run on the same connection.
+
+        Verifies the task update and the progress recount are one transaction.
+        """
+        task_id, process_id = uuid4(), uuid4()
+        task = {"id": str(task_id), "process_instance_id": str(process_id), "actual_duration_mins": 1}
+        engine.db.execute_prepared.side_effect = [task, {"process_transition": None}]
+
+        with patch.object(engine, "_evaluate_transitions"), patch.object(engine, "_release_dependents") as release:
+            assert engine.complete_task(task_id, "alice") == task
+
+        conn = engine.db.get_connection.return_value.__enter__.return_value
+        names = [call.args[0] for call in engine.db.execute_prepared.call_args_list]
+        assert names == ["workflow_complete_task", "workflow_advance_process"]
+        assert all(call.kwargs["conn"] is conn for call in engine.db.execute_prepared.call_args_list)
+        release.assert_called_once_with(str(process_id), task_id)
+
+    def test_process_transition_logs_event_and_forgets_dependencies(self, engine):
+        """
+        Test that completing the last task finishes the process.
+
+        Verifies the process event is queued and its dependency graph dropped.
+        """
+        task_id, process_id = uuid4(), uuid4()
+        task = {"id": str(task_id), "process_instance_id": str(process_id), "actual_duration_mins": 1}
+        engine.db.execute_prepared.side_effect = [
+            task,
+            {"process_transition": "completed", "failed_tasks": 0, "previous_process_status": "running"},
+        ]
+
+        with (
+            patch.object(engine, "_evaluate_transitions"),
+            patch.object(engine, "_forget_dependencies") as forget,
+            patch.object(engine, "_release_dependents") as release,
+            patch.object(engine, "_log_event") as log_event,
+        ):
+            engine.complete_task(task_id, "alice")
+
+        forget.assert_called_once_with(str(process_id))
+        release.assert_not_called()
+        event = log_event.call_args_list[-1].kwargs
+        assert event["event_type"] == "process_completed"
+        assert (event["old_status"], event["new_status"]) == ("running", "completed")
+
+    def test_rejected_completion_skips_process_update(self, engine):
+        """
+        Test that a task that cannot be completed does not touch its process.
+
+        Verifies the rejection is reported as an invalid transition.
+        """
+        engine.db.execute_prepared.return_value = None
+        engine.db.execute_query.return_value = {"status": "completed"}
+
+        with pytest.raises(InvalidTransitionError):
+            engine.complete_task(uuid4(), "alice")
+
+        assert engine.db.execute_prepared.call_count == 1